@@ -0,0 +1,141 @@
+"""
+列表转换基准：OpenAPI 模型路径 vs 原始 JSON 快速路径，字典 vs PodRecord
+
+在合成的 Pod 列表上比较把 list 响应体转换为 gpuctl 行数据的耗时，
+以及结果常驻内存的大小，无需连接集群::
+
+    python benchmarks/bench_list_conversion.py --pods 10000 --repeat 3
+"""
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from kubernetes import client as k8s_client  # noqa: E402
+
+from gpuctl.client import raw_json  # noqa: E402
+from gpuctl.client.job_client import JobClient  # noqa: E402
+from gpuctl.client.records import PodRecord  # noqa: E402
+
+
+class _Response:
+    """模拟 urllib3 响应，供 ApiClient.deserialize 读取"""
+
+    def __init__(self, data: bytes):
+        self.data = data
+
+
+def make_pod_list(count: int) -> bytes:
+    """生成与 apiserver 返回格式一致的 PodList 响应体"""
+    items = []
+    for i in range(count):
+        name = f"train-{i // 4}-{i}"
+        items.append({
+            "metadata": {
+                "name": name,
+                "namespace": f"team-{i % 20}",
+                "uid": f"00000000-0000-0000-0000-{i:012d}",
+                "resourceVersion": str(1000 + i),
+                "creationTimestamp": "2024-01-02T03:04:05Z",
+                "labels": {
+                    "runwhere.ai/job-type": "training",
+                    "runwhere.ai/pool": "gpu-pool",
+                    "job-name": f"train-{i // 4}",
+                },
+                "annotations": {"runwhere.ai/description": "synthetic"},
+            },
+            "spec": {
+                "nodeName": f"node-{i % 256}",
+                "containers": [{
+                    "name": "main",
+                    "image": "pytorch/pytorch:2.1.0-cuda12.1-cudnn8-runtime",
+                    "command": ["python"],
+                    "args": ["train.py", "--epochs", "10"],
+                    "env": [{"name": "EPOCHS", "value": "10"}, {"name": "LR", "value": "0.001"}],
+                    "resources": {
+                        "limits": {"nvidia.com/gpu": "1", "cpu": "8", "memory": "32Gi"},
+                        "requests": {"nvidia.com/gpu": "1", "cpu": "8", "memory": "32Gi"},
+                    },
+                    "ports": [{"containerPort": 8080, "protocol": "TCP"}],
+                }],
+            },
+            "status": {
+                "phase": "Running",
+                "podIP": f"10.0.{i // 256 % 256}.{i % 256}",
+                "startTime": "2024-01-02T03:04:06Z",
+                "conditions": [
+                    {"type": "Ready", "status": "True", "lastTransitionTime": "2024-01-02T03:05:00Z"},
+                    {"type": "PodScheduled", "status": "True", "lastTransitionTime": "2024-01-02T03:04:05Z"},
+                ],
+                "containerStatuses": [{
+                    "name": "main", "ready": True, "restartCount": 0, "started": True,
+                    "image": "pytorch/pytorch:2.1.0-cuda12.1-cudnn8-runtime", "imageID": "sha256:abc",
+                    "state": {"running": {"startedAt": "2024-01-02T03:04:30Z"}},
+                }],
+            },
+        })
+    return json.dumps({"kind": "PodList", "apiVersion": "v1",
+                       "metadata": {"resourceVersion": "99999"}, "items": items}).encode()
+
+
+def model_path(job_client: JobClient, api_client: k8s_client.ApiClient, body: bytes):
+    pods = api_client.deserialize(_Response(body), "V1PodList")
+    return [job_client._pod_to_dict(pod) for pod in pods.items]
+
+
+def raw_path(job_client: JobClient, body: bytes):
+    return [job_client._raw_pod_to_dict(pod) for pod in raw_json.loads(body)["items"]]
+
+
+def record_path(job_client: JobClient, body: bytes):
+    return [PodRecord.from_dict(job_client._raw_pod_to_dict(pod)) for pod in raw_json.loads(body)["items"]]
+
+
+def retained_mib(func, *args) -> float:
+    """结果列表常驻的内存（MiB）"""
+    tracemalloc.start()
+    result = func(*args)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return size / 1024 / 1024
+
+
+def best_of(repeat: int, func, *args) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pods", type=int, default=10000, help="合成 Pod 数量")
+    parser.add_argument("--repeat", type=int, default=3, help="重复次数（取最快一次）")
+    args = parser.parse_args()
+
+    body = make_pod_list(args.pods)
+    job_client = JobClient.__new__(JobClient)
+    api_client = k8s_client.ApiClient()
+
+    model_seconds = best_of(args.repeat, model_path, job_client, api_client, body)
+    raw_seconds = best_of(args.repeat, raw_path, job_client, body)
+    record_seconds = best_of(args.repeat, record_path, job_client, body)
+
+    parser_name = "orjson" if raw_json.orjson is not None else "json"
+    print(f"pods={args.pods} body={len(body) / 1024 / 1024:.1f}MiB parser={parser_name}")
+    print(f"model path : {model_seconds * 1000:8.1f} ms")
+    print(f"raw path   : {raw_seconds * 1000:8.1f} ms  ({model_seconds / raw_seconds:.1f}x faster)")
+    print(f"records    : {record_seconds * 1000:8.1f} ms  ({model_seconds / record_seconds:.1f}x faster)")
+    print(f"retained   : model dicts {retained_mib(model_path, job_client, api_client, body):.1f} MiB, "
+          f"records {retained_mib(record_path, job_client, body):.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,13 +4,13 @@ from gpuctl.kind.training_kind import TrainingKind
 from gpuctl.kind.inference_kind import InferenceKind
 from gpuctl.kind.notebook_kind import NotebookKind
 from gpuctl.client.job_client import JobClient
-from gpuctl.client.log_client import LogClient
+from gpuctl.client.log_client import LogClient, LogStream
 from gpuctl.constants import (
     Kind, JOB_KINDS, NON_JOB_KINDS, KINDS_WITH_SERVICE,
     Labels, PHASE_TO_STATUS, DEFAULT_NAMESPACE, DEFAULT_POOL,
     K8sResourceType, KIND_TO_RESOURCE, infer_resource_type,
     Priority, DEFAULT_PRIORITY,
-    svc_name, get_detailed_status,
+    svc_name,
 )
 
 
@@ -68,6 +68,7 @@ def create_job_command(args):
     try:
         import json
         all_results = []
+        has_failures = False
         
         # 自动初始化优先级类，确保所有所需的PriorityClass存在
         from gpuctl.client.priority_client import PriorityClient
@@ -96,13 +97,16 @@ def create_job_command(args):
             # 2. Use CLI-specified namespace if no YAML namespace
             final_namespace = yaml_namespace or args.namespace
             
-            # Check if namespace exists (except for quota and pool/resource kinds)
+            # Check namespace existence and quota with one read (except for quota and pool/resource kinds);
+            # a positive result is cached, so the per-resource checks at creation time hit no API
             if parsed_obj.kind not in NON_JOB_KINDS:
-                from gpuctl.client.base_client import KubernetesClient
-                k8s_client = KubernetesClient()
+                from gpuctl.client.quota_client import QuotaClient
+                quota_client = QuotaClient()
                 try:
-                    k8s_client.core_v1.read_namespace(final_namespace)
-                except Exception as e:
+                    namespace_exists, has_quota = quota_client.check_namespace(final_namespace)
+                except Exception:
+                    namespace_exists, has_quota = False, False
+                if not namespace_exists:
                     error = {"error": f"Namespace '{final_namespace}' does not exist. Please create the namespace first."}
                     file_result["results"].append(error)
                     if args.json:
@@ -111,12 +115,7 @@ def create_job_command(args):
                     else:
                         print(f"❌ Namespace '{final_namespace}' does not exist. Please create the namespace first.")
                     return 1
-            
-            # Check if namespace has quota configured (except for quota and pool/resource kinds)
-            if parsed_obj.kind not in NON_JOB_KINDS:
-                from gpuctl.client.quota_client import QuotaClient
-                quota_client = QuotaClient()
-                if not quota_client.namespace_has_quota(final_namespace):
+                if not has_quota:
                     error = {"error": f"Namespace '{final_namespace}' does not have quota configured. Please create quota for this namespace first."}
                     file_result["results"].append(error)
                     if args.json:
@@ -184,10 +183,11 @@ def create_job_command(args):
                 job_name = getattr(parsed_obj.job, 'name', None)
                 if job_name:
                     try:
-                        existing_jobs = JobClient().list_jobs(final_namespace, labels={}, include_pods=False)
+                        # 只取元数据并按名称过滤，不下载已有作业的 spec/status
+                        existing_jobs = JobClient().list_job_metadata(final_namespace, name=job_name)
                         for ej in existing_jobs:
-                            if ej['name'] == job_name:
-                                ej_kind = ej.get('labels', {}).get(Labels.JOB_TYPE, 'unknown')
+                            if ej.name == job_name:
+                                ej_kind = ej.labels.get(Labels.JOB_TYPE, 'unknown')
                                 error_msg = (
                                     f"Job '{job_name}' already exists in namespace '{final_namespace}' "
                                     f"(kind: {ej_kind}). "
@@ -417,6 +417,7 @@ def create_job_command(args):
             elif parsed_obj.kind in ("pool", "resource"):
                 # Resource pool creation logic
                 from gpuctl.client.pool_client import PoolClient
+                from gpuctl.cli.pool import print_failed_nodes
                 client = PoolClient()
                 
                 # Build nodes config as a dictionary with gpuType information
@@ -434,11 +435,16 @@ def create_job_command(args):
                 # Create resource pool
                 result = client.create_pool(pool_config)
                 file_result["results"].append(result)
+                has_failures = has_failures or bool(result["failed"])
                 if not args.json:
-                    print(f"✅ Successfully created resource pool: {result['name']}")
+                    if result["failed"]:
+                        print(f"❌ Failed to create resource pool: {result['name']}")
+                    else:
+                        print(f"✅ Successfully created resource pool: {result['name']}")
                     print(f"📊 Description: {parsed_obj.pool.description}")
                     print(f"📦 Node count: {len(parsed_obj.nodes)}")
                     print(f"📋 Status: {result['status']}")
+                    print_failed_nodes(result)
             elif parsed_obj.kind == "quota":
                 from gpuctl.cli.quota import create_quota_command
                 import argparse
@@ -456,7 +462,7 @@ def create_job_command(args):
         if args.json:
             print(json.dumps(all_results, indent=2))
 
-        return 0
+        return 1 if has_failures else 0
     except ParserError as e:
         error = {"error": f"Parser error: {str(e)}"}
         if args.json:
@@ -488,6 +494,7 @@ def apply_job_command(args):
     try:
         import json
         all_results = []
+        has_failures = False
         
         for file_path in args.file:
             if not args.json:
@@ -504,13 +511,16 @@ def apply_job_command(args):
             yaml_namespace = getattr(parsed_obj, 'job', None) and getattr(parsed_obj.job, 'namespace', None)
             final_namespace = yaml_namespace or args.namespace
             
-            # Check if namespace exists (except for quota and pool/resource kinds)
+            # Check namespace existence and quota with one read (except for quota and pool/resource kinds);
+            # a positive result is cached, so the per-resource checks at creation time hit no API
             if parsed_obj.kind not in NON_JOB_KINDS:
-                from gpuctl.client.base_client import KubernetesClient
-                k8s_client = KubernetesClient()
+                from gpuctl.client.quota_client import QuotaClient
+                quota_client = QuotaClient()
                 try:
-                    k8s_client.core_v1.read_namespace(final_namespace)
-                except Exception as e:
+                    namespace_exists, has_quota = quota_client.check_namespace(final_namespace)
+                except Exception:
+                    namespace_exists, has_quota = False, False
+                if not namespace_exists:
                     error = {"error": f"Namespace '{final_namespace}' does not exist. Please create the namespace first."}
                     file_result["results"].append(error)
                     if args.json:
@@ -519,11 +529,7 @@ def apply_job_command(args):
                     else:
                         print(f"❌ Namespace '{final_namespace}' does not exist. Please create the namespace first.")
                     return 1
-            
-            if parsed_obj.kind not in NON_JOB_KINDS:
-                from gpuctl.client.quota_client import QuotaClient
-                quota_client = QuotaClient()
-                if not quota_client.namespace_has_quota(final_namespace):
+                if not has_quota:
                     error = {"error": f"Namespace '{final_namespace}' does not have quota configured. Please create quota for this namespace first."}
                     file_result["results"].append(error)
                     if args.json:
@@ -647,6 +653,7 @@ def apply_job_command(args):
                     
             elif parsed_obj.kind in ("pool", "resource"):
                 from gpuctl.client.pool_client import PoolClient
+                from gpuctl.cli.pool import print_failed_nodes
                 client = PoolClient()
                 
                 existing = client.get_pool(parsed_obj.pool.name)
@@ -675,10 +682,12 @@ def apply_job_command(args):
                 
                 result["action"] = action
                 file_result["results"].append(result)
+                has_failures = has_failures or bool(result["failed"])
                 if not args.json:
                     print(f"📊 Description: {parsed_obj.pool.description}")
                     print(f"📦 Node count: {len(parsed_obj.nodes)}")
                     print(f"📋 Status: {result['status']}")
+                    print_failed_nodes(result)
                 
             elif parsed_obj.kind == "quota":
                 from gpuctl.cli.quota import apply_quota_command as quota_apply
@@ -698,7 +707,7 @@ def apply_job_command(args):
         if args.json:
             print(json.dumps(all_results, indent=2))
 
-        return 0
+        return 1 if has_failures else 0
     except ParserError as e:
         error = {"error": f"Parser error: {str(e)}"}
         if args.json:
@@ -805,26 +814,9 @@ def get_jobs_command(args):
             job_namespace = job.get('namespace', DEFAULT_NAMESPACE)
             status_dict = job.get("status", {})
             
+            # 展示状态（含容器 waiting/terminated 原因）已在 PodRecord 中计算
             status = status_dict.get("phase", "Unknown")
-            status = PHASE_TO_STATUS.get(status, status)
-            
-            container_statuses = status_dict.get("container_statuses", [])
-            if container_statuses:
-                for cs in container_statuses:
-                    if hasattr(cs, 'state') and cs.state:
-                        if hasattr(cs.state, 'waiting') and cs.state.waiting:
-                            waiting_reason = cs.state.waiting.reason
-                            waiting_message = cs.state.waiting.message or ""
-                            status = get_detailed_status(waiting_reason, waiting_message)
-                            break
-                        if hasattr(cs.state, 'terminated') and cs.state.terminated:
-                            terminated_reason = cs.state.terminated.reason
-                            if terminated_reason == "OOMKilled":
-                                status = "OOMKilled"
-                                break
-                            elif terminated_reason == "Error":
-                                status = "Error"
-                                break
+            status = status_dict.get("display_status") or PHASE_TO_STATUS.get(status, status)
             
             # For get jobs command, keep the original phase status to match kubectl output
             # Only describe command should show detailed status like Unschedulable
@@ -840,15 +832,8 @@ def get_jobs_command(args):
             node_name = job.get('spec', {}).get('node_name') or 'N/A'
             pod_ip = job.get('status', {}).get('pod_ip') or 'N/A'
             
-            # 计算 READY 状态 (ready_containers/total_containers)
-            container_statuses = status_dict.get("container_statuses", [])
-            total_containers = len(container_statuses)
-            ready_containers = 0
-            if container_statuses:
-                for cs in container_statuses:
-                    if hasattr(cs, 'ready') and cs.ready:
-                        ready_containers += 1
-            ready_str = f"{ready_containers}/{total_containers}" if total_containers > 0 else "0/0"
+            # READY 状态 (ready_containers/total_containers)
+            ready_str = f"{status_dict.get('ready_containers', 0)}/{status_dict.get('total_containers', 0)}"
             
             processed_jobs.append({
                 'job_id': simplified_name,  # 使用去除前缀的完整 Pod 名称作为 Job ID
@@ -1109,158 +1094,90 @@ def delete_job_command(args):
         return 1
 
 
+def _merged_logs_command(args):
+    """Print or follow the merged logs of all pods of a job"""
+    import json
+    log_client = LogClient()
+    no_logs = f"No logs available for {args.job_name}. The Pods might be starting up or have no log output."
+
+    if args.follow:
+        try:
+            has_logs = False
+            for log in log_client.stream_job_logs(args.job_name, namespace=args.namespace, all_pods=True):
+                if log == "No pods found for this job":
+                    break
+                print(log, flush=True)
+                has_logs = True
+            if not has_logs:
+                if args.json:
+                    print(json.dumps({"message": no_logs}, indent=2))
+                else:
+                    print(f"ℹ️  {no_logs}")
+        except KeyboardInterrupt:
+            if args.json:
+                print(json.dumps({"message": "Log streaming stopped by user"}, indent=2))
+            else:
+                print(f"\n👋 Log streaming stopped by user")
+        return 0
+
+    logs = log_client.get_job_logs(args.job_name, namespace=args.namespace, tail=100, all_pods=True)
+    if not logs or logs == ["No pods found for this job"]:
+        if args.json:
+            print(json.dumps({"error": f"No pods found for job: {args.job_name}"}, indent=2))
+        else:
+            print(f"❌ No pods found for job: {args.job_name}")
+        return 1
+    if args.json:
+        print(json.dumps({"logs": logs, "job_name": args.job_name}, indent=2))
+    else:
+        for log in logs:
+            print(log)
+    return 0
+
+
 def logs_job_command(args):
     """Get job logs command"""
     try:
-        # Get the actual pod name from deployment/replicaset
         job_name = args.job_name
         namespace = args.namespace
-        
-        # Check if the specified namespace exists
-        def namespace_exists(ns):
-            """Check if the specified namespace exists"""
-            try:
-                from gpuctl.client.base_client import KubernetesClient
-                k8s_client = KubernetesClient()
-                # Try to get the namespace directly
-                k8s_client.core_v1.read_namespace(ns)
-                return True
-            except Exception as e:
-                # Check if the error is about namespace not existing
-                error_msg = str(e).lower()
-                if "namespace not found" in error_msg or "namespaces \"" + ns + "\" not found" in error_msg or "not found" in error_msg:
-                    return False
-                # For other errors, assume namespace exists
-                return True
-        
-        # Check if the specified namespace exists
-        if not namespace_exists(namespace):
+        log_client = LogClient()
+
+        def namespace_not_found():
             if args.json:
                 import json
                 print(json.dumps({"error": f"Namespace '{namespace}' not found"}, indent=2))
             else:
                 print(f"❌ Namespace '{namespace}' not found")
             return 1
-        
-        # First, try to use the provided name as a direct Pod name
-        def try_direct_pod(ns):
-            """Try to use the provided name as a direct Pod name"""
-            try:
-                from gpuctl.client.job_client import JobClient
-                job_client = JobClient()
-                
-                # Get all pods in the namespace with the exact name
-                try:
-                    pods = job_client.list_pods(ns)
-                    for pod in pods:
-                        if pod.get('name') == job_name:
-                            return pod, ns
-                except FileNotFoundError:
-                    # No pods found in this namespace, which is expected
-                    pass
-                except Exception as e:
-                    # Ignore other errors (e.g., permission denied)
-                    pass
-                return None, None
-            except Exception as e:
-                return None, None
-        
-        # Extract base job name from full pod name
-        # Format: base-name-deployment-hash-pod-suffix -> base-name
-        base_job_name = job_name
-        parts = job_name.split("-")
-        if len(parts) >= 3:
-            third_part = parts[2] if len(parts) >= 3 else ''
-            if third_part.isalnum() and len(third_part) >= 5:
-                base_job_name = '-'.join(parts[:2])
-        
-        # Helper function to get pod in a specific namespace using label
-        def get_pod_by_label(ns):
-            """Try to get pod in the specified namespace using label"""
-            try:
-                from gpuctl.client.job_client import JobClient
-                job_client = JobClient()
-                
-                # Get all pods in the namespace with the matching label
-                pods = job_client.list_pods(ns, labels={"app": base_job_name})
-                
-                # Get first running pod
-                running_pod = None
-                for pod in pods:
-                    if pod.get('status', {}).get('phase') == 'Running':
-                        running_pod = pod
-                        break
-                
-                if not running_pod:
-                    # If no running pod, get the first pending pod
-                    for pod in pods:
-                        running_pod = pod
-                        break
-                
-                if running_pod:
-                    return running_pod, ns
-                
-                return None, None
-            except Exception as e:
-                # Ignore errors for now, we'll try other namespaces
-                return None, None
-        
-        # Try to get pod
-        running_pod = None
-        actual_namespace = None
-        
-        # 1. First try direct pod name in specified namespace
-        running_pod, actual_namespace = try_direct_pod(namespace)
-        
-        if not running_pod:
-            # 2. If not found, try by label in specified namespace
-            running_pod, actual_namespace = get_pod_by_label(namespace)
-        
-        if not running_pod:
-            # 3. If not found, get all gpuctl-managed namespaces and try each one
-            try:
-                from gpuctl.client.job_client import JobClient
-                job_client = JobClient()
-                gpuctl_namespaces = job_client._get_all_gpuctl_namespaces()
-                
-                for ns in gpuctl_namespaces:
-                    if ns == namespace:
-                        continue  # Skip the namespace we already tried
-                    
-                    # Try direct pod name first
-                    running_pod, actual_namespace = try_direct_pod(ns)
-                    if running_pod:
-                        break
-                    
-                    # If not found, try by label
-                    running_pod, actual_namespace = get_pod_by_label(ns)
-                    if running_pod:
-                        break
-            except Exception as e:
-                pass
-        
-        if not running_pod:
+
+        if getattr(args, 'all_pods', False):
+            if not log_client.namespace_exists(namespace):
+                return namespace_not_found()
+            return _merged_logs_command(args)
+
+        # Read the pod by name, then look the job's pods up by label; the namespace
+        # is only read when neither matches, and other namespaces are searched last
+        try:
+            target = log_client.locate_log_pod(job_name, namespace)
+        except FileNotFoundError:
+            return namespace_not_found()
+
+        if not target:
             if args.json:
                 import json
                 print(json.dumps({"error": f"No pods found for job: {args.job_name}"}, indent=2))
             else:
                 print(f"❌ No pods found for job: {args.job_name}")
             return 1
-        
-        actual_pod_name = running_pod['name']
-        
-        log_client = LogClient()
-        
+
+        actual_namespace, actual_pod_name = target
+
         if args.follow:
-            # Use streaming logs, continuously fetch
+            # Follow the located pod directly instead of locating it again
             try:
-                logs = log_client.stream_job_logs(actual_pod_name, namespace=actual_namespace, pod_name=actual_pod_name)
                 has_logs = False
-                for log in logs:
-                    if log == "No pods found for this job":
-                        # We already know the pod exists, so ignore this message
-                        continue
-                    print(log)
+                for _, log in LogStream(log_client, [target], {}, tail=None):
+                    print(log, flush=True)
                     has_logs = True
                 if not has_logs:
                     if args.json:
@@ -130,6 +130,8 @@ def main():
                              help='Kubernetes namespace')
     logs_parser.add_argument('-f', '--follow', action='store_true',
                              help='Follow log output')
+    logs_parser.add_argument('--all-pods', action='store_true',
+                             help='Merge logs of all pods of the job, prefixed with the pod name')
     logs_parser.add_argument('--json', action='store_true', help='Output in JSON format')
 
     # label command
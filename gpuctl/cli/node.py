@@ -200,70 +200,58 @@ def label_node_command(args):
             # Add runwhere.ai/ prefix
             return f"runwhere.ai/{kebab_key}"
         
-        for node_name in args.node_name:
-            if args.delete:
-                # Remove label
-                if args.label:
-                    raw_key = args.label.split('=')[0] if '=' in args.label else args.label
-                    processed_key = process_label_key(raw_key)
-                    client._remove_node_label(node_name, processed_key)
-                    result = {
-                        "node": node_name,
-                        "operation": "delete",
-                        "label": processed_key,
-                        "success": True,
-                        "message": f"Successfully removed label {processed_key} from node {node_name}"
-                    }
-                    results.append(result)
-                    if not args.json:
-                        print(f"✅ Successfully removed label {processed_key} from node {node_name}")
+        # Parse label argument
+        if args.delete:
+            if not args.label:
+                error = "Must specify label to delete"
+                if args.json:
+                    import json
+                    print(json.dumps({"error": error}, indent=2))
                 else:
-                    error = "Must specify label to delete"
-                    if args.json:
-                        import json
-                        print(json.dumps({"error": error}, indent=2))
-                    else:
-                        print(f"❌ {error}")
-                    return 1
-            else:
-                # Add or update label
-                if args.label:
-                    if '=' not in args.label:
-                        error = "Must specify label in key=value format"
-                        if args.json:
-                            import json
-                            print(json.dumps({"error": error}, indent=2))
-                        else:
-                            print(f"❌ {error}")
-                        return 1
-                    
-                    raw_key, value = args.label.split('=', 1)
-                    processed_key = process_label_key(raw_key)
-                    client._label_node(node_name, processed_key, value)
-                    result = {
-                        "node": node_name,
-                        "operation": "add",
-                        "label": {processed_key: value},
-                        "success": True,
-                        "message": f"Successfully labeled node {node_name} with {processed_key}={value}"
-                    }
-                    results.append(result)
-                    if not args.json:
-                        print(f"✅ Successfully labeled node {node_name} with {processed_key}={value}")
+                    print(f"❌ {error}")
+                return 1
+            raw_key = args.label.split('=')[0] if '=' in args.label else args.label
+            processed_key = process_label_key(raw_key)
+            labels = {processed_key: None}
+        else:
+            if not args.label or '=' not in args.label:
+                error = "Must specify label in key=value format"
+                if args.json:
+                    import json
+                    print(json.dumps({"error": error}, indent=2))
                 else:
-                    error = "Must specify label in key=value format"
-                    if args.json:
-                        import json
-                        print(json.dumps({"error": error}, indent=2))
-                    else:
-                        print(f"❌ {error}")
-                    return 1
-        
+                    print(f"❌ {error}")
+                return 1
+            raw_key, value = args.label.split('=', 1)
+            processed_key = process_label_key(raw_key)
+            labels = {processed_key: value}
+
+        # Check conflicts against one node snapshot, then patch all nodes concurrently
+        batch = client.label_nodes(args.node_name, labels, overwrite=getattr(args, 'overwrite', False))
+        errors = {item["node"]: item["error"] for item in batch["failed"]}
+
+        for node_name in args.node_name:
+            if node_name in errors:
+                message = f"Failed to label node {node_name}: {errors[node_name]}"
+            elif args.delete:
+                message = f"Successfully removed label {processed_key} from node {node_name}"
+            else:
+                message = f"Successfully labeled node {node_name} with {processed_key}={value}"
+            results.append({
+                "node": node_name,
+                "operation": "delete" if args.delete else "add",
+                "label": processed_key if args.delete else {processed_key: value},
+                "success": node_name not in errors,
+                "message": message
+            })
+            if not args.json:
+                print(f"{'❌' if node_name in errors else '✅'} {message}")
+
         if args.json:
             import json
             print(json.dumps(results, indent=2))
         
-        return 0
+        return 1 if errors else 0
     except Exception as e:
         if args.json:
             import json
@@ -50,6 +50,12 @@ def get_pools_command(args):
         return 1
 
 
+def print_failed_nodes(result):
+    """Print the nodes whose pool labels could not be applied"""
+    for item in result.get("failed", []):
+        print(f"❌ Failed to label node {item['node']}: {item['error']}")
+
+
 def create_pool_command(args):
     """Create resource pool command"""
     try:
@@ -68,13 +74,17 @@ def create_pool_command(args):
         if args.json:
             import json
             print(json.dumps(result, indent=2))
-            return 0
+            return 1 if result["failed"] else 0
         
-        print(f"✅ Successfully created pool: {result['name']}")
+        if result["failed"]:
+            print(f"❌ Failed to create pool: {result['name']}")
+        else:
+            print(f"✅ Successfully created pool: {result['name']}")
         print(f"📊 Status: {result['status']}")
         print(f"📦 Message: {result['message']}")
+        print_failed_nodes(result)
         
-        return 0
+        return 1 if result["failed"] else 0
     except Exception as e:
         if args.json:
             import json
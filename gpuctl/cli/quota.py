@@ -3,6 +3,47 @@ from gpuctl.client.quota_client import QuotaClient
 from gpuctl.constants import Labels, NS_LABEL_SELECTOR
 
 
+def _build_quota_config(parsed_obj):
+    """Build the QuotaClient quota config from a parsed quota YAML"""
+    quota_config = {
+        "name": parsed_obj.quota.name,
+        "description": parsed_obj.quota.description,
+        "namespace": {}
+    }
+
+    if parsed_obj.default:
+        quota_config["default"] = {
+            "cpu": parsed_obj.default.get_cpu_str(),
+            "memory": parsed_obj.default.memory,
+            "gpu": parsed_obj.default.get_gpu_str()
+        }
+
+    for namespace_name, namespace_quota in (parsed_obj.namespace or {}).items():
+        quota_config["namespace"][namespace_name] = {
+            "cpu": namespace_quota.get_cpu_str(),
+            "memory": namespace_quota.memory,
+            "gpu": namespace_quota.get_gpu_str()
+        }
+
+    return quota_config
+
+
+def _print_quota_config_result(result):
+    """Print created/updated/unchanged/failed namespaces of a quota config"""
+    for created in result["created"]:
+        print(f"✅ Created quota for namespace: {created['namespace']}")
+        print(f"   CPU: {created['cpu']}, Memory: {created['memory']}, GPU: {created['gpu']}")
+    for updated in result["updated"]:
+        print(f"🔄 Updated quota for namespace: {updated['namespace']}")
+        print(f"   CPU: {updated['cpu']}, Memory: {updated['memory']}, GPU: {updated['gpu']}")
+    for unchanged in result["unchanged"]:
+        print(f"⏸️  Unchanged quota for namespace: {unchanged['namespace']}")
+    for failed in result["failed"]:
+        print(f"❌ Failed for namespace: {failed['namespace']}, Error: {failed['error']}")
+    print(f"\n📊 Summary: {len(result['created'])} created, {len(result['updated'])} updated, "
+          f"{len(result['unchanged'])} unchanged, {len(result['failed'])} failed")
+
+
 def create_quota_command(args):
     """Create resource quota command"""
     try:
@@ -10,6 +51,7 @@ def create_quota_command(args):
 
         file_list = args.file if isinstance(args.file, list) else [args.file]
         all_results = []
+        has_failures = False
 
         for file_path in file_list:
             if not args.json:
@@ -26,36 +68,12 @@ def create_quota_command(args):
                         print(f"❌ Unsupported kind: {parsed_obj.kind}")
                     continue
 
-                quota_config = {
-                    "name": parsed_obj.quota.name,
-                    "description": parsed_obj.quota.description,
-                    "namespace": {}
-                }
-
-                if parsed_obj.default:
-                    quota_config["default"] = {
-                        "cpu": parsed_obj.default.get_cpu_str(),
-                        "memory": parsed_obj.default.memory,
-                        "gpu": parsed_obj.default.get_gpu_str()
-                    }
-
-                for namespace_name, namespace_quota in parsed_obj.namespace.items():
-                    quota_config["namespace"][namespace_name] = {
-                        "cpu": namespace_quota.get_cpu_str(),
-                        "memory": namespace_quota.memory,
-                        "gpu": namespace_quota.get_gpu_str()
-                    }
-
-                results = client.create_quota_config(quota_config)
-                all_results.extend(results)
-
-                for result in results:
-                    if not args.json:
-                        print(f"✅ Successfully created quota for namespace: {result['namespace']}")
-                        print(f"   Namespace: {result['namespace']}")
-                        print(f"   CPU: {result['cpu']}")
-                        print(f"   Memory: {result['memory']}")
-                        print(f"   GPU: {result['gpu']}")
+                result = client.create_quota_config(_build_quota_config(parsed_obj))
+                all_results.append(dict(result, file=file_path))
+                if result["failed"]:
+                    has_failures = True
+                if not args.json:
+                    _print_quota_config_result(result)
 
             except ParserError as e:
                 error = {"error": f"Parser error: {str(e)}", "file": file_path}
@@ -74,7 +92,7 @@ def create_quota_command(args):
             import json
             print(json.dumps(all_results, indent=2))
 
-        return 0
+        return 1 if has_failures else 0
     except Exception as e:
         if args.json:
             import json
@@ -100,6 +118,7 @@ def apply_quota_command(args):
 
         file_list = args.file if isinstance(args.file, list) else [args.file]
         all_results = []
+        has_failures = False
 
         for file_path in file_list:
             if not args.json:
@@ -116,64 +135,12 @@ def apply_quota_command(args):
                         print(f"❌ Unsupported kind: {parsed_obj.kind}")
                     continue
 
-                quota_name = parsed_obj.quota.name
-                namespaces = parsed_obj.namespace or {}
-                default_quota = parsed_obj.default
-
-                file_results = {
-                    "file": file_path,
-                    "quota_name": quota_name,
-                    "results": [],
-                    "summary": {
-                        "created": 0,
-                        "updated": 0
-                    }
-                }
-
-                if default_quota:
-                    result = client.apply_default_quota(
-                        quota_name=quota_name,
-                        cpu=str(default_quota.get_cpu_str()) if default_quota.get_cpu_str() else None,
-                        memory=default_quota.memory,
-                        gpu=str(default_quota.get_gpu_str()) if default_quota.get_gpu_str() else None
-                    )
-                    file_results["results"].append(result)
-                    if result['status'] == 'created':
-                        file_results["summary"]["created"] += 1
-                        if not args.json:
-                            print(f"✅ Created default quota in namespace 'default'")
-                    elif result['status'] == 'updated':
-                        file_results["summary"]["updated"] += 1
-                        if not args.json:
-                            print(f"🔄 Updated default quota in namespace 'default'")
-                    if not args.json:
-                        print(f"   CPU: {result['cpu']}, Memory: {result['memory']}, GPU: {result['gpu']}")
-
-                for namespace_name, namespace_quota in namespaces.items():
-                    if namespace_name == "default":
-                        continue
-                    result = client.apply_quota(
-                        quota_name=quota_name,
-                        namespace_name=namespace_name,
-                        cpu=namespace_quota.get_cpu_str() if namespace_quota.get_cpu_str() else None,
-                        memory=namespace_quota.memory,
-                        gpu=namespace_quota.get_gpu_str() if namespace_quota.get_gpu_str() else None
-                    )
-                    file_results["results"].append(result)
-                    if result['status'] == 'created':
-                        file_results["summary"]["created"] += 1
-                        if not args.json:
-                            print(f"✅ Created quota for namespace: {namespace_name}")
-                    elif result['status'] == 'updated':
-                        file_results["summary"]["updated"] += 1
-                        if not args.json:
-                            print(f"🔄 Updated quota for namespace: {namespace_name}")
-                    if not args.json:
-                        print(f"   Namespace: {result['namespace']}, CPU: {result['cpu']}, Memory: {result['memory']}, GPU: {result['gpu']}")
-
-                all_results.append(file_results)
+                result = client.apply_quota_config(_build_quota_config(parsed_obj), skip_unchanged=True)
+                all_results.append(dict(result, file=file_path))
+                if result["failed"]:
+                    has_failures = True
                 if not args.json:
-                    print(f"\n📊 Summary: {file_results['summary']['created']} created, {file_results['summary']['updated']} updated")
+                    _print_quota_config_result(result)
 
             except ParserError as e:
                 error = {"error": f"Parser error: {str(e)}", "file": file_path}
@@ -190,7 +157,7 @@ def apply_quota_command(args):
             import json
             print(json.dumps(all_results, indent=2))
 
-        return 0
+        return 1 if has_failures else 0
     except Exception as e:
         if args.json:
             import json
@@ -0,0 +1,235 @@
+import logging
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from kubernetes.client.rest import ApiException
+from kubernetes.utils.quantity import parse_quantity
+
+from .base_client import KubernetesClient
+from .informer import Informer
+from .raw_json import RawObject, list_raw
+from gpuctl.constants import Labels, ACTIVE_POD_FIELD_SELECTOR
+
+
+logger = logging.getLogger(__name__)
+
+# 未启动 watch 时快照的有效期（秒），过期后按需重新同步
+SNAPSHOT_TTL_SECONDS = 30
+
+# 计入节点占用的 Pod 阶段
+_ALLOCATED_PHASES = ("Running", "Pending")
+
+
+def _quantity(value: Any, scale: int = 1) -> int:
+    try:
+        return int(parse_quantity(value) * scale)
+    except (ValueError, TypeError):
+        return 0
+
+
+class PodAllocation:
+    """单个 Pod 在节点上占用的资源请求（GPU 个数、CPU 毫核、内存字节）"""
+
+    __slots__ = ("namespace", "name", "job_name", "node_name", "gpu", "cpu_millis", "memory_bytes")
+
+    def __init__(self, namespace: str, name: str, job_name: str, node_name: str,
+                 gpu: int, cpu_millis: int, memory_bytes: int):
+        self.namespace = namespace
+        self.name = name
+        self.job_name = job_name
+        self.node_name = node_name
+        self.gpu = gpu
+        self.cpu_millis = cpu_millis
+        self.memory_bytes = memory_bytes
+
+    @property
+    def key(self) -> Tuple[str, str]:
+        return self.namespace, self.name
+
+    @classmethod
+    def from_pod(cls, pod: Any) -> Optional["PodAllocation"]:
+        """由 V1Pod 或原始 JSON 的 RawObject 构造；未调度或已结束的 Pod 返回 None"""
+        status = pod.status
+        spec = pod.spec
+        if not status or status.phase not in _ALLOCATED_PHASES or not spec or not spec.node_name:
+            return None
+        gpu = cpu_millis = memory_bytes = 0
+        for container in spec.containers or []:
+            requests = container.resources.requests if container.resources else None
+            if isinstance(requests, RawObject):
+                requests = requests.to_dict()
+            if not requests:
+                continue
+            gpu += _quantity(requests.get("nvidia.com/gpu", 0))
+            cpu_millis += _quantity(requests.get("cpu", 0), 1000)
+            memory_bytes += _quantity(requests.get("memory", 0))
+        labels = pod.metadata.labels
+        if isinstance(labels, RawObject):
+            labels = labels.to_dict()
+        labels = labels or {}
+        job_name = labels.get(Labels.JOB_NAME) or labels.get(Labels.APP) or pod.metadata.name
+        return cls(pod.metadata.namespace, pod.metadata.name, job_name, spec.node_name,
+                   gpu, cpu_millis, memory_bytes)
+
+
+class NodeAllocation:
+    """单个节点上所有活跃 Pod 的资源请求汇总
+
+    不可变：增删 Pod 时返回新对象，读取方拿到的快照不会被 watch 线程修改。
+    """
+
+    __slots__ = ("gpu", "cpu_millis", "memory_bytes", "pods")
+
+    def __init__(self, pods: Optional[Dict[Tuple[str, str], PodAllocation]] = None):
+        self.pods = pods or {}
+        self.gpu = sum(p.gpu for p in self.pods.values())
+        self.cpu_millis = sum(p.cpu_millis for p in self.pods.values())
+        self.memory_bytes = sum(p.memory_bytes for p in self.pods.values())
+
+    def with_pod(self, pod: PodAllocation) -> "NodeAllocation":
+        pods = dict(self.pods)
+        pods[pod.key] = pod
+        return NodeAllocation(pods)
+
+    def without_pod(self, key: Tuple[str, str]) -> "NodeAllocation":
+        pods = dict(self.pods)
+        pods.pop(key, None)
+        return NodeAllocation(pods)
+
+    @property
+    def cpu_cores(self) -> float:
+        return round(self.cpu_millis / 1000, 3)
+
+    @property
+    def memory(self) -> str:
+        """内存请求，格式如 32Gi"""
+        gib = self.memory_bytes / (1024 ** 3)
+        return f"{gib:.0f}Gi" if gib == int(gib) else f"{gib:.1f}Gi"
+
+    def running_jobs(self) -> List[Dict[str, Any]]:
+        """节点上的作业列表，按作业聚合 Pod 的 GPU 请求"""
+        jobs: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        for pod in self.pods.values():
+            job = jobs.setdefault((pod.namespace, pod.job_name), {
+                "name": pod.job_name, "namespace": pod.namespace, "pods": [], "gpu": 0
+            })
+            job["pods"].append(pod.name)
+            job["gpu"] += pod.gpu
+        return sorted(jobs.values(), key=lambda job: (job["namespace"], job["name"]))
+
+
+def summarize(pods: Iterable[Any]) -> Dict[str, NodeAllocation]:
+    """把一次 Pod 列表汇总为 节点名 -> NodeAllocation"""
+    by_node: Dict[str, Dict[Tuple[str, str], PodAllocation]] = {}
+    for pod in pods:
+        allocation = PodAllocation.from_pod(pod)
+        if allocation is not None:
+            by_node.setdefault(allocation.node_name, {})[allocation.key] = allocation
+    return {node: NodeAllocation(pods) for node, pods in by_node.items()}
+
+
+class AllocationIndex(KubernetesClient):
+    """按节点汇总 Pod 资源请求的增量索引
+
+    一次集群级 list（原始 JSON，只取活跃 Pod）建立快照，启动 watch 后由 Pod 的
+    ADDED/MODIFIED/DELETED 事件增量维护节点汇总。资源池视图按节点标签聚合节点汇总，
+    查询代价只与节点数相关，不再每次列出全部 Pod。
+    """
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    @classmethod
+    def get_instance(cls):
+        """Get singleton instance"""
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
+    def __init__(self):
+        super().__init__()
+        self._lock = threading.Lock()
+        self._nodes: Dict[str, NodeAllocation] = {}
+        # (namespace, name) -> 所在节点，用于处理 Pod 迁移和删除
+        self._pod_nodes: Dict[Tuple[str, str], str] = {}
+        self._synced_at = None
+        self._informer: Optional[Informer] = None
+
+    def _build_informer(self) -> Informer:
+        if self._informer is None:
+            self._informer = Informer(
+                "pods", self.core_v1.list_pod_for_all_namespaces,
+                self._on_event, self._on_relist,
+                relist_func=self._list_pods_raw,
+                field_selector=ACTIVE_POD_FIELD_SELECTOR
+            )
+        return self._informer
+
+    def _list_pods_raw(self, **kwargs) -> RawObject:
+        return RawObject(list_raw(self.core_v1.list_pod_for_all_namespaces, **kwargs))
+
+    def is_watching(self) -> bool:
+        return self._informer is not None and self._informer.is_synced()
+
+    def _is_stale(self) -> bool:
+        if self._synced_at is None:
+            return True
+        if self.is_watching():
+            return False
+        return time.monotonic() - self._synced_at > SNAPSHOT_TTL_SECONDS
+
+    def sync(self) -> None:
+        """通过一次集群级 list 重建索引"""
+        try:
+            self._build_informer().list()
+        except ApiException as e:
+            self.handle_api_exception(e, "list pods for allocation index")
+        self._synced_at = time.monotonic()
+
+    def start(self) -> None:
+        """同步索引并启动后台 watch"""
+        if self._synced_at is None:
+            self.sync()
+        self._build_informer().start()
+
+    def stop(self) -> None:
+        if self._informer is not None:
+            self._informer.stop()
+
+    def nodes(self) -> Dict[str, NodeAllocation]:
+        """返回 节点名 -> NodeAllocation 的快照"""
+        if self._is_stale():
+            self.sync()
+        with self._lock:
+            return dict(self._nodes)
+
+    def node(self, node_name: str) -> NodeAllocation:
+        if self._is_stale():
+            self.sync()
+        return self._nodes.get(node_name) or NodeAllocation()
+
+    def _on_relist(self, items: List[Any]) -> None:
+        nodes = summarize(items)
+        pod_nodes = {key: node for node, allocation in nodes.items() for key in allocation.pods}
+        with self._lock:
+            self._nodes = nodes
+            self._pod_nodes = pod_nodes
+
+    def _on_event(self, event_type: str, pod: Any) -> None:
+        key = (pod.metadata.namespace, pod.metadata.name)
+        allocation = None if event_type == "DELETED" else PodAllocation.from_pod(pod)
+        with self._lock:
+            previous_node = self._pod_nodes.pop(key, None)
+            if previous_node is not None:
+                remaining = self._nodes[previous_node].without_pod(key)
+                if remaining.pods:
+                    self._nodes[previous_node] = remaining
+                else:
+                    del self._nodes[previous_node]
+            if allocation is not None:
+                node = allocation.node_name
+                self._nodes[node] = self._nodes.get(node, NodeAllocation()).with_pod(allocation)
+                self._pod_nodes[key] = node
@@ -0,0 +1,69 @@
+import asyncio
+import functools
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+
+# 执行同步 Kubernetes 调用的线程数，默认与共享连接池大小一致
+K8S_ASYNC_WORKERS = int(os.getenv('K8S_ASYNC_WORKERS', os.getenv('K8S_CONNECTION_POOL_SIZE', '32')))
+
+# 客户端上的 Kubernetes API 对象属性，访问时同样包装为异步接口
+_API_ATTRIBUTES = frozenset({"core_v1", "batch_v1", "apps_v1", "autoscaling_v1"})
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """返回进程级共享的有界线程池（首次使用时创建）"""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=K8S_ASYNC_WORKERS, thread_name_prefix="gpuctl-k8s"
+                )
+    return _executor
+
+
+async def run_sync(func: Callable[..., Any], *args, **kwargs) -> Any:
+    """在共享线程池中执行同步调用，不阻塞事件循环"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_executor(), functools.partial(func, *args, **kwargs))
+
+
+class AsyncClient:
+    """同步客户端的 asyncio 包装
+
+    暴露与被包装客户端相同的方法（返回值同样是字典/列表），每次调用都在共享的有界
+    线程池中执行，因此 FastAPI 路由 ``await`` 时事件循环不会被 Kubernetes 往返阻塞，
+    并发请求的 API 调用可以重叠执行::
+
+        client = AsyncClient(JobClient())
+        jobs = await client.list_jobs(namespace="default")
+        node = await client.core_v1.read_node("node-1")
+
+    线程池大小由 K8S_ASYNC_WORKERS 控制，底层复用 ApiClientFactory 的共享连接池。
+    """
+
+    def __init__(self, sync_client: Any):
+        self._client = sync_client
+
+    @property
+    def sync_client(self) -> Any:
+        return self._client
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._client, name)
+        if name in _API_ATTRIBUTES:
+            return AsyncClient(attr)
+        if not callable(attr):
+            return attr
+
+        @functools.wraps(attr)
+        async def call(*args, **kwargs):
+            return await run_sync(attr, *args, **kwargs)
+
+        return call
@@ -1,31 +1,181 @@
 from kubernetes import client, config
 from kubernetes.client.rest import ApiException
 import os
-from typing import Optional
+import socket
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Iterable, List, Optional
 
 
-class KubernetesClient:
-    """Kubernetes客户端基类"""
+# 共享 urllib3 连接池的最大连接数（即对 API Server 的最大并发请求数）
+K8S_CONNECTION_POOL_SIZE = int(os.getenv('K8S_CONNECTION_POOL_SIZE', '32'))
+# TCP keep-alive 空闲探测时间（秒），0 表示不开启
+K8S_TCP_KEEPALIVE = int(os.getenv('K8S_TCP_KEEPALIVE', '60'))
+# 跨命名空间并发查找的最大线程数
+K8S_LOOKUP_WORKERS = int(os.getenv('K8S_LOOKUP_WORKERS', '16'))
+
+
+class ApiClientFactory:
+    """进程级共享的 Kubernetes ApiClient 工厂
+
+    kubeconfig / in-cluster 配置只加载一次，所有 KubernetesClient 子类共享同一个
+    ApiClient（同一个 urllib3 连接池）以及按类型缓存的 API 对象。线程安全，首次使用时初始化。
+    """
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    @classmethod
+    def get_instance(cls):
+        """Get singleton instance"""
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
+    @classmethod
+    def reset(cls) -> None:
+        """丢弃共享实例，下次使用时重新加载配置"""
+        with cls._instance_lock:
+            cls._instance = None
 
     def __init__(self):
-        self._load_config()
-        self.core_v1 = client.CoreV1Api()
-        self.batch_v1 = client.BatchV1Api()
-        self.apps_v1 = client.AppsV1Api()
-        self.autoscaling_v1 = client.AutoscalingV1Api()
-
-    def _load_config(self):
-        """加载Kubernetes配置"""
+        configuration = client.Configuration()
         try:
             if os.getenv('KUBERNETES_SERVICE_HOST'):
-                config.load_incluster_config()
+                config.load_incluster_config(client_configuration=configuration)
             else:
-                config.load_kube_config()
+                config.load_kube_config(client_configuration=configuration)
         except Exception as e:
             raise RuntimeError(f"Failed to load Kubernetes config: {e}")
+        configuration.connection_pool_maxsize = K8S_CONNECTION_POOL_SIZE
+        # 保持与旧行为兼容：直接构造 client.XxxApi() 的代码仍能拿到已加载的配置
+        client.Configuration.set_default(configuration)
+
+        self.configuration = configuration
+        self.api_client = client.ApiClient(configuration)
+        self._enable_keepalive()
+        self._install_throttling()
+        self._apis: Dict[type, object] = {}
+        self._apis_lock = threading.Lock()
+
+    def _enable_keepalive(self) -> None:
+        """为连接池中新建的连接开启 TCP keep-alive，避免空闲连接被中间设备静默断开"""
+        if K8S_TCP_KEEPALIVE <= 0:
+            return
+        from urllib3.connection import HTTPConnection
+
+        socket_options = list(HTTPConnection.default_socket_options)
+        socket_options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+        for name, value in (('TCP_KEEPIDLE', K8S_TCP_KEEPALIVE),
+                            ('TCP_KEEPINTVL', max(K8S_TCP_KEEPALIVE // 4, 1)),
+                            ('TCP_KEEPCNT', 4)):
+            if hasattr(socket, name):
+                socket_options.append((socket.IPPROTO_TCP, getattr(socket, name), value))
+        pool_manager = self.api_client.rest_client.pool_manager
+        pool_manager.connection_pool_kw['socket_options'] = socket_options
+
+    def _install_throttling(self) -> None:
+        """所有请求共享同一个令牌桶（K8S_CLIENT_QPS/K8S_CLIENT_BURST），429（及幂等请求的 503）时按 Retry-After 退避重试"""
+        from .throttle import install_throttling
+        self.throttle = install_throttling(self.api_client)
+
+    def get_api(self, api_class):
+        """返回绑定到共享 ApiClient 的 API 对象（按类型缓存）"""
+        api = self._apis.get(api_class)
+        if api is None:
+            with self._apis_lock:
+                api = self._apis.get(api_class)
+                if api is None:
+                    api = api_class(self.api_client)
+                    self._apis[api_class] = api
+        return api
+
+
+def first_hit(func: Callable[[Any], Any], items: Iterable[Any],
+              max_workers: int = K8S_LOOKUP_WORKERS) -> Any:
+    """在有界线程池中对 items 并发执行 func，返回最先得到的非 None 结果
+
+    命中后取消尚未开始的任务（已在执行的请求结果会被丢弃）。全部未命中时，
+    如果有任务抛出异常则重新抛出第一个异常，否则返回 None。
+    """
+    items = list(items)
+    if not items:
+        return None
+    if len(items) == 1:
+        return func(items[0])
+
+    executor = ThreadPoolExecutor(max_workers=min(max_workers, len(items)),
+                                  thread_name_prefix="gpuctl-lookup")
+    pending = {executor.submit(func, item) for item in items}
+    first_error = None
+    try:
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is not None:
+                    first_error = first_error or future.exception()
+                elif future.result() is not None:
+                    return future.result()
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=False)
+    if first_error is not None:
+        raise first_error
+    return None
+
+
+def first_in_order(func: Callable[[Any], Any], items: Iterable[Any],
+                   max_workers: int = K8S_LOOKUP_WORKERS) -> Any:
+    """在有界线程池中对 items 并发执行 func，按 items 的顺序返回第一个非 None 结果
+
+    与 first_hit 不同，结果不取决于哪个请求先返回：排在前面的任务未完成时继续等待，
+    排在前面的任务抛出异常时重新抛出（与逐个顺序执行的结果一致）。
+    """
+    items = list(items)
+    if not items:
+        return None
+    if len(items) == 1:
+        return func(items[0])
+
+    executor = ThreadPoolExecutor(max_workers=min(max_workers, len(items)),
+                                  thread_name_prefix="gpuctl-lookup")
+    futures = [executor.submit(func, item) for item in items]
+    try:
+        for future in futures:
+            result = future.result()
+            if result is not None:
+                return result
+    finally:
+        for future in futures:
+            future.cancel()
+        executor.shutdown(wait=False)
+    return None
+
+
+class KubernetesClient:
+    """Kubernetes客户端基类"""
+
+    def __init__(self):
+        factory = ApiClientFactory.get_instance()
+        self.api_client = factory.api_client
+        self.core_v1 = factory.get_api(client.CoreV1Api)
+        self.batch_v1 = factory.get_api(client.BatchV1Api)
+        self.apps_v1 = factory.get_api(client.AppsV1Api)
+        self.autoscaling_v1 = factory.get_api(client.AutoscalingV1Api)
+
+    def get_api(self, api_class):
+        """获取共享连接池上的其他 API 对象，如 client.SchedulingV1Api"""
+        return ApiClientFactory.get_instance().get_api(api_class)
 
     def ensure_namespace_exists(self, namespace: str) -> None:
         """确保命名空间存在，如果不存在则创建"""
+        from .quota_client import is_known_quota_namespace
+        if is_known_quota_namespace(namespace):
+            # 提交前已确认带配额标签（因而存在）的命名空间，无需再次读取
+            return
         try:
             # 检查命名空间是否存在
             self.core_v1.read_namespace(namespace)
@@ -42,12 +192,96 @@ class KubernetesClient:
             else:
                 raise RuntimeError(f"Failed to check namespace {namespace}: {e}")
 
+    def _get_all_gpuctl_namespaces(self) -> List[str]:
+        """获取所有gpuctl管理的namespace，包括default和带有runwhere.ai标签的namespace
+
+        由进程级 NamespaceRegistry 维护，不再逐个命名空间扫描
+        """
+        from .namespace_registry import NamespaceRegistry
+        return list(NamespaceRegistry.get_instance().namespaces())
+
+    def _find_in_namespaces(self, lookups, namespace: Optional[str] = None) -> Any:
+        """跨命名空间查找资源，返回第一个命中的结果
+
+        lookups 为单个或多个 ``lookup(ns)`` 函数，未找到时返回 None。
+        先在 namespace 中并发执行全部 lookup；未命中时在其余受管命名空间中
+        并发执行（命名空间 × lookup），首个命中即返回并取消其余任务。
+        """
+        if callable(lookups):
+            lookups = [lookups]
+
+        def run(task):
+            ns, lookup = task
+            return lookup(ns)
+
+        if namespace:
+            result = first_hit(run, [(namespace, lookup) for lookup in lookups])
+            if result is not None:
+                return result
+        others = [ns for ns in self._get_all_gpuctl_namespaces() if ns and ns != namespace]
+        return first_hit(run, [(ns, lookup) for ns in others for lookup in lookups])
+
+    def _coalesced(self, verb: str, resource: str, func: Callable[..., Any],
+                   namespace: Optional[str] = None, **kwargs) -> Any:
+        """合并相同 (verb, resource, namespace, 参数) 的并发只读请求
+
+        并发的调用方共享同一个进行中的 Kubernetes 请求及其结果（结果只读），
+        命中/未命中计数见 SingleFlight.get_instance().stats()。
+        """
+        from .singleflight import SingleFlight
+
+        key = (verb, resource, namespace, tuple(sorted(kwargs.items())))
+        if namespace is not None:
+            kwargs["namespace"] = namespace
+        return SingleFlight.get_instance().do(key, func, **kwargs)
+
+    def list_metadata(self, resource: str, namespace: Optional[str] = None,
+                      label_selector: Optional[str] = None, field_selector: Optional[str] = None,
+                      limit: Optional[int] = None, _continue: Optional[str] = None,
+                      resource_version: Optional[str] = None):
+        """只取元数据列出资源（PartialObjectMetadataList）
+
+        resource 为复数资源名（如 "nodes"、"jobs"），namespace 为空时集群级列出。
+        apiserver 只返回 metadata，不传输 spec/status，适合只需要名称和标签的发现与存在性检查。
+        返回与 V1XxxList 结构相同的 PartialObjectMetadataList。
+        """
+        from .raw_json import loads
+        from .metadata import METADATA_LIST_ACCEPT, METADATA_RESOURCES, PartialObjectMetadataList
+
+        if resource not in METADATA_RESOURCES:
+            raise ValueError(f"Unsupported resource for metadata listing: {resource}")
+        api_path, namespaced = METADATA_RESOURCES[resource]
+        if namespace and namespaced:
+            path = f"{api_path}/namespaces/{namespace}/{resource}"
+        else:
+            path = f"{api_path}/{resource}"
+
+        query_params = []
+        for key, value in (("labelSelector", label_selector), ("fieldSelector", field_selector),
+                           ("limit", limit), ("continue", _continue),
+                           ("resourceVersion", resource_version)):
+            if value is not None:
+                query_params.append((key, value))
+
+        response = self.api_client.call_api(
+            path, 'GET',
+            query_params=query_params,
+            header_params={'Accept': METADATA_LIST_ACCEPT},
+            auth_settings=['BearerToken'],
+            _return_http_data_only=True,
+            _preload_content=False
+        )
+        return PartialObjectMetadataList.from_dict(loads(response.data))
+
     def handle_api_exception(self, e: ApiException, operation: str) -> None:
         """处理API异常"""
         if e.status == 401:
             raise PermissionError(f"Authentication failed for {operation}")
         elif e.status == 403:
             raise PermissionError(f"Permission denied for {operation}")
+        elif e.status == 429:
+            raise RuntimeError(f"Kubernetes API rate limit exceeded during {operation}, "
+                               f"retries exhausted; consider lowering K8S_CLIENT_QPS")
         elif e.status == 404:
             # Parse the detailed error message from Kubernetes API response
             try:
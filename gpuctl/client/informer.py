@@ -0,0 +1,118 @@
+import logging
+import threading
+from typing import Any, Callable, List, Optional
+
+from kubernetes import watch
+from kubernetes.client.rest import ApiException
+
+
+logger = logging.getLogger(__name__)
+
+# 单次 watch 请求的服务端超时，到期后以最新 resourceVersion 重新发起
+WATCH_TIMEOUT_SECONDS = 300
+# watch 异常断开后的最大退避时间
+MAX_BACKOFF_SECONDS = 30
+
+
+class Informer:
+    """对单类资源执行 list + watch，并把事件回调给上层缓存
+
+    - ``list()`` 同步拉取一次全量快照，记录 resourceVersion 并调用 ``on_relist(items)``；
+      传入 ``relist_func`` 时用它拉取快照（例如只取元数据的投影），watch 仍使用 ``list_func``
+    - ``start()`` 启动后台守护线程，从该 resourceVersion 开始 watch，
+      每个 ADDED/MODIFIED/DELETED 事件调用 ``on_event(event_type, obj)``
+    - resourceVersion 过期（410 Gone）时自动重新 list，其余异常指数退避后重连
+    - ``is_synced()`` 只在 list 成功、watch 未出错期间为真，watch 出错后直到重新同步前为假
+    """
+
+    def __init__(self, name: str, list_func: Callable[..., Any],
+                 on_event: Callable[[str, Any], None],
+                 on_relist: Callable[[List[Any]], None],
+                 relist_func: Optional[Callable[..., Any]] = None,
+                 **list_kwargs):
+        self.name = name
+        self._list_func = list_func
+        self._relist_func = relist_func or list_func
+        self._on_event = on_event
+        self._on_relist = on_relist
+        self._list_kwargs = list_kwargs
+        self._stop_event = threading.Event()
+        # list 成功后置位，watch 出错时清除，直到重新 list 或 watch 正常结束
+        self._synced = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._watch: Optional[watch.Watch] = None
+        self.resource_version: Optional[str] = None
+
+    def list(self) -> List[Any]:
+        """拉取全量快照并重置上层缓存"""
+        result = self._relist_func(**self._list_kwargs)
+        self.resource_version = result.metadata.resource_version
+        items = result.items or []
+        self._on_relist(items)
+        self._synced.set()
+        return items
+
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def is_synced(self) -> bool:
+        """watch 线程在运行且上层缓存与集群保持同步"""
+        return self.is_running() and self._synced.is_set()
+
+    def start(self) -> None:
+        """启动后台 watch 线程（幂等）"""
+        if self.is_running():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run, name=f"gpuctl-informer-{self.name}", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """停止后台 watch 线程"""
+        self._stop_event.set()
+        self._synced.clear()
+        if self._watch is not None:
+            self._watch.stop()
+
+    def _run(self) -> None:
+        backoff = 1
+        while not self._stop_event.is_set():
+            try:
+                if self.resource_version is None:
+                    self.list()
+                self._watch = watch.Watch()
+                for event in self._watch.stream(
+                    self._list_func,
+                    resource_version=self.resource_version,
+                    timeout_seconds=WATCH_TIMEOUT_SECONDS,
+                    **self._list_kwargs
+                ):
+                    if self._stop_event.is_set():
+                        break
+                    event_type = event.get("type")
+                    obj = event.get("object")
+                    # ERROR/BOOKMARK 事件的 object 是原始字典，不是模型对象
+                    if event_type not in ("ADDED", "MODIFIED", "DELETED"):
+                        continue
+                    self.resource_version = obj.metadata.resource_version
+                    self._on_event(event_type, obj)
+                    self._synced.set()
+                if not self._stop_event.is_set():
+                    self._synced.set()
+                backoff = 1
+            except ApiException as e:
+                self._synced.clear()
+                if e.status == 410:
+                    logger.debug(f"Informer {self.name}: resourceVersion expired, relisting")
+                    self.resource_version = None
+                    continue
+                logger.warning(f"Informer {self.name}: watch failed: {e}")
+                self._stop_event.wait(backoff)
+                backoff = min(backoff * 2, MAX_BACKOFF_SECONDS)
+            except Exception as e:
+                self._synced.clear()
+                logger.warning(f"Informer {self.name}: watch failed: {e}")
+                self._stop_event.wait(backoff)
+                backoff = min(backoff * 2, MAX_BACKOFF_SECONDS)
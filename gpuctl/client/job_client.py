@@ -1,14 +1,67 @@
-from .base_client import KubernetesClient
+import logging
+import os
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait as wait_futures
+from .base_client import KubernetesClient, first_in_order
 from .quota_client import QuotaClient
-from kubernetes import client
+from .raw_json import RawObject, list_raw
+from .records import PodRecord, WorkloadRecord
+from kubernetes import client, watch
 from kubernetes.client.rest import ApiException
-from typing import List, Dict, Any, Optional
-from gpuctl.constants import Labels, Kind, DEFAULT_NAMESPACE, NS_LABEL_SELECTOR
+from typing import List, Dict, Any, Optional, Union
+from gpuctl.constants import Labels, Kind, K8sResourceType, DEFAULT_NAMESPACE
+
+
+logger = logging.getLogger(__name__)
+
+# 等待资源删除完成的最长时间（秒）
+DELETE_TIMEOUT_SECONDS = 30
+# 列表接口直接解析原始 JSON（跳过 OpenAPI 模型反序列化），默认关闭
+K8S_RAW_JSON_LISTS = os.getenv('K8S_RAW_JSON_LISTS', 'false').lower() in ('1', 'true', 'yes')
+
+
+class DeletionHandle:
+    """异步删除的句柄，用于稍后查询删除结果"""
+
+    def __init__(self, name: str, namespace: str, futures: Dict[str, Future]):
+        self.name = name
+        self.namespace = namespace
+        self._futures = futures
+        # 是否找到了要删除的资源（删除请求已被受理）
+        self.found = bool(futures)
+
+    def __bool__(self) -> bool:
+        return self.found
+
+    @property
+    def resources(self) -> List[str]:
+        """已受理删除请求的资源类型"""
+        return list(self._futures)
+
+    def done(self) -> bool:
+        """所有资源的删除结果是否都已确定"""
+        return all(f.done() for f in self._futures.values())
+
+    def result(self, timeout: Optional[float] = None) -> bool:
+        """等待删除结果，所有资源都确认删除时返回 True
+
+        watch 过程中的异常会在此处重新抛出。
+        """
+        wait_futures(self._futures.values(), timeout=timeout)
+        return all(f.done() and f.result() for f in self._futures.values())
+
+    def pending(self) -> List[str]:
+        """尚未确认删除的资源类型"""
+        return [r for r, f in self._futures.items()
+                if not f.done() or f.exception() is not None or not f.result()]
 
 
 class JobClient(KubernetesClient):
     """任务管理客户端"""
 
+    # 为 True 时列表接口走原始 JSON 快速路径，输出的字典结构与模型路径一致
+    raw_json_lists = K8S_RAW_JSON_LISTS
+
     def _validate_namespace_quota(self, namespace: str) -> bool:
         """验证namespace是否已配置quota"""
         if namespace == "default":
@@ -54,194 +107,224 @@ class JobClient(KubernetesClient):
     def get_job(self, name: str, namespace: str = DEFAULT_NAMESPACE) -> Optional[Dict[str, Any]]:
         """获取作业资源信息，包括Job、Deployment和StatefulSet
         
-        如果在指定命名空间中未找到资源，会自动搜索所有gpuctl管理的命名空间
+        如果在指定命名空间中未找到资源，会并发搜索所有gpuctl管理的命名空间。
+        同一命名空间中三种资源并发读取，同名时按 Job、Deployment、StatefulSet 的顺序取结果。
         """
-        def _try_get_in_namespace(ns: str) -> Optional[Dict[str, Any]]:
-            """在指定命名空间中尝试获取作业资源"""
-            # 先尝试获取Job资源
-            try:
-                job = self.batch_v1.read_namespaced_job(name, ns)
-                return self._job_to_dict(job)
-            except ApiException as e:
-                if e.status != 404:
-                    self.handle_api_exception(e, f"get job {name} in namespace {ns}")
-
-            # 再尝试获取Deployment资源
-            try:
-                deployment = self.apps_v1.read_namespaced_deployment(name, ns)
-                return self._deployment_to_dict(deployment)
-            except ApiException as e:
-                if e.status != 404:
-                    self.handle_api_exception(e, f"get deployment {name} in namespace {ns}")
+        readers = [
+            (self.batch_v1.read_namespaced_job, self._job_to_dict, "job"),
+            (self.apps_v1.read_namespaced_deployment, self._deployment_to_dict, "deployment"),
+            (self.apps_v1.read_namespaced_stateful_set, self._statefulset_to_dict, "statefulset"),
+        ]
 
-            # 最后尝试获取StatefulSet资源
-            try:
-                statefulset = self.apps_v1.read_namespaced_stateful_set(name, ns)
-                return self._statefulset_to_dict(statefulset)
-            except ApiException as e:
-                if e.status != 404:
-                    self.handle_api_exception(e, f"get statefulset {name} in namespace {ns}")
+        def _try_get_in_namespace(ns: str) -> Optional[Dict[str, Any]]:
+            """在指定命名空间中并发读取三种作业资源，按固定顺序返回第一个存在的"""
+            def read(reader) -> Optional[Dict[str, Any]]:
+                read_func, to_dict, kind = reader
+                try:
+                    return to_dict(read_func(name, ns))
+                except ApiException as e:
+                    if e.status != 404:
+                        self.handle_api_exception(e, f"get {kind} {name} in namespace {ns}")
+                return None
+            return first_in_order(read, readers)
 
-            # 当前命名空间中未找到
-            return None
-        
-        # 1. 优先在指定命名空间中查找
-        result = _try_get_in_namespace(namespace)
-        if result:
-            return result
-        
-        # 2. 如果在指定命名空间中未找到，搜索所有gpuctl管理的命名空间
-        all_namespaces = self._get_all_gpuctl_namespaces()
-        for ns in all_namespaces:
-            if ns == namespace:
-                continue  # 跳过已经检查过的命名空间
-            
-            result = _try_get_in_namespace(ns)
-            if result:
-                return result
-        
-        # 所有命名空间中都未找到
-        return None
+        # 优先在指定命名空间中查找，未找到时并发搜索其余gpuctl管理的命名空间
+        return self._find_in_namespaces(_try_get_in_namespace, namespace)
 
     def get_pod(self, name: str, namespace: str = None) -> Optional[Dict[str, Any]]:
         """通过 Pod 名称获取 Pod 信息，支持跨命名空间搜索"""
-        namespaces_to_try = [namespace] if namespace else self._get_all_gpuctl_namespaces()
-        for ns in namespaces_to_try:
-            if not ns:
-                continue
+        def _try_get_in_namespace(ns: str) -> Optional[Dict[str, Any]]:
             try:
                 pod = self.core_v1.read_namespaced_pod(name, ns)
                 return self._pod_to_dict(pod)
             except ApiException as e:
                 if e.status != 404:
                     self.handle_api_exception(e, f"get pod {name} in namespace {ns}")
-        return None
+            return None
+
+        if namespace:
+            return _try_get_in_namespace(namespace)
+        # 并发搜索所有gpuctl管理的命名空间，首个命中即返回
+        return self._find_in_namespaces(_try_get_in_namespace)
 
     def list_jobs(self, namespace: str = None,
                   labels: Dict[str, str] = None, include_pods: bool = False) -> List[Dict[str, Any]]:
-        """列出所有作业资源，包括Job、Deployment和StatefulSet"""
-        try:
-            all_jobs = []
+        """列出所有作业资源，包括Job、Deployment和StatefulSet
 
-            # 如果没有指定labels，添加默认过滤器，只返回gpuctl创建的资源
-            # 所有gpuctl创建的资源都会带有runwhere.ai/job-type标签
-            if not labels and not include_pods:
-                # 当include_pods=True时，不要使用gpuctl_filter，因为Pod资源可能没有runwhere.ai/job-type标签
-                use_gpuctl_filter = True
+        返回 WorkloadRecord（include_pods=True 时为 PodRecord）列表，支持按字典方式读取。
+        gpuctl 创建的控制器和 Pod 模板都带有 runwhere.ai/job-type 标签，指定与未指定命名空间时
+        都附加该标签过滤（与用户标签为 AND 关系），两种方式返回的作业集合一致。
+        """
+        try:
+            if namespace:
+                return self._list_jobs_in_namespace(namespace, labels, include_pods, use_gpuctl_filter=True)
             else:
-                use_gpuctl_filter = False
+                return self._list_jobs_all_namespaces(labels, include_pods)
+        except ApiException as e:
+            self.handle_api_exception(e, "list jobs")
+
+    def list_jobs_page(self, namespace: str = None, labels: Dict[str, str] = None,
+                       limit: int = 20, continue_token: Optional[str] = None) -> Dict[str, Any]:
+        """服务端分页列出作业 Pod（与 list_jobs(include_pods=True) 的过滤条件一致）
 
+        透传 Kubernetes 的 limit/continue，只传输和反序列化当前页的对象。
+        返回 ``{"items": [...], "continue": 下一页 token 或 None, "remaining_item_count": 剩余条数或 None}``。
+        continue token 过期（410）时抛出 ValueError。
+        """
+        label_selector = self._build_label_selector(labels, use_gpuctl_filter=True)
+        kwargs = {"label_selector": label_selector, "limit": limit}
+        if continue_token:
+            kwargs["_continue"] = continue_token
+        try:
             if namespace:
-                return self._list_jobs_in_namespace(namespace, labels, include_pods, use_gpuctl_filter)
+                items, list_meta = self._list_pod_records(self.core_v1.list_namespaced_pod, namespace, **kwargs)
             else:
-                all_namespaces = self._get_all_gpuctl_namespaces()
-                for ns in all_namespaces:
-                    ns_jobs = self._list_jobs_in_namespace(ns, labels, include_pods, use_gpuctl_filter)
-                    all_jobs.extend(ns_jobs)
-                return all_jobs
+                items, list_meta = self._list_pod_records(self.core_v1.list_pod_for_all_namespaces, **kwargs)
         except ApiException as e:
+            if e.status == 410:
+                raise ValueError("Continue token expired, restart listing from the first page")
             self.handle_api_exception(e, "list jobs")
 
-    def _get_all_gpuctl_namespaces(self) -> List[str]:
-        """获取所有gpuctl管理的namespace，包括default和带有runwhere.ai标签的namespace"""
-        namespaces = set()
-        
-        # 始终包含default命名空间
-        namespaces.add("default")
-        
-        try:
-            # 获取带有runwhere.ai/namespace标签的命名空间
-            labeled_ns = self.core_v1.list_namespace(
-                label_selector=NS_LABEL_SELECTOR
-            )
-            for ns in labeled_ns.items:
-                namespaces.add(ns.metadata.name)
-            
-            # 扫描所有命名空间查找带有runwhere.ai标签的资源
-            all_ns = self.core_v1.list_namespace()
-            for ns in all_ns.items:
-                ns_name = ns.metadata.name
-                
-                # 检查该命名空间下的job（使用 key 存在性检查，runwhere.ai/job-type 是所有 gpuctl 资源的必有标签）
-                try:
-                    jobs = self.batch_v1.list_namespaced_job(ns_name, label_selector=Labels.JOB_TYPE)
-                    if jobs.items:
-                        namespaces.add(ns_name)
-                        continue
-                except ApiException:
-                    pass
-                
-                # 检查该命名空间下的deployment
-                try:
-                    deployments = self.apps_v1.list_namespaced_deployment(ns_name, label_selector=Labels.JOB_TYPE)
-                    if deployments.items:
-                        namespaces.add(ns_name)
-                        continue
-                except ApiException:
-                    pass
-                
-                # 检查该命名空间下的statefulset
+        return {
+            "items": items,
+            "continue": list_meta.get("continue") or None,
+            "remaining_item_count": list_meta.get("remainingItemCount"),
+        }
+
+    def _list_workloads(self, kind: str, list_func, to_dict, raw_to_dict, *args, **kwargs) -> List[WorkloadRecord]:
+        """调用 list API 并把每一项转换为 WorkloadRecord
+
+        开启 raw_json_lists 时以原始 JSON 读取并用 raw_to_dict 转换，否则反序列化为模型后用 to_dict 转换。
+        """
+        if self.raw_json_lists:
+            items = list_raw(list_func, *args, **kwargs).get("items") or []
+            return [WorkloadRecord.from_dict(kind, raw_to_dict(item)) for item in items]
+        return [WorkloadRecord.from_dict(kind, to_dict(item)) for item in list_func(*args, **kwargs).items]
+
+    def _list_pod_records(self, list_func, *args, **kwargs):
+        """列出 Pod 并转换为 PodRecord，返回 (记录列表, 列表元数据 {"continue", "remainingItemCount"})
+
+        单个 Pod 转换失败时打印警告并跳过。
+        """
+        items = []
+        if self.raw_json_lists:
+            result = list_raw(list_func, *args, **kwargs)
+            for pod in result.get("items") or []:
                 try:
-                    statefulsets = self.apps_v1.list_namespaced_stateful_set(ns_name, label_selector=Labels.JOB_TYPE)
-                    if statefulsets.items:
-                        namespaces.add(ns_name)
-                except ApiException:
-                    pass
-        
+                    items.append(PodRecord.from_dict(self._raw_pod_to_dict(pod)))
+                except Exception as e:
+                    print(f"Warning: Failed to process pod {(pod.get('metadata') or {}).get('name')}: {e}")
+            return items, result.get("metadata") or {}
+
+        pods = list_func(*args, **kwargs)
+        for pod in pods.items:
+            try:
+                items.append(PodRecord.from_dict(self._pod_to_dict(pod)))
+            except Exception as e:
+                print(f"Warning: Failed to process pod {pod.metadata.name}: {e}")
+        list_meta = {}
+        if pods.metadata is not None:
+            list_meta = {"continue": pods.metadata._continue,
+                         "remainingItemCount": pods.metadata.remaining_item_count}
+        return items, list_meta
+
+    def list_job_metadata(self, namespace: str = None, labels: Dict[str, str] = None,
+                          name: Optional[str] = None) -> List[Any]:
+        """只取元数据列出 gpuctl 创建的 Job、Deployment 和 StatefulSet
+
+        用于重名检查、关联作业检查等只需要名称和标签的场景，返回 ObjectMetadata 列表。
+        namespace 为空时使用集群级 list；指定 name 时通过 metadata.name 字段选择器过滤。
+        """
+        label_selector = self._build_label_selector(labels, use_gpuctl_filter=True)
+        field_selector = f"metadata.name={name}" if name else None
+        result = []
+        try:
+            for resource in ("jobs", "deployments", "statefulsets"):
+                items = self.list_metadata(resource, namespace=namespace, label_selector=label_selector,
+                                           field_selector=field_selector).items
+                result.extend(item.metadata for item in items)
         except ApiException as e:
-            self.handle_api_exception(e, "list namespaces")
-        
-        return list(namespaces)
+            self.handle_api_exception(e, "list job metadata")
+        return result
 
-    def _list_jobs_in_namespace(self, namespace: str, labels: Dict[str, str] = None, include_pods: bool = False, use_gpuctl_filter: bool = False) -> List[Dict[str, Any]]:
-        """在指定namespace中列出作业资源"""
-        # 构建标签选择器
+    @staticmethod
+    def _build_label_selector(labels: Dict[str, str] = None, use_gpuctl_filter: bool = False) -> Optional[str]:
+        """构建标签选择器"""
         selector_parts = []
-        
+
         # 如果需要过滤gpuctl创建的资源，添加runwhere.ai/job-type标签存在性检查
         if use_gpuctl_filter:
             selector_parts.append(Labels.JOB_TYPE)
-        
+
         # 添加用户提供的标签选择器
         if labels:
             for k, v in labels.items():
                 selector_parts.append(f"{k}={v}")
-        
+
         # 组合所有标签选择器，使用逗号分隔（AND关系）
-        label_selector = ",".join(selector_parts) if selector_parts else None
-        
+        return ",".join(selector_parts) if selector_parts else None
+
+    def _list_jobs_all_namespaces(self, labels: Dict[str, str] = None, include_pods: bool = False) -> List[Dict[str, Any]]:
+        """跨所有命名空间列出作业资源
+
+        使用集群级 list 调用（Pod 1 次，控制器 3 次），调用次数与命名空间数量无关。
+        与指定命名空间时相同，始终附加 runwhere.ai/job-type 标签过滤，只返回 gpuctl 管理的资源。
+        """
+        label_selector = self._build_label_selector(labels, use_gpuctl_filter=True)
+
+        jobs = []
+
+        if include_pods:
+            pods, _ = self._list_pod_records(self.core_v1.list_pod_for_all_namespaces, label_selector=label_selector)
+            jobs.extend(pods)
+        else:
+            jobs.extend(self._list_workloads(K8sResourceType.JOB, self.batch_v1.list_job_for_all_namespaces,
+                                             self._job_to_dict, self._raw_job_to_dict,
+                                             label_selector=label_selector))
+            jobs.extend(self._list_workloads(K8sResourceType.DEPLOYMENT, self.apps_v1.list_deployment_for_all_namespaces,
+                                             self._deployment_to_dict, self._raw_deployment_to_dict,
+                                             label_selector=label_selector))
+            jobs.extend(self._list_workloads(K8sResourceType.STATEFULSET, self.apps_v1.list_stateful_set_for_all_namespaces,
+                                             self._statefulset_to_dict, self._raw_statefulset_to_dict,
+                                             label_selector=label_selector))
+
+        return jobs
+
+    def _list_jobs_in_namespace(self, namespace: str, labels: Dict[str, str] = None, include_pods: bool = False, use_gpuctl_filter: bool = False) -> List[Dict[str, Any]]:
+        """在指定namespace中列出作业资源"""
+        label_selector = self._build_label_selector(labels, use_gpuctl_filter)
+
         jobs = []
 
         if include_pods:
             try:
-                pods = self.core_v1.list_namespaced_pod(namespace, label_selector=label_selector)
-                for pod in pods.items:
-                    try:
-                        pod_dict = self._pod_to_dict(pod)
-                        jobs.append(pod_dict)
-                    except Exception as e:
-                        print(f"Warning: Failed to process pod {pod.metadata.name}: {e}")
+                pods, _ = self._list_pod_records(self.core_v1.list_namespaced_pod, namespace,
+                                                 label_selector=label_selector)
+                jobs.extend(pods)
             except ApiException as e:
                 if e.status != 404:
                     raise
         else:
             try:
-                job_list = self.batch_v1.list_namespaced_job(namespace, label_selector=label_selector)
-                jobs.extend([self._job_to_dict(job) for job in job_list.items])
+                jobs.extend(self._list_workloads(K8sResourceType.JOB, self.batch_v1.list_namespaced_job,
+                                                 self._job_to_dict, self._raw_job_to_dict,
+                                                 namespace, label_selector=label_selector))
             except ApiException as e:
                 if e.status != 404:
                     raise
 
             try:
-                deployment_list = self.apps_v1.list_namespaced_deployment(namespace, label_selector=label_selector)
-                jobs.extend([self._deployment_to_dict(deployment) for deployment in deployment_list.items])
+                jobs.extend(self._list_workloads(K8sResourceType.DEPLOYMENT, self.apps_v1.list_namespaced_deployment,
+                                                 self._deployment_to_dict, self._raw_deployment_to_dict,
+                                                 namespace, label_selector=label_selector))
             except ApiException as e:
                 if e.status != 404:
                     raise
 
             try:
-                statefulset_list = self.apps_v1.list_namespaced_stateful_set(namespace, label_selector=label_selector)
-                jobs.extend([self._statefulset_to_dict(statefulset) for statefulset in statefulset_list.items])
+                jobs.extend(self._list_workloads(K8sResourceType.STATEFULSET, self.apps_v1.list_namespaced_stateful_set,
+                                                 self._statefulset_to_dict, self._raw_statefulset_to_dict,
+                                                 namespace, label_selector=label_selector))
             except ApiException as e:
                 if e.status != 404:
                     raise
@@ -254,19 +337,93 @@ class JobClient(KubernetesClient):
 
 
 
-    def _wait_for_resource_deletion(self, check_func, name: str, resource_type: str, timeout: int = 30, interval: float = 0.5) -> bool:
-        """等待资源删除完成（最多等待 timeout 秒）"""
-        import time
-        
-        start_time = time.time()
-        
-        while time.time() - start_time < timeout:
-            if not check_func(name):
+    def _deletion_api(self, resource_type: str):
+        """返回资源类型对应的 (read, list, delete) 函数"""
+        if resource_type == K8sResourceType.JOB:
+            return (self.batch_v1.read_namespaced_job, self.batch_v1.list_namespaced_job,
+                    self.batch_v1.delete_namespaced_job)
+        if resource_type == K8sResourceType.DEPLOYMENT:
+            return (self.apps_v1.read_namespaced_deployment, self.apps_v1.list_namespaced_deployment,
+                    self.apps_v1.delete_namespaced_deployment)
+        if resource_type == K8sResourceType.STATEFULSET:
+            return (self.apps_v1.read_namespaced_stateful_set, self.apps_v1.list_namespaced_stateful_set,
+                    self.apps_v1.delete_namespaced_stateful_set)
+        if resource_type == K8sResourceType.SERVICE:
+            return (self.core_v1.read_namespaced_service, self.core_v1.list_namespaced_service,
+                    self.core_v1.delete_namespaced_service)
+        raise ValueError(f"Unsupported resource type for deletion: {resource_type}")
+
+    def _wait_for_resource_deletion(self, resource_type: str, name: str, namespace: str = DEFAULT_NAMESPACE,
+                                    timeout: int = DELETE_TIMEOUT_SECONDS) -> bool:
+        """等待资源删除完成，返回是否在 timeout 秒内确认删除
+
+        先 read 获取 resourceVersion（404 表示已删除），再从该版本开始按
+        metadata.name 字段选择器 watch，收到 DELETED 事件即返回，不做轮询。
+        watch 被服务端关闭或 resourceVersion 过期时重新 read 后继续。
+        """
+        read_func, list_func, _ = self._deletion_api(resource_type)
+        deadline = time.monotonic() + timeout
+
+        while True:
+            try:
+                obj = read_func(name, namespace)
+            except ApiException as e:
+                if e.status == 404:
+                    return True
+                self.handle_api_exception(e, f"check {resource_type} existence {name}")
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+
+            w = watch.Watch()
+            try:
+                for event in w.stream(list_func, namespace,
+                                      field_selector=f"metadata.name={name}",
+                                      resource_version=obj.metadata.resource_version,
+                                      timeout_seconds=max(int(remaining), 1),
+                                      _request_timeout=remaining + 5):
+                    if event.get("type") == "DELETED":
+                        return True
+                    if event.get("type") == "ERROR":
+                        break
+            except ApiException as e:
+                if e.status != 410:
+                    self.handle_api_exception(e, f"watch {resource_type} {name}")
+            except Exception as e:
+                # 客户端读超时等网络异常：重新 read 确认状态
+                logger.debug(f"Watch on {resource_type} {name} interrupted: {e}")
+            finally:
+                w.stop()
+
+    def _delete_resources(self, resources: List[str], name: str, namespace: str,
+                          delete_options: client.V1DeleteOptions,
+                          timeout: int = DELETE_TIMEOUT_SECONDS) -> "DeletionHandle":
+        """并发下发多种资源的删除请求，并在后台并发 watch 已受理资源的删除完成"""
+        def issue(resource_type):
+            _, _, delete_func = self._deletion_api(resource_type)
+            try:
+                delete_func(name, namespace, body=delete_options)
                 return True
-            time.sleep(interval)
-        
-        return True
-    
+            except ApiException as e:
+                if e.status == 404:
+                    return False
+                self.handle_api_exception(e, f"delete {resource_type.lower()} {name}")
+
+        with ThreadPoolExecutor(max_workers=len(resources)) as executor:
+            accepted = [r for r, ok in zip(resources, executor.map(issue, resources)) if ok]
+
+        executor = ThreadPoolExecutor(max_workers=max(len(accepted), 1),
+                                      thread_name_prefix=f"gpuctl-delete-{name}")
+        futures = {
+            resource_type: executor.submit(self._wait_for_resource_deletion,
+                                           resource_type, name, namespace, timeout)
+            for resource_type in accepted
+        }
+        executor.shutdown(wait=False)
+
+        return DeletionHandle(name, namespace, futures)
+
     def _is_job_exists(self, name: str, namespace: str = DEFAULT_NAMESPACE) -> bool:
         """检查Job资源是否存在"""
         try:
@@ -311,8 +468,17 @@ class JobClient(KubernetesClient):
             self.handle_api_exception(e, f"check service existence {name}")
             return False
     
-    def delete_job(self, name: str, namespace: str = DEFAULT_NAMESPACE, force: bool = False) -> bool:
-        """删除作业资源，包括Job、Deployment、StatefulSet和相关Service"""
+    def delete_job(self, name: str, namespace: str = DEFAULT_NAMESPACE, force: bool = False,
+                   wait: bool = True) -> Union[bool, "DeletionHandle"]:
+        """删除作业资源，包括Job、Deployment、StatefulSet和相关Service
+
+        四个删除请求并发下发，随后并发 watch 各资源的 DELETED 事件。
+
+        - ``wait=True``：返回是否删除了作业（未找到返回 False）；
+          删除已受理但在超时内未确认完成时抛出 TimeoutError
+        - ``wait=False``：下发删除后立即返回 DeletionHandle，
+          其布尔值表示是否找到了作业，之后可通过 ``done()``/``result()`` 查询删除结果
+        """
         try:
             # 配置删除选项
             if force:
@@ -322,54 +488,27 @@ class JobClient(KubernetesClient):
                 )
             else:
                 delete_options = client.V1DeleteOptions(propagation_policy="Background")
-            
-            deleted = False
-            
-            # 1. 尝试删除Job资源
-            try:
-                self.batch_v1.delete_namespaced_job(name, namespace, body=delete_options)
-                # 等待Job删除完成
-                self._wait_for_resource_deletion(lambda n: self._is_job_exists(n, namespace), name, "Job")
-                deleted = True
-            except ApiException as e:
-                if e.status != 404:
-                    self.handle_api_exception(e, f"delete job {name}")
-            
-            # 2. 尝试删除Deployment资源
-            try:
-                self.apps_v1.delete_namespaced_deployment(name, namespace, body=delete_options)
-                # 等待Deployment删除完成
-                self._wait_for_resource_deletion(lambda n: self._is_deployment_exists(n, namespace), name, "Deployment")
-                deleted = True
-            except ApiException as e:
-                if e.status != 404:
-                    self.handle_api_exception(e, f"delete deployment {name}")
-            
-            # 3. 尝试删除StatefulSet资源
-            try:
-                self.apps_v1.delete_namespaced_stateful_set(name, namespace, body=delete_options)
-                # 等待StatefulSet删除完成
-                self._wait_for_resource_deletion(lambda n: self._is_statefulset_exists(n, namespace), name, "StatefulSet")
-                deleted = True
-            except ApiException as e:
-                if e.status != 404:
-                    self.handle_api_exception(e, f"delete statefulset {name}")
-            
-            # 4. 尝试删除相关Service（无论前面是否成功删除，都尝试删除Service）
-            try:
-                self.core_v1.delete_namespaced_service(name, namespace, body=delete_options)
-                # 等待Service删除完成
-                self._wait_for_resource_deletion(lambda n: self._is_service_exists(n, namespace), name, "Service")
-            except ApiException as e:
-                if e.status != 404:
-                    self.handle_api_exception(e, f"delete service {name}")
-            
-            return deleted
+
+            handle = self._delete_resources(
+                [K8sResourceType.JOB, K8sResourceType.DEPLOYMENT,
+                 K8sResourceType.STATEFULSET, K8sResourceType.SERVICE],
+                name, namespace, delete_options
+            )
+            # Service 单独存在不代表作业存在
+            handle.found = any(r != K8sResourceType.SERVICE for r in handle.resources)
+            if not wait:
+                return handle
+            if handle.found and not handle.result():
+                raise TimeoutError(
+                    f"Timed out waiting for job {name} to be deleted "
+                    f"(still present: {', '.join(handle.pending())})"
+                )
+            return handle.found
         except ApiException as e:
             if e.status == 404:
                 return False
             self.handle_api_exception(e, f"delete job {name}")
-    
+
     def delete_deployment(self, name: str, namespace: str = DEFAULT_NAMESPACE, force: bool = False) -> bool:
         """删除Deployment"""
         try:
@@ -385,8 +524,10 @@ class JobClient(KubernetesClient):
                 delete_options = client.V1DeleteOptions(propagation_policy="Background")
             
             self.apps_v1.delete_namespaced_deployment(name, namespace, body=delete_options)
-            # 等待Deployment删除完成
-            return self._wait_for_resource_deletion(lambda n: self._is_deployment_exists(n, namespace), name, "Deployment")
+            # watch 等待删除完成
+            if not self._wait_for_resource_deletion(K8sResourceType.DEPLOYMENT, name, namespace):
+                raise TimeoutError(f"Timed out waiting for {K8sResourceType.DEPLOYMENT.value} {name} to be deleted")
+            return True
         except ApiException as e:
             if e.status == 404:
                 return False
@@ -407,8 +548,10 @@ class JobClient(KubernetesClient):
                 delete_options = client.V1DeleteOptions(propagation_policy="Background")
             
             self.apps_v1.delete_namespaced_stateful_set(name, namespace, body=delete_options)
-            # 等待StatefulSet删除完成
-            return self._wait_for_resource_deletion(lambda n: self._is_statefulset_exists(n, namespace), name, "StatefulSet")
+            # watch 等待删除完成
+            if not self._wait_for_resource_deletion(K8sResourceType.STATEFULSET, name, namespace):
+                raise TimeoutError(f"Timed out waiting for {K8sResourceType.STATEFULSET.value} {name} to be deleted")
+            return True
         except ApiException as e:
             if e.status == 404:
                 return False
@@ -419,8 +562,10 @@ class JobClient(KubernetesClient):
         try:
             delete_options = client.V1DeleteOptions(propagation_policy="Background")
             self.core_v1.delete_namespaced_service(name, namespace, body=delete_options)
-            # 等待Service删除完成
-            return self._wait_for_resource_deletion(lambda n: self._is_service_exists(n, namespace), name, "Service")
+            # watch 等待删除完成
+            if not self._wait_for_resource_deletion(K8sResourceType.SERVICE, name, namespace):
+                raise TimeoutError(f"Timed out waiting for {K8sResourceType.SERVICE.value} {name} to be deleted")
+            return True
         except ApiException as e:
             if e.status == 404:
                 return False
@@ -668,6 +813,175 @@ class JobClient(KubernetesClient):
             }
         }
 
+    # ── 原始 JSON 快速路径：输出与上面的 *_to_dict 相同结构的字典 ──────────────
+
+    @staticmethod
+    def _raw_timestamp(value: Optional[str]) -> Optional[str]:
+        """把 RFC3339 时间字符串规范为与 datetime.isoformat() 相同的格式"""
+        if value and value.endswith("Z"):
+            return value[:-1] + "+00:00"
+        return value
+
+    @staticmethod
+    def _raw_containers(containers: Optional[List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """提取 containers 信息（与模型路径字段一致）"""
+        result = []
+        for container in containers or []:
+            container_dict = {
+                "name": container.get("name"),
+                "image": container.get("image"),
+            }
+            if container.get("command"):
+                container_dict["command"] = container["command"]
+            if container.get("args"):
+                container_dict["args"] = container["args"]
+            if container.get("env"):
+                container_dict["env"] = [
+                    {"name": env.get("name"), "value": env.get("value")}
+                    for env in container["env"] if env
+                ]
+            if "resources" in container:
+                resources = container["resources"] or {}
+                container_dict["resources"] = {
+                    "limits": resources.get("limits") or {},
+                    "requests": resources.get("requests") or {}
+                }
+            if container.get("ports"):
+                container_dict["ports"] = [
+                    {"containerPort": port.get("containerPort")}
+                    for port in container["ports"] if port
+                ]
+            result.append(container_dict)
+        return result
+
+    def _raw_pod_to_dict(self, pod: Dict[str, Any]) -> Dict[str, Any]:
+        """将原始 JSON 中的 Pod 转换为字典格式
+
+        conditions/container_statuses 以 RawObject 表示，可以像模型对象一样按属性读取。
+        """
+        metadata = pod.get("metadata") or {}
+        spec = pod.get("spec") or {}
+        status = pod.get("status") or {}
+        labels = dict(metadata.get("labels") or {})
+
+        if Labels.JOB_TYPE in labels:
+            job_type = labels[Labels.JOB_TYPE]
+        elif Labels.JOB_NAME in labels:
+            job_type = Kind.TRAINING
+        else:
+            job_type = Kind.INFERENCE
+
+        phase = status.get("phase")
+        creation_timestamp = self._raw_timestamp(metadata.get("creationTimestamp"))
+        pod_dict = {
+            "name": metadata.get("name"),
+            "namespace": metadata.get("namespace"),
+            "labels": labels,
+            "annotations": metadata.get("annotations") or {},
+            "creation_timestamp": creation_timestamp,
+            "start_time": self._raw_timestamp(status.get("startTime")) or creation_timestamp,
+            "completion_time": None,
+            "spec": {
+                "node_name": spec.get("nodeName"),
+                "containers": self._raw_containers(spec.get("containers"))
+            },
+            "status": {
+                "active": 1 if phase == "Running" else 0,
+                "succeeded": 1 if phase == "Succeeded" else 0,
+                "failed": 1 if phase == "Failed" else 0,
+                "phase": phase or "Unknown",
+                "conditions": [RawObject(c) for c in status.get("conditions") or []],
+                "container_statuses": [RawObject(cs) for cs in status.get("containerStatuses") or []],
+                "pod_ip": status.get("podIP")
+            }
+        }
+
+        if Labels.JOB_TYPE not in labels:
+            labels[Labels.JOB_TYPE] = job_type
+
+        return pod_dict
+
+    def _raw_job_to_dict(self, job: Dict[str, Any]) -> Dict[str, Any]:
+        """将原始 JSON 中的 Job 转换为字典"""
+        metadata = job.get("metadata") or {}
+        status = job.get("status") or {}
+        return {
+            "name": metadata.get("name"),
+            "namespace": metadata.get("namespace"),
+            "labels": metadata.get("labels") or {},
+            "annotations": metadata.get("annotations") or {},
+            "creation_timestamp": self._raw_timestamp(metadata.get("creationTimestamp")),
+            "start_time": self._raw_timestamp(status.get("startTime")),
+            "completion_time": self._raw_timestamp(status.get("completionTime")),
+            "status": {
+                "active": status.get("active") or 0,
+                "succeeded": status.get("succeeded") or 0,
+                "failed": status.get("failed") or 0
+            }
+        }
+
+    def _raw_deployment_to_dict(self, deployment: Dict[str, Any]) -> Dict[str, Any]:
+        """将原始 JSON 中的 Deployment 转换为字典"""
+        metadata = deployment.get("metadata") or {}
+        spec = deployment.get("spec") or {}
+        status = deployment.get("status") or {}
+
+        spec_dict = {}
+        template_spec = (spec.get("template") or {}).get("spec")
+        if template_spec:
+            spec_dict = {
+                "replicas": spec.get("replicas"),
+                "template": {
+                    "spec": {
+                        "containers": self._raw_containers(template_spec.get("containers"))
+                    }
+                }
+            }
+
+        creation_timestamp = self._raw_timestamp(metadata.get("creationTimestamp"))
+        return {
+            "name": metadata.get("name"),
+            "namespace": metadata.get("namespace"),
+            "labels": metadata.get("labels") or {},
+            "annotations": metadata.get("annotations") or {},
+            "creation_timestamp": creation_timestamp,
+            "start_time": creation_timestamp,
+            "completion_time": None,
+            "status": {
+                "active": status.get("readyReplicas") or 0,
+                "succeeded": 0,
+                "failed": status.get("unavailableReplicas") or 0,
+                "ready_replicas": status.get("readyReplicas") or 0,
+                "unavailable_replicas": status.get("unavailableReplicas") or 0,
+                "replicas": status.get("replicas") or 0
+            },
+            "spec": spec_dict
+        }
+
+    def _raw_statefulset_to_dict(self, statefulset: Dict[str, Any]) -> Dict[str, Any]:
+        """将原始 JSON 中的 StatefulSet 转换为字典"""
+        metadata = statefulset.get("metadata") or {}
+        status = statefulset.get("status") or {}
+        replicas = status.get("replicas") or 0
+        ready_replicas = status.get("readyReplicas") or 0
+        creation_timestamp = self._raw_timestamp(metadata.get("creationTimestamp"))
+        return {
+            "name": metadata.get("name"),
+            "namespace": metadata.get("namespace"),
+            "labels": metadata.get("labels") or {},
+            "annotations": metadata.get("annotations") or {},
+            "creation_timestamp": creation_timestamp,
+            "start_time": creation_timestamp,
+            "completion_time": None,
+            "status": {
+                "active": ready_replicas,
+                "succeeded": 0,
+                "failed": replicas - ready_replicas,
+                "ready_replicas": ready_replicas,
+                "replicas": replicas
+            }
+        }
+
     def create_deployment(self, deployment: client.V1Deployment, namespace: str = DEFAULT_NAMESPACE) -> Dict[str, Any]:
         """创建Deployment"""
         if not self._validate_namespace_quota(namespace):
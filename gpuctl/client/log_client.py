@@ -1,131 +1,125 @@
-from .base_client import KubernetesClient
+from concurrent.futures import ThreadPoolExecutor
+import re
+import threading
+from .base_client import KubernetesClient, K8S_LOOKUP_WORKERS
+from .log_merge import LogCursor, merge_pod_logs, merge_log_streams, tag_line
 from kubernetes.client.rest import ApiException
 from kubernetes.stream import stream
-from typing import List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 import time
-from gpuctl.constants import Labels, DEFAULT_NAMESPACE, NS_LABEL_SELECTOR
+from gpuctl.constants import Labels, K8sResourceType, DEFAULT_NAMESPACE
+
+# Kubernetes 标签值：至多 63 个字符，字母数字开头和结尾，中间可含 -_.
+_LABEL_VALUE_RE = re.compile(r"^(([A-Za-z0-9][-A-Za-z0-9_.]*)?[A-Za-z0-9])?$")
+_LABEL_VALUE_MAX_LENGTH = 63
 
 
 class LogClient(KubernetesClient):
     """日志管理客户端"""
     
-    def _get_all_gpuctl_namespaces(self) -> List[str]:
-        """获取所有gpuctl管理的namespace，包括default和带有runwhere.ai标签的namespace"""
-        namespaces = set()
-        
-        # 始终包含default命名空间
-        namespaces.add("default")
-        
-        try:
-            # 获取带有runwhere.ai/namespace标签的命名空间
-            labeled_ns = self.core_v1.list_namespace(
-                label_selector=NS_LABEL_SELECTOR
-            )
-            for ns in labeled_ns.items:
-                namespaces.add(ns.metadata.name)
-            
-            # 扫描所有命名空间查找带有runwhere.ai标签的资源
-            all_ns = self.core_v1.list_namespace()
-            for ns in all_ns.items:
-                ns_name = ns.metadata.name
-                
-                # 检查该命名空间下的job（使用 key 存在性检查，runwhere.ai/job-type 是所有 gpuctl 资源的必有标签）
-                try:
-                    jobs = self.batch_v1.list_namespaced_job(ns_name, label_selector=Labels.JOB_TYPE)
-                    if jobs.items:
-                        namespaces.add(ns_name)
-                        continue
-                except ApiException:
-                    pass
-                
-                # 检查该命名空间下的deployment
-                try:
-                    deployments = self.apps_v1.list_namespaced_deployment(ns_name, label_selector=Labels.JOB_TYPE)
-                    if deployments.items:
-                        namespaces.add(ns_name)
-                        continue
-                except ApiException:
-                    pass
-                
-                # 检查该命名空间下的statefulset
-                try:
-                    statefulsets = self.apps_v1.list_namespaced_stateful_set(ns_name, label_selector=Labels.JOB_TYPE)
-                    if statefulsets.items:
-                        namespaces.add(ns_name)
-                except ApiException:
-                    pass
-        
-        except ApiException as e:
-            self.handle_api_exception(e, "list namespaces")
-        
-        return list(namespaces)
-    
-    def _get_job_pods(self, job_name: str, namespace: str = DEFAULT_NAMESPACE):
-        """获取Job关联的所有Pod"""
-        def _try_get_in_namespace(ns: str):
-            """在指定命名空间中尝试获取Job关联的Pod"""
-            # 首先尝试直接将job_name作为Pod名称返回
-            try:
-                pod = self.core_v1.read_namespaced_pod(job_name, ns)
-                return [pod]
-            except ApiException as e:
-                if e.status != 404:
-                    self.handle_api_exception(e, f"check pod {job_name}")
-            
-            # 简化标签选择器，只使用基础名称和标准标签
-            base_name = job_name
-            if "-" in job_name:
-                # 如果是Pod名称，去掉后缀获取基础名称
-                parts = job_name.split("-")
-                if len(parts) >= 3:
-                    # 格式：base-name-deployment-hash-pod-suffix
-                    base_name = "-".join(parts[:-2])
-            
-            selectors = [
-                f"job-name={job_name}",
-                f"app={job_name}",
-                f"job-name={base_name}",
-                f"app={base_name}",
-                f"app.kubernetes.io/name={base_name}",
-                f"app.kubernetes.io/instance={base_name}"
-            ]
-            
-            for selector in selectors:
-                try:
-                    pods = self.core_v1.list_namespaced_pod(
-                        namespace=ns,
-                        label_selector=selector
-                    )
-                    if pods.items:
-                        return pods.items
-                except ApiException as e:
-                    if e.status != 404:
-                        print(f"Warning: Failed to get pods with selector {selector}: {e}")
-            
-            # 当前命名空间中未找到pods
+    def _get_job_pods(self, job_name: str, namespace: str = DEFAULT_NAMESPACE, search_all: bool = True):
+        """获取Job关联的所有Pod
+
+        按 gpuctl 工作负载的标签匹配：训练任务的 Pod 带 job-name（Job 控制器添加），
+        其他类型带 app。job_name 也可以是 Pod 名，此时再尝试由 Pod 名推断的基础名称；
+        与逐个选择器查找的顺序相同，依次为 job-name=全名、app=全名、job-name=基础名、
+        app=基础名，先命中者为准。命名空间 watch 运行时由注册表直接定位工作负载，
+        只发一次请求；否则每个命名空间至多两次带集合选择器的 list。
+        search_all=False 时只在 namespace 中查找，不搜索其他命名空间
+        """
+        # 不是合法标签值的候选名（如过长的 Pod 名）不可能出现在标签上，放进选择器反而会导致 400
+        names = [name for name in self._job_name_candidates(job_name) if self._is_label_value(name)]
+        if not names:
             return []
-        
-        # 1. 优先在指定命名空间中查找
-        pods = _try_get_in_namespace(namespace)
-        if pods:
-            return pods
-        
-        # 2. 如果在指定命名空间中未找到，搜索所有gpuctl管理的命名空间
-        all_namespaces = self._get_all_gpuctl_namespaces()
-        for ns in all_namespaces:
-            if ns == namespace:
-                continue  # 跳过已经检查过的命名空间
-            
-            pods = _try_get_in_namespace(ns)
+
+        from .namespace_registry import NamespaceRegistry
+        registry = NamespaceRegistry._instance
+        if registry is not None and registry.is_watching():
+            pods = self._get_registered_job_pods(registry, names, namespace, search_all)
             if pods:
                 return pods
-        
-        # 所有命名空间中都未找到pods
-        return []
+
+        def _list(ns: str, key: str) -> List[Any]:
+            try:
+                pods = self.core_v1.list_namespaced_pod(
+                    namespace=ns, label_selector=f"{key} in ({','.join(names)})")
+            except ApiException as e:
+                if e.status == 404:
+                    return []
+                self.handle_api_exception(e, f"list pods for job {job_name}")
+            return pods.items
+
+        def _try_get_in_namespace(ns: str):
+            """在指定命名空间中按 job-name、app 各一次集合选择器 list，全名优先于基础名称"""
+            listed: Dict[str, List[Any]] = {}
+            for name in names:
+                for key in (Labels.JOB_NAME, Labels.APP):
+                    if key not in listed:
+                        listed[key] = _list(ns, key)
+                    pods = self._pods_with_label(listed[key], key, name)
+                    if pods:
+                        return pods
+            return []
+
+        if not search_all:
+            return _try_get_in_namespace(namespace)
+
+        # 优先在指定命名空间中查找，未找到时并发搜索其余gpuctl管理的命名空间
+        pods = self._find_in_namespaces(lambda ns: _try_get_in_namespace(ns) or None, namespace)
+        return pods or []
+
+    @staticmethod
+    def _job_name_candidates(job_name: str) -> List[str]:
+        """可能的工作负载名：名称本身，以及 Pod 名（base-name-hash-suffix）去掉后缀的基础名称"""
+        names = [job_name]
+        parts = job_name.split("-")
+        if len(parts) >= 3:
+            names.append("-".join(parts[:-2]))
+        return names
+
+    @staticmethod
+    def _is_label_value(value: str) -> bool:
+        return 0 < len(value) <= _LABEL_VALUE_MAX_LENGTH and bool(_LABEL_VALUE_RE.match(value))
+
+    @staticmethod
+    def _pods_with_label(pods: List[Any], key: str, name: str) -> List[Any]:
+        return [pod for pod in pods if (pod.metadata.labels or {}).get(key) == name]
+
+    def _get_registered_job_pods(self, registry, names: List[str], namespace: str,
+                                 search_all: bool) -> List[Any]:
+        """由注册表定位工作负载所在命名空间和类型，只发一次带标签选择器的 list
+
+        多个工作负载匹配时按指定命名空间、全名、Job 的顺序选出一个，与逐个命名空间查找的结果一致。
+        """
+        candidates = [(kind, ns, name) for kind, ns, name in registry.find_workloads(names)
+                      if search_all or ns == namespace]
+        if not candidates:
+            return []
+        kind, ns, name = min(candidates, key=lambda c: (
+            c[1] != namespace, names.index(c[2]), c[0] != K8sResourceType.JOB, c[1]))
+        key = Labels.JOB_NAME if kind == K8sResourceType.JOB else Labels.APP
+        try:
+            pods = self.core_v1.list_namespaced_pod(namespace=ns, label_selector=f"{key}={name}")
+        except ApiException as e:
+            self.handle_api_exception(e, f"list pods for job {names[0]}")
+        return pods.items
+
+    def _get_log_pods(self, job_name: str, namespace: str = DEFAULT_NAMESPACE) -> List[Any]:
+        """作业中可以读取日志的全部 Pod（Pending 的 Pod 还没有日志）"""
+        pods = self._get_job_pods(job_name, namespace)
+        return [pod for pod in pods if not (pod.status and pod.status.phase == "Pending")]
 
     def get_job_logs(self, job_name: str, namespace: str = DEFAULT_NAMESPACE,
-                     tail: int = 100, pod_name: Optional[str] = None) -> List[str]:
-        """获取任务日志"""
+                     tail: int = 100, pod_name: Optional[str] = None,
+                     all_pods: bool = False) -> List[str]:
+        """获取任务日志
+
+        all_pods=True 时并发读取作业全部 Pod 的最近 tail 行（每个 Pod 各 tail 行），
+        按时间戳合并，每行以 [Pod 名] 开头。
+        """
+        if all_pods and not pod_name:
+            return self._get_merged_job_logs(job_name, namespace, tail)
+
         def _try_get_logs_in_namespace(ns: str, pod: Optional[str] = None):
             """在指定命名空间中尝试获取日志"""
             try:
@@ -146,7 +140,7 @@ class LogClient(KubernetesClient):
                         if e.status != 404:
                             self.handle_api_exception(e, f"get logs for pod {job_name}")
                         # 如果直接获取失败，尝试找到Job关联的Pod
-                        pods = self._get_job_pods(job_name, ns)
+                        pods = self._get_job_pods(job_name, ns, search_all=False)
                         if not pods:
                             return None
                         pod = pods[0].metadata.name
@@ -169,101 +163,178 @@ class LogClient(KubernetesClient):
                 return None
         
         try:
-            # 1. 优先在指定命名空间中查找
-            logs = _try_get_logs_in_namespace(namespace, pod_name)
+            # 优先在指定命名空间中查找，未找到时并发搜索其余gpuctl管理的命名空间
+            logs = self._find_in_namespaces(lambda ns: _try_get_logs_in_namespace(ns, pod_name), namespace)
             if logs is not None:
                 return logs
-            
-            # 2. 如果在指定命名空间中未找到，搜索所有gpuctl管理的命名空间
-            all_namespaces = self._get_all_gpuctl_namespaces()
-            for ns in all_namespaces:
-                if ns == namespace:
-                    continue  # 跳过已经检查过的命名空间
-                
-                logs = _try_get_logs_in_namespace(ns, pod_name)
-                if logs is not None:
-                    return logs
-            
+
             # 所有命名空间中都未找到日志
             return ["No pods found for this job"]
 
         except ApiException as e:
             self.handle_api_exception(e, f"get logs for job {job_name}")
 
-    def stream_job_logs(self, job_name: str, namespace: str = DEFAULT_NAMESPACE,
-                        pod_name: Optional[str] = None):
-        """流式获取任务日志（生成器）"""
-        def _try_stream_in_namespace(ns: str, pod: Optional[str] = None):
-            """在指定命名空间中尝试流式获取日志"""
+    def _get_merged_job_logs(self, job_name: str, namespace: str, tail: int) -> List[str]:
+        try:
+            pods = self._get_log_pods(job_name, namespace)
+        except ApiException as e:
+            self.handle_api_exception(e, f"get pods for job {job_name}")
+        if not pods:
+            return ["No pods found for this job"]
+
+        def read(pod):
             try:
-                target_pod = pod
-                # 如果未指定Pod，先尝试直接将job_name作为Pod名称
-                if not target_pod:
-                    try:
-                        # 尝试直接将job_name作为Pod名称获取
-                        # 先检查Pod是否存在
-                        self.core_v1.read_namespaced_pod(job_name, ns)
-                        target_pod = job_name
-                    except ApiException as e:
-                        if e.status != 404:
-                            yield f"Error checking pod {job_name}: {e}"
-                            return
-                        # 如果直接获取失败，尝试找到Job关联的Pod
-                        pods = self._get_job_pods(job_name, ns)
-                        if not pods:
-                            return
-                        target_pod = pods[0].metadata.name
-
-                # 使用Kubernetes API获取流式日志
-                try:
-                    # 使用stream方法获取日志
-                    logs = self.core_v1.read_namespaced_pod_log(
-                        name=target_pod,
-                        namespace=ns,
-                        follow=True,
-                        timestamps=True,
-                        _preload_content=False
-                    )
-                    
-                    for line in logs:
-                        if line:
-                            yield line.decode('utf-8').strip()
-                    logs.close()
-                    return
-                except ApiException as e:
-                    if e.status == 404:
-                        return
-                    yield f"Error streaming logs: {e}"
-                    return
-            except Exception as e:
-                yield f"Error streaming logs: {e}"
-                return
-        
-        # 1. 优先在指定命名空间中查找
-        found = False
-        for log in _try_stream_in_namespace(namespace, pod_name):
-            yield log
-            found = True
-        
-        if found:
+                log_content = self.core_v1.read_namespaced_pod_log(
+                    name=pod.metadata.name,
+                    namespace=pod.metadata.namespace,
+                    tail_lines=tail,
+                    timestamps=True
+                )
+                return log_content.strip().split('\n') if log_content else []
+            except ApiException as e:
+                return [f"Error getting logs: {e.reason or e.status}"]
+
+        with ThreadPoolExecutor(max_workers=min(K8S_LOOKUP_WORKERS, len(pods))) as executor:
+            logs = executor.map(read, pods)
+            return merge_pod_logs({pod.metadata.name: lines for pod, lines in zip(pods, logs)})
+
+    def _stream_merged_job_logs(self, job_name: str, namespace: str):
+        try:
+            log_stream = self.follow_logs(job_name, namespace, all_pods=True, tail=None)
+        except FileNotFoundError:
+            yield "No pods found for this job"
             return
-        
-        # 2. 如果在指定命名空间中未找到，搜索所有gpuctl管理的命名空间
-        all_namespaces = self._get_all_gpuctl_namespaces()
-        for ns in all_namespaces:
-            if ns == namespace:
-                continue  # 跳过已经检查过的命名空间
-            
-            found = False
-            for log in _try_stream_in_namespace(ns, pod_name):
-                yield log
-                found = True
-            
-            if found:
+        except Exception as e:
+            yield f"Error streaming logs: {e}"
+            return
+
+        for pod, line in log_stream:
+            yield tag_line(pod, line)
+
+    def follow_logs(self, job_name: str, namespace: str = DEFAULT_NAMESPACE,
+                    pod_name: Optional[str] = None, all_pods: bool = False,
+                    cursors: Optional[Dict[str, LogCursor]] = None,
+                    tail: Optional[int] = 100) -> "LogStream":
+        """定位要跟随的 Pod 并返回 LogStream（迭代时才打开上游连接）
+
+        默认跟随单个 Pod（pod_name，或 job_name 本身/作业的第一个 Pod），all_pods=True 时
+        跟随作业全部 Pod。cursors 为 Pod 名 -> LogCursor，有游标的 Pod 从游标之后继续，
+        其余 Pod 先输出最近 tail 行。未找到 Pod 时抛出 FileNotFoundError。
+        """
+        pods = self.resolve_log_pods(job_name, namespace, pod_name, all_pods)
+        return LogStream(self, pods, cursors or {}, tail)
+
+    def resolve_log_pods(self, job_name: str, namespace: str = DEFAULT_NAMESPACE,
+                         pod_name: Optional[str] = None, all_pods: bool = False) -> List[Tuple[str, str]]:
+        """确定要跟随日志的 Pod，返回 [(命名空间, Pod 名)]；未找到时抛出 FileNotFoundError"""
+        if all_pods and not pod_name:
+            pods = [(pod.metadata.namespace, pod.metadata.name)
+                    for pod in self._get_log_pods(job_name, namespace)]
+        else:
+            target = self._locate_log_pod(job_name, namespace, pod_name)
+            pods = [target] if target else []
+        if not pods:
+            raise FileNotFoundError(f"No pods found for job {job_name}")
+        return pods
+
+    def _locate_log_pod(self, job_name: str, namespace: str,
+                        pod_name: Optional[str] = None) -> Optional[Tuple[str, str]]:
+        """并发定位要读取日志的 Pod，返回 (命名空间, Pod 名)，未找到返回 None"""
+        return self._find_in_namespaces(
+            lambda ns: self._locate_in_namespace(job_name, ns, pod_name), namespace)
+
+    def _locate_in_namespace(self, job_name: str, ns: str,
+                             pod_name: Optional[str] = None) -> Optional[Tuple[str, str]]:
+        """在单个命名空间中定位日志 Pod：直接读取同名 Pod，未命中时按标签列出作业的 Pod
+
+        作业有多个 Pod 时优先 Running 的 Pod。每一步都是单个对象读取或带标签选择器的 list，
+        请求数与命名空间中的 Pod 总数无关。
+        """
+        try:
+            self.core_v1.read_namespaced_pod(pod_name or job_name, ns)
+            return ns, pod_name or job_name
+        except ApiException as e:
+            if e.status != 404:
+                raise
+        if pod_name:
+            return None
+        # 如果直接获取失败，尝试找到Job关联的Pod
+        pods = self._get_job_pods(job_name, ns, search_all=False)
+        if not pods:
+            return None
+        running = [pod for pod in pods if pod.status and pod.status.phase == "Running"]
+        return ns, (running or pods)[0].metadata.name
+
+    def namespace_exists(self, namespace: str) -> bool:
+        """命名空间是否存在；无权读取命名空间等其他错误时视为存在，由后续请求报告"""
+        try:
+            self.core_v1.read_namespace(namespace)
+            return True
+        except ApiException as e:
+            return e.status != 404
+
+    def locate_log_pod(self, job_name: str, namespace: str = DEFAULT_NAMESPACE) -> Optional[Tuple[str, str]]:
+        """定位 job_name（Pod 名或作业名）的日志 Pod，返回 (命名空间, Pod 名)，未找到返回 None
+
+        先在 namespace 中查找；命中即说明命名空间存在，不再单独读取命名空间。
+        未命中时才确认命名空间是否存在（不存在时抛出 FileNotFoundError），
+        再并发搜索其余受管命名空间。
+        """
+        target = self._locate_in_namespace(job_name, namespace)
+        if target is not None:
+            return target
+        if not self.namespace_exists(namespace):
+            raise FileNotFoundError(f"Namespace '{namespace}' not found")
+        return self._find_in_namespaces(
+            lambda ns: None if ns == namespace else self._locate_in_namespace(job_name, ns))
+
+    def stream_job_logs(self, job_name: str, namespace: str = DEFAULT_NAMESPACE,
+                        pod_name: Optional[str] = None, all_pods: bool = False):
+        """流式获取任务日志（生成器）
+
+        all_pods=True 时每个 Pod 一个跟随流并发读取，按时间戳合并输出，每行以 [Pod 名] 开头。
+        """
+        if all_pods and not pod_name:
+            yield from self._stream_merged_job_logs(job_name, namespace)
+            return
+
+        # 先并发定位Pod所在的命名空间（首个命中即返回），再开始流式读取
+        try:
+            target = self._locate_log_pod(job_name, namespace, pod_name)
+        except ApiException as e:
+            yield f"Error checking pod {pod_name or job_name}: {e}"
+            return
+        except Exception as e:
+            yield f"Error streaming logs: {e}"
+            return
+
+        if target is None:
+            # 所有命名空间中都未找到日志
+            yield "No pods found for this job"
+            return
+
+        ns, target_pod = target
+        try:
+            # 使用Kubernetes API获取流式日志
+            logs = self.core_v1.read_namespaced_pod_log(
+                name=target_pod,
+                namespace=ns,
+                follow=True,
+                timestamps=True,
+                _preload_content=False
+            )
+
+            for line in logs:
+                if line:
+                    yield line.decode('utf-8').strip()
+            logs.close()
+        except ApiException as e:
+            if e.status == 404:
+                yield "No pods found for this job"
                 return
-        
-        # 所有命名空间中都未找到日志
-        yield "No pods found for this job"
+            yield f"Error streaming logs: {e}"
+        except Exception as e:
+            yield f"Error streaming logs: {e}"
 
     def get_pod_logs(self, pod_name: str, namespace: str = DEFAULT_NAMESPACE,
                      container: Optional[str] = None, tail: int = 100) -> List[str]:
@@ -288,24 +359,87 @@ class LogClient(KubernetesClient):
                 return None
         
         try:
-            # 1. 优先在指定命名空间中查找
-            logs = _try_get_logs_in_namespace(namespace)
+            # 优先在指定命名空间中查找，未找到时并发搜索其余gpuctl管理的命名空间
+            logs = self._find_in_namespaces(_try_get_logs_in_namespace, namespace)
             if logs is not None:
                 return logs
-            
-            # 2. 如果在指定命名空间中未找到，搜索所有gpuctl管理的命名空间
-            all_namespaces = self._get_all_gpuctl_namespaces()
-            for ns in all_namespaces:
-                if ns == namespace:
-                    continue  # 跳过已经检查过的命名空间
-                
-                logs = _try_get_logs_in_namespace(ns)
-                if logs is not None:
-                    return logs
-            
+
             # 所有命名空间中都未找到日志
             return ["Pod not found in any gpuctl-managed namespace"]
 
         except ApiException as e:
             self.handle_api_exception(e, f"get logs for pod {pod_name}")
 
+
+class LogStream:
+    """一次日志跟随：迭代产出 (Pod 名, 行)
+
+    每个 Pod 一个 follow 连接，多个 Pod 时按时间戳合并。每个 Pod 的位置记录在
+    cursors 中（随迭代前进），可用于断线后续读。close() 可从任意线程调用，
+    关闭全部上游连接，迭代随之结束。
+    """
+
+    def __init__(self, client: LogClient, pods: List[Tuple[str, str]],
+                 cursors: Dict[str, LogCursor], tail: Optional[int] = 100):
+        self.client = client
+        self.pods = pods
+        self.cursors = {name: cursors.get(name) or LogCursor() for _, name in pods}
+        self._resume = {name for name in cursors if name in self.cursors}
+        self.tail = tail
+        self._responses: List[Any] = []
+        self._closed = threading.Event()
+
+    def _follow(self, namespace: str, pod_name: str) -> Iterable[str]:
+        kwargs = {}
+        if pod_name in self._resume:
+            kwargs["since_seconds"] = self.cursors[pod_name].since_seconds()
+        elif self.tail is not None:
+            kwargs["tail_lines"] = self.tail
+        response = self.client.core_v1.read_namespaced_pod_log(
+            name=pod_name,
+            namespace=namespace,
+            follow=True,
+            timestamps=True,
+            _preload_content=False,
+            **kwargs
+        )
+        self._responses.append(response)
+        if self._closed.is_set():
+            response.close()
+            return
+
+        def lines():
+            for line in response:
+                line = line.decode('utf-8', errors='replace').rstrip('\r\n')
+                if line:
+                    yield line
+
+        if pod_name in self._resume:
+            yield from self.cursors[pod_name].after(lines())
+        else:
+            yield from lines()
+
+    def __iter__(self):
+        try:
+            if len(self.pods) == 1:
+                namespace, pod_name = self.pods[0]
+                items = ((pod_name, line) for line in self._follow(namespace, pod_name))
+            else:
+                items = merge_log_streams({
+                    pod_name: self._follow(namespace, pod_name) for namespace, pod_name in self.pods
+                })
+            for pod_name, line in items:
+                if self._closed.is_set():
+                    return
+                self.cursors[pod_name].advance(line)
+                yield pod_name, line
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        self._closed.set()
+        for response in list(self._responses):
+            try:
+                response.close()
+            except Exception:
+                pass
@@ -0,0 +1,169 @@
+import heapq
+import math
+import os
+import queue
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+
+# 多 Pod 跟随日志时每行的重排窗口（秒）：行在窗口内等待更早时间戳的行到达后再输出
+LOG_MERGE_WINDOW_SECONDS = float(os.getenv('LOG_MERGE_WINDOW_SECONDS', '0.5'))
+
+# 断线续读时额外回溯的秒数，容忍 API Server 与节点之间的时钟偏差
+_RESUME_MARGIN_SECONDS = 5
+
+# 时间戳小数部分补齐到纳秒，使 RFC3339Nano 变长的小数可以直接比较
+_FRACTION_DIGITS = 9
+
+
+def timestamp_key(line: str) -> str:
+    """由 timestamps=True 的日志行前缀得到可排序的 key，没有时间戳时返回空串
+
+    kubelet 输出 RFC3339Nano（UTC，小数位去掉末尾的 0），如
+    2024-05-01T08:00:00.12Z message；补齐小数位后按字符串比较即为时间顺序。
+    """
+    timestamp, sep, _ = line.partition(" ")
+    if not sep or not timestamp.endswith("Z") or "T" not in timestamp:
+        return ""
+    seconds, _, fraction = timestamp[:-1].partition(".")
+    if fraction and not fraction.isdigit():
+        return ""
+    return f"{seconds}.{fraction.ljust(_FRACTION_DIGITS, '0')}"
+
+
+def tag_line(pod_name: str, line: str) -> str:
+    return f"[{pod_name}] {line}"
+
+
+def merge_pod_logs(logs_by_pod: Dict[str, List[str]]) -> List[str]:
+    """把多个 Pod 的日志按时间戳合并为一个列表，每行带 Pod 名前缀
+
+    没有时间戳的行沿用同一 Pod 上一行的时间，保持在原来的位置；时间相同的行
+    保持 Pod 的先后顺序和各自的行序。
+    """
+    entries: List[Tuple[str, str]] = []
+    for pod_name, lines in logs_by_pod.items():
+        last_key = ""
+        for line in lines:
+            key = timestamp_key(line) or last_key
+            last_key = key
+            entries.append((key, tag_line(pod_name, line)))
+    entries.sort(key=lambda entry: entry[0])
+    return [line for _, line in entries]
+
+
+def merge_log_streams(streams: Dict[str, Iterable[str]],
+                      window: float = LOG_MERGE_WINDOW_SECONDS,
+                      clock: Callable[[], float] = time.monotonic) -> Iterable[Tuple[str, str]]:
+    """并发读取多个 Pod 的日志流，按时间戳合并输出 (Pod 名, 行)（生成器）
+
+    每个流由一个后台线程读取并放入队列；合并端把收到的行放进按时间戳排序的堆，
+    一行到达后最多等待 window 秒，让其他 Pod 稍晚到达但时间更早的行排到它前面。
+    所有流结束后输出剩余的行。流的关闭由调用方负责（关闭底层响应即可让读取线程退出）。
+    """
+    lines: "queue.Queue[Tuple[str, object]]" = queue.Queue()
+    done = object()
+
+    def pump(pod_name: str, stream: Iterable[str]) -> None:
+        try:
+            for line in stream:
+                lines.put((pod_name, line))
+        except Exception as e:
+            lines.put((pod_name, f"Error streaming logs: {e}"))
+        finally:
+            lines.put((pod_name, done))
+
+    for pod_name, stream in streams.items():
+        threading.Thread(target=pump, args=(pod_name, stream), daemon=True,
+                         name=f"log-merge-{pod_name}").start()
+
+    active = len(streams)
+    # (时间戳 key, 到达序号, 到达时间, Pod 名, 行)
+    heap: List[Tuple[str, int, float, str, str]] = []
+    last_keys: Dict[str, str] = {}
+    seq = 0
+    while active or heap:
+        timeout = None
+        if heap:
+            timeout = max(heap[0][2] + window - clock(), 0)
+        if active:
+            try:
+                pod_name, line = lines.get(timeout=timeout)
+            except queue.Empty:
+                pass
+            else:
+                if line is done:
+                    active -= 1
+                else:
+                    # 非文本项（如调用方插入的标记）沿用该 Pod 上一行的位置
+                    key = (timestamp_key(line) if isinstance(line, str) else "") or last_keys.get(pod_name, "")
+                    last_keys[pod_name] = key
+                    heapq.heappush(heap, (key, seq, clock(), pod_name, line))
+                    seq += 1
+
+        now = clock()
+        while heap and (not active or now - heap[0][2] >= window):
+            _, _, _, pod_name, line = heapq.heappop(heap)
+            yield pod_name, line
+
+
+class LogCursor:
+    """单个 Pod 日志流中的位置：最后送出一行的时间戳，以及该时间戳下已送出的行数
+
+    令牌格式为 ``<pod>/<RFC3339Nano 时间戳>/<行数>``，随每行日志下发给客户端；
+    重连时带回令牌即可从该位置之后继续。读取日志的 API 只支持按秒回溯
+    （since_seconds），因此多回溯一段时间，再由 after() 丢弃游标及之前的行，
+    同一纳秒时间戳下的多行按行数跳过，既不丢行也不重复。
+    """
+
+    __slots__ = ("timestamp", "count")
+
+    def __init__(self, timestamp: str = "", count: int = 0):
+        self.timestamp = timestamp
+        self.count = count
+
+    @classmethod
+    def parse(cls, token: str) -> Tuple[str, "LogCursor"]:
+        """解析令牌，返回 (Pod 名, 游标)；格式错误时抛出 ValueError"""
+        pod_name, timestamp, count = token.split("/")
+        if not pod_name or not timestamp_key(f"{timestamp} "):
+            raise ValueError(f"Invalid log cursor: {token}")
+        return pod_name, cls(timestamp, int(count))
+
+    def token(self, pod_name: str) -> str:
+        return f"{pod_name}/{self.timestamp}/{self.count}"
+
+    def advance(self, line: str) -> None:
+        """记录一行已送出"""
+        if not timestamp_key(line):
+            return
+        timestamp = line.partition(" ")[0]
+        if timestamp == self.timestamp:
+            self.count += 1
+        else:
+            self.timestamp = timestamp
+            self.count = 1
+
+    def since_seconds(self, now: Optional[float] = None) -> int:
+        """覆盖游标位置所需的 since_seconds（含 _RESUME_MARGIN_SECONDS 的时钟偏差余量）"""
+        started = datetime.strptime(self.timestamp[:19], "%Y-%m-%dT%H:%M:%S").replace(tzinfo=timezone.utc)
+        now = time.time() if now is None else now
+        return max(int(math.ceil(now - started.timestamp())), 0) + _RESUME_MARGIN_SECONDS
+
+    def after(self, lines: Iterable[str]) -> Iterable[str]:
+        """丢弃游标及之前的行，之后的行原样输出"""
+        cursor_key, count = timestamp_key(f"{self.timestamp} "), self.count
+        skipped = 0
+        passed = False
+        for line in lines:
+            if not passed:
+                key = timestamp_key(line)
+                if key and key < cursor_key:
+                    continue
+                if key == cursor_key and skipped < count:
+                    skipped += 1
+                    continue
+                passed = True
+            yield line
@@ -0,0 +1,100 @@
+from typing import Any, Dict, List, Optional
+
+
+# 只取元数据的列表投影，apiserver 不支持时回退为普通 JSON（解析时同样只读取 metadata）
+METADATA_LIST_ACCEPT = "application/json;as=PartialObjectMetadataList;g=meta.k8s.io;v=v1, application/json"
+
+# 支持元数据列表的资源：复数名 -> (API 路径前缀, 是否命名空间级)
+METADATA_RESOURCES = {
+    "namespaces": ("/api/v1", False),
+    "nodes": ("/api/v1", False),
+    "pods": ("/api/v1", True),
+    "services": ("/api/v1", True),
+    "resourcequotas": ("/api/v1", True),
+    "jobs": ("/apis/batch/v1", True),
+    "deployments": ("/apis/apps/v1", True),
+    "statefulsets": ("/apis/apps/v1", True),
+}
+
+
+class ObjectMetadata:
+    """轻量的对象元数据记录（名称、命名空间、标签、注解）"""
+
+    __slots__ = ("name", "namespace", "uid", "labels", "annotations",
+                 "resource_version", "creation_timestamp")
+
+    def __init__(self, name: str, namespace: Optional[str] = None, uid: Optional[str] = None,
+                 labels: Optional[Dict[str, str]] = None, annotations: Optional[Dict[str, str]] = None,
+                 resource_version: Optional[str] = None, creation_timestamp: Optional[str] = None):
+        self.name = name
+        self.namespace = namespace
+        self.uid = uid
+        self.labels = labels or {}
+        self.annotations = annotations or {}
+        self.resource_version = resource_version
+        self.creation_timestamp = creation_timestamp
+
+    @classmethod
+    def from_dict(cls, meta: Dict[str, Any]) -> "ObjectMetadata":
+        return cls(
+            name=meta.get("name"),
+            namespace=meta.get("namespace"),
+            uid=meta.get("uid"),
+            labels=meta.get("labels"),
+            annotations=meta.get("annotations"),
+            resource_version=meta.get("resourceVersion"),
+            creation_timestamp=meta.get("creationTimestamp"),
+        )
+
+    def __repr__(self) -> str:
+        if self.namespace:
+            return f"ObjectMetadata({self.namespace}/{self.name})"
+        return f"ObjectMetadata({self.name})"
+
+
+class PartialObjectMetadata:
+    """对应 meta.k8s.io/v1 PartialObjectMetadata，只有 metadata 字段"""
+
+    __slots__ = ("metadata",)
+
+    def __init__(self, metadata: ObjectMetadata):
+        self.metadata = metadata
+
+
+class ListMetadata:
+    """列表元数据，属性名与 V1ListMeta 一致"""
+
+    __slots__ = ("resource_version", "_continue", "remaining_item_count")
+
+    def __init__(self, resource_version: Optional[str] = None, _continue: Optional[str] = None,
+                 remaining_item_count: Optional[int] = None):
+        self.resource_version = resource_version
+        self._continue = _continue
+        self.remaining_item_count = remaining_item_count
+
+
+class PartialObjectMetadataList:
+    """对应 meta.k8s.io/v1 PartialObjectMetadataList
+
+    结构与 V1PodList 等列表对象相同（``.items[i].metadata.name``、``.metadata._continue``），
+    只读取名称/标签的调用方可以直接替换原有的 list_xxx 调用。
+    """
+
+    __slots__ = ("metadata", "items")
+
+    def __init__(self, metadata: ListMetadata, items: List[PartialObjectMetadata]):
+        self.metadata = metadata
+        self.items = items
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "PartialObjectMetadataList":
+        list_meta = data.get("metadata") or {}
+        return cls(
+            metadata=ListMetadata(
+                resource_version=list_meta.get("resourceVersion"),
+                _continue=list_meta.get("continue"),
+                remaining_item_count=list_meta.get("remainingItemCount"),
+            ),
+            items=[PartialObjectMetadata(ObjectMetadata.from_dict(item.get("metadata") or {}))
+                   for item in data.get("items") or []],
+        )
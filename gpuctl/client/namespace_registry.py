@@ -0,0 +1,188 @@
+import logging
+import threading
+import time
+from functools import partial
+from typing import Any, Dict, FrozenSet, Iterable, List, Set, Tuple
+
+from kubernetes.client.rest import ApiException
+
+from .base_client import KubernetesClient
+from .informer import Informer
+from gpuctl.constants import Labels, K8sResourceType, DEFAULT_NAMESPACE, NS_LABEL_SELECTOR
+
+
+logger = logging.getLogger(__name__)
+
+# 未启动 watch 时快照的有效期（秒），过期后按需重新同步
+SNAPSHOT_TTL_SECONDS = 30
+
+
+class NamespaceRegistry(KubernetesClient):
+    """gpuctl 管理的命名空间注册表
+
+    受管命名空间 = default + 带 runwhere.ai/namespace=true 标签的命名空间
+    + 存在 gpuctl 工作负载（带 runwhere.ai/job-type 标签的 Job/Deployment/StatefulSet）的命名空间。
+
+    同步只需 4 次集群级、只取元数据的 list 调用（与命名空间数量无关）；启动 watch 后由事件增量维护，
+    读取 ``namespaces()`` 直接返回不可变快照。
+    """
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    @classmethod
+    def get_instance(cls):
+        """Get singleton instance"""
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
+    def __init__(self):
+        super().__init__()
+        self._lock = threading.RLock()
+        self._labeled: Set[str] = set()
+        # kind -> namespace -> 该命名空间下的工作负载名称集合
+        self._workloads: Dict[str, Dict[str, Set[str]]] = {}
+        self._snapshot: FrozenSet[str] = frozenset([DEFAULT_NAMESPACE])
+        self._synced_at = None
+        self._informers: List[Informer] = []
+
+    def _build_informers(self) -> List[Informer]:
+        if not self._informers:
+            self._informers = [
+                Informer("namespaces", self.core_v1.list_namespace,
+                         self._on_namespace_event, self._on_namespace_relist,
+                         relist_func=partial(self.list_metadata, "namespaces"),
+                         label_selector=NS_LABEL_SELECTOR),
+                Informer("jobs", self.batch_v1.list_job_for_all_namespaces,
+                         partial(self._on_workload_event, K8sResourceType.JOB),
+                         partial(self._on_workload_relist, K8sResourceType.JOB),
+                         relist_func=partial(self.list_metadata, "jobs"),
+                         label_selector=Labels.JOB_TYPE),
+                Informer("deployments", self.apps_v1.list_deployment_for_all_namespaces,
+                         partial(self._on_workload_event, K8sResourceType.DEPLOYMENT),
+                         partial(self._on_workload_relist, K8sResourceType.DEPLOYMENT),
+                         relist_func=partial(self.list_metadata, "deployments"),
+                         label_selector=Labels.JOB_TYPE),
+                Informer("statefulsets", self.apps_v1.list_stateful_set_for_all_namespaces,
+                         partial(self._on_workload_event, K8sResourceType.STATEFULSET),
+                         partial(self._on_workload_relist, K8sResourceType.STATEFULSET),
+                         relist_func=partial(self.list_metadata, "statefulsets"),
+                         label_selector=Labels.JOB_TYPE),
+            ]
+        return self._informers
+
+    def namespaces(self) -> FrozenSet[str]:
+        """返回受管命名空间集合（不可变快照）"""
+        if self._is_stale():
+            self.sync()
+        return self._snapshot
+
+    def is_managed(self, namespace: str) -> bool:
+        """判断命名空间是否受 gpuctl 管理"""
+        return namespace in self.namespaces()
+
+    def is_labeled(self, namespace: str) -> bool:
+        """判断命名空间是否带 runwhere.ai/namespace=true 标签（即由 gpuctl 创建、配置了配额）"""
+        if self._is_stale():
+            self.sync()
+        return namespace in self._labeled
+
+    def find_workloads(self, names: Iterable[str]) -> List[Tuple[str, str, str]]:
+        """按名称查找 gpuctl 工作负载，返回 [(kind, 命名空间, 名称)]，不触发同步"""
+        names = set(names)
+        with self._lock:
+            return sorted(
+                (kind, ns, name)
+                for kind, by_namespace in self._workloads.items()
+                for ns, workload_names in by_namespace.items()
+                for name in workload_names & names
+            )
+
+    def is_watching(self) -> bool:
+        return bool(self._informers) and all(inf.is_synced() for inf in self._informers)
+
+    def _is_stale(self) -> bool:
+        if self._synced_at is None:
+            return True
+        if self.is_watching():
+            return False
+        return time.monotonic() - self._synced_at > SNAPSHOT_TTL_SECONDS
+
+    def sync(self) -> None:
+        """通过集群级 list 调用重建快照"""
+        informers = self._build_informers()
+        try:
+            informers[0].list()
+        except ApiException as e:
+            self.handle_api_exception(e, "list namespaces")
+        for informer in informers[1:]:
+            try:
+                informer.list()
+            except ApiException as e:
+                logger.warning(f"Failed to list {informer.name} for namespace discovery: {e}")
+        self._synced_at = time.monotonic()
+
+    def start(self) -> None:
+        """同步快照并启动后台 watch，之后快照由事件实时维护"""
+        if self._synced_at is None:
+            self.sync()
+        for informer in self._build_informers():
+            informer.start()
+
+    def stop(self) -> None:
+        for informer in self._informers:
+            informer.stop()
+
+    def _on_namespace_relist(self, items: List[Any]) -> None:
+        from .quota_client import quota_namespaces
+        with self._lock:
+            removed = self._labeled
+            self._labeled = {ns.metadata.name for ns in items}
+            removed -= self._labeled
+            self._rebuild_snapshot()
+        for name in removed:
+            quota_namespaces.discard(name)
+
+    def _on_namespace_event(self, event_type: str, ns: Any) -> None:
+        from .quota_client import quota_namespaces
+        # 命名空间被删除或去掉了 gpuctl 标签，都不再带配额
+        labeled = event_type != "DELETED" and (ns.metadata.labels or {}).get(Labels.NS_MARKER) == "true"
+        with self._lock:
+            if labeled:
+                self._labeled.add(ns.metadata.name)
+            else:
+                self._labeled.discard(ns.metadata.name)
+            self._rebuild_snapshot()
+        if not labeled:
+            quota_namespaces.discard(ns.metadata.name)
+
+    def _on_workload_relist(self, kind: str, items: List[Any]) -> None:
+        by_namespace: Dict[str, Set[str]] = {}
+        for item in items:
+            by_namespace.setdefault(item.metadata.namespace, set()).add(item.metadata.name)
+        with self._lock:
+            self._workloads[kind] = by_namespace
+            self._rebuild_snapshot()
+
+    def _on_workload_event(self, kind: str, event_type: str, item: Any) -> None:
+        ns_name = item.metadata.namespace
+        with self._lock:
+            by_namespace = self._workloads.setdefault(kind, {})
+            if event_type == "DELETED":
+                names = by_namespace.get(ns_name)
+                if names is not None:
+                    names.discard(item.metadata.name)
+                    if not names:
+                        del by_namespace[ns_name]
+            else:
+                by_namespace.setdefault(ns_name, set()).add(item.metadata.name)
+            self._rebuild_snapshot()
+
+    def _rebuild_snapshot(self) -> None:
+        namespaces = {DEFAULT_NAMESPACE} | self._labeled
+        for by_namespace in self._workloads.values():
+            namespaces.update(by_namespace.keys())
+        self._snapshot = frozenset(namespaces)
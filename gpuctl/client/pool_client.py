@@ -1,7 +1,14 @@
-from .base_client import KubernetesClient
+from concurrent.futures import ThreadPoolExecutor
+from .base_client import KubernetesClient, K8S_LOOKUP_WORKERS, first_hit
 from kubernetes.client.rest import ApiException
 from typing import List, Dict, Any, Optional
-from gpuctl.constants import Labels, DEFAULT_POOL
+from gpuctl.constants import Labels, DEFAULT_POOL, ACTIVE_POD_FIELD_SELECTOR
+from .allocation_index import NodeAllocation, summarize
+from .metadata import ObjectMetadata
+
+
+# Resources checked for pool usage before deleting a pool; pods cover bare pods
+POOL_WORKLOAD_RESOURCES = ("jobs", "deployments", "statefulsets", "pods")
 
 
 class PoolClient(KubernetesClient):
@@ -19,8 +26,8 @@ class PoolClient(KubernetesClient):
     def list_pools(self) -> List[Dict[str, Any]]:
         """List all resource pools"""
         try:
-            # Get all nodes
-            nodes = self.core_v1.list_node()
+            # Get all nodes (shared with concurrent identical requests)
+            nodes = self._coalesced("list", "nodes", self.core_v1.list_node)
 
             # Group by resource pool labels
             pool_nodes = {}
@@ -32,10 +39,11 @@ class PoolClient(KubernetesClient):
                     pool_nodes[pool_name] = []
                 pool_nodes[pool_name].append(node)
 
-            # Build resource pool information
+            # Build resource pool information (GPU usage fetched once for all pools)
+            node_used_gpus = self._get_all_nodes_used_gpu_count()
             pools = []
             for pool_name, nodes in pool_nodes.items():
-                pool_info = self._build_pool_info(pool_name, nodes)
+                pool_info = self._build_pool_info(pool_name, nodes, node_used_gpus)
                 pools.append(pool_info)
 
             return pools
@@ -47,9 +55,8 @@ class PoolClient(KubernetesClient):
         """Get specific resource pool details"""
         try:
             # Get all nodes of this resource pool
-            nodes = self.core_v1.list_node(
-                label_selector=f"{Labels.POOL}={pool_name}"
-            )
+            nodes = self._coalesced("list", "nodes", self.core_v1.list_node,
+                                    label_selector=f"{Labels.POOL}={pool_name}")
 
             if not nodes.items:
                 return None
@@ -63,25 +70,24 @@ class PoolClient(KubernetesClient):
         """Create resource pool"""
         try:
             pool_name = pool_config["name"]
-            node_configs = pool_config.get("nodes", {})
-            node_names = list(node_configs.keys())
+            node_configs = self._normalize_node_configs(pool_config)
 
-            # Validate all nodes exist
-            self._validate_nodes_exist(node_names)
+            # One node snapshot for validation and label diffing
+            snapshot = self._node_label_snapshot()
+            self._validate_nodes_exist(list(node_configs.keys()), snapshot)
 
-            # Add resource pool labels to nodes
-            for node_name, node_config in node_configs.items():
-                self._label_node(node_name, Labels.POOL, pool_name)
-                # Add GPU type label if specified
-                if "gpu_type" in node_config:
-                    self._label_node(node_name, Labels.GPU_TYPE_KEBAB, node_config["gpu_type"])
-                elif "gpuType" in node_config:
-                    self._label_node(node_name, Labels.GPU_TYPE_KEBAB, node_config["gpuType"])
+            # Desired labels per node: pool label plus GPU type label if specified
+            desired = {
+                node_name: self._desired_pool_labels(pool_name, node_config)
+                for node_name, node_config in node_configs.items()
+            }
+            result = self._reconcile_node_labels(desired, snapshot)
 
             return {
                 "name": pool_name,
-                "status": "created",
-                "message": "Resource pool created successfully"
+                "status": self._reconcile_status("created", result),
+                "message": self._reconcile_message("Resource pool created successfully", result),
+                **result
             }
 
         except ApiException as e:
@@ -91,58 +97,183 @@ class PoolClient(KubernetesClient):
         """Update resource pool"""
         try:
             pool_name = pool_config["name"]
-            node_configs = pool_config.get("nodes", {})
+            node_configs = self._normalize_node_configs(pool_config)
             new_nodes = set(node_configs.keys())
 
-            existing_pool = self.get_pool(pool_name)
-            if not existing_pool:
+            # Current pool members come from the same snapshot used for diffing
+            snapshot = self._node_label_snapshot()
+            old_nodes = {name for name, labels in snapshot.items() if labels.get(Labels.POOL) == pool_name}
+            if not old_nodes:
                 raise ValueError(f"Pool {pool_name} does not exist")
 
-            old_nodes = set(existing_pool.get("nodes", []))
-
-            nodes_to_add = new_nodes - old_nodes
-            nodes_to_remove = old_nodes - new_nodes
-
-            if nodes_to_add:
-                self._validate_nodes_exist(list(nodes_to_add))
-                for node_name in nodes_to_add:
-                    self._label_node(node_name, Labels.POOL, pool_name)
-                    # Add GPU type label if specified
-                    node_config = node_configs.get(node_name, {})
-                    if "gpu_type" in node_config:
-                        self._label_node(node_name, Labels.GPU_TYPE_KEBAB, node_config["gpu_type"])
-                    elif "gpuType" in node_config:
-                        self._label_node(node_name, Labels.GPU_TYPE_KEBAB, node_config["gpuType"])
-
-            if nodes_to_remove:
-                for node_name in nodes_to_remove:
-                    self._unlabel_node(node_name, Labels.POOL)
-
-            # Update existing nodes' GPU type labels
-            for node_name in old_nodes & new_nodes:
-                node_config = node_configs.get(node_name, {})
-                if "gpu_type" in node_config:
-                    self._label_node(node_name, Labels.GPU_TYPE_KEBAB, node_config["gpu_type"])
-                elif "gpuType" in node_config:
-                    self._label_node(node_name, Labels.GPU_TYPE_KEBAB, node_config["gpuType"])
+            self._validate_nodes_exist(list(new_nodes - old_nodes), snapshot)
+
+            desired = {
+                node_name: self._desired_pool_labels(pool_name, node_configs[node_name])
+                for node_name in new_nodes
+            }
+            # Removed nodes only lose the pool label
+            for node_name in old_nodes - new_nodes:
+                desired[node_name] = {Labels.POOL: None}
+            result = self._reconcile_node_labels(desired, snapshot)
 
             return {
                 "name": pool_name,
-                "status": "updated",
-                "message": "Resource pool updated successfully"
+                "status": self._reconcile_status("updated", result),
+                "message": self._reconcile_message("Resource pool updated successfully", result),
+                **result
             }
 
         except ApiException as e:
             self.handle_api_exception(e, "update pool")
 
-    def _validate_nodes_exist(self, node_names: List[str]) -> None:
+    @staticmethod
+    def _normalize_node_configs(pool_config: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+        """Return {node_name: node_config}; a plain node list uses the pool-level gpu_type"""
+        nodes = pool_config.get("nodes") or {}
+        if isinstance(nodes, dict):
+            return {name: config or {} for name, config in nodes.items()}
+        gpu_type = pool_config.get("gpu_type")
+        return {name: ({"gpu_type": gpu_type} if gpu_type else {}) for name in nodes}
+
+    @staticmethod
+    def _desired_pool_labels(pool_name: str, node_config: Dict[str, Any]) -> Dict[str, Optional[str]]:
+        """Labels a pool member node should carry"""
+        labels = {Labels.POOL: pool_name}
+        gpu_type = node_config.get("gpu_type") or node_config.get("gpuType")
+        if gpu_type:
+            labels[Labels.GPU_TYPE_KEBAB] = gpu_type
+        return labels
+
+    @staticmethod
+    def _reconcile_status(status: str, result: Dict[str, Any]) -> str:
+        """'partial' when some nodes failed, 'failed' when no node reached the desired labels"""
+        if not result["failed"]:
+            return status
+        return "partial" if result["success"] or result["unchanged"] else "failed"
+
+    @staticmethod
+    def _reconcile_message(message: str, result: Dict[str, Any]) -> str:
+        if result["failed"]:
+            return f"{message}, {len(result['failed'])} node(s) failed"
+        return message
+
+    def _node_metadata_snapshot(self, node_names: Optional[List[str]] = None) -> Dict[str, Any]:
+        """Get metadata (labels, resourceVersion) of nodes from one metadata-only list
+
+        A single requested node is fetched with a metadata.name field selector.
+        """
+        field_selector = f"metadata.name={node_names[0]}" if node_names and len(node_names) == 1 else None
+        nodes = self.list_metadata("nodes", field_selector=field_selector)
+        return {node.metadata.name: node.metadata for node in nodes.items}
+
+    def _node_label_snapshot(self) -> Dict[str, Dict[str, str]]:
+        """Get labels of all nodes from one metadata-only list"""
+        nodes = self.list_metadata("nodes")
+        return {node.metadata.name: node.metadata.labels for node in nodes.items}
+
+    def label_nodes(self, node_names: List[str], labels: Dict[str, Optional[str]],
+                    overwrite: bool = False, preconditions: bool = False) -> Dict[str, Any]:
+        """Set (or remove, with None values) labels on many nodes
+
+        Overwrite conflicts are checked against one node metadata snapshot instead of a
+        read per node, and patches are applied concurrently. With preconditions=True each
+        patch carries the snapshot resourceVersion, so a node modified in between is
+        rejected (409) rather than overwritten. Returns success/failed/unchanged lists.
+        """
+        try:
+            snapshot = self._node_metadata_snapshot(node_names)
+        except ApiException as e:
+            self.handle_api_exception(e, "list nodes")
+
+        failed = []
+        desired = {}
+        for node_name in node_names:
+            meta = snapshot.get(node_name)
+            if meta is None:
+                failed.append({"node": node_name, "error": f"Node {node_name} not found"})
+                continue
+            conflicts = [key for key, value in labels.items()
+                         if value is not None and key in meta.labels and meta.labels[key] != value]
+            if conflicts and not overwrite:
+                failed.append({"node": node_name,
+                               "error": f"Label {', '.join(conflicts)} already exists, use overwrite to replace"})
+                continue
+            desired[node_name] = labels
+
+        result = self._reconcile_node_labels(
+            desired, {name: meta.labels for name, meta in snapshot.items()},
+            {name: meta.resource_version for name, meta in snapshot.items()} if preconditions else None
+        )
+        result["failed"] = failed + result["failed"]
+        return result
+
+    def _reconcile_node_labels(self, desired: Dict[str, Dict[str, Optional[str]]],
+                               snapshot: Dict[str, Dict[str, str]],
+                               resource_versions: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+        """Bring node labels to the desired state with the minimal patches
+
+        desired maps node name to {label: value}, where None removes the label.
+        Labels that already match the snapshot are skipped, and nodes with nothing
+        to change are reported as unchanged instead of being patched.
+        """
+        changes = {}
+        unchanged = []
+        for node_name, labels in desired.items():
+            current = snapshot.get(node_name, {})
+            diff = {key: value for key, value in labels.items() if current.get(key) != value}
+            if diff:
+                changes[node_name] = diff
+            else:
+                unchanged.append(node_name)
+
+        result = self._patch_node_labels(changes, resource_versions)
+        result["unchanged"] = unchanged
+        return result
+
+    def _patch_node_labels(self, changes: Dict[str, Dict[str, Optional[str]]],
+                           resource_versions: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+        """Apply one merged label patch per node, concurrently, reporting per-node results
+
+        When resource_versions is given, each patch is conditional on the node's resourceVersion.
+        """
+        def patch(item):
+            node_name, labels = item
+            body = {"metadata": {"labels": labels}}
+            if resource_versions and resource_versions.get(node_name):
+                body["metadata"]["resourceVersion"] = resource_versions[node_name]
+            try:
+                self.core_v1.patch_node(node_name, body)
+                return node_name, None
+            except ApiException as e:
+                if e.status == 409:
+                    return node_name, "Node was modified since it was read, retry the operation"
+                return node_name, str(e)
+            except Exception as e:
+                return node_name, str(e)
+
+        success = []
+        failed = []
+        if not changes:
+            return {"success": success, "failed": failed}
+        with ThreadPoolExecutor(max_workers=min(K8S_LOOKUP_WORKERS, len(changes))) as executor:
+            for node_name, error in executor.map(patch, changes.items()):
+                if error is None:
+                    success.append(node_name)
+                else:
+                    failed.append({"node": node_name, "error": error})
+        return {"success": success, "failed": failed}
+
+    def _validate_nodes_exist(self, node_names: List[str],
+                              snapshot: Optional[Dict[str, Dict[str, str]]] = None) -> None:
         """Validate all nodes exist"""
         if not node_names:
             return
 
-        # Get all existing nodes
-        all_nodes = self.core_v1.list_node()
-        existing_node_names = {node.metadata.name for node in all_nodes.items}
+        # Get names of all existing nodes (metadata only)
+        if snapshot is None:
+            snapshot = self._node_label_snapshot()
+        existing_node_names = set(snapshot)
 
         # Check if any nodes don't exist
         invalid_nodes = [node for node in node_names if node not in existing_node_names]
@@ -152,36 +283,25 @@ class PoolClient(KubernetesClient):
     def delete_pool(self, pool_name: str) -> bool:
         """Delete resource pool, check if there are associated jobs first"""
         try:
-            from gpuctl.client.job_client import JobClient
-            
-            # 1. Check if there are any associated jobs
-            job_client = JobClient()
-            # Get all jobs, then filter jobs belonging to this resource pool
-            all_jobs = job_client.list_jobs()
-            
-            associated_jobs = []
-            for job in all_jobs:
-                # Check if job belongs to this resource pool
-                job_pool = job.get('labels', {}).get('runwhere.ai/pool')
-                if job_pool == pool_name:
-                    associated_jobs.append(job['name'])
-            
+            # 1. Check if there are any associated workloads (existence only)
+            associated_jobs = self.find_pool_workloads(pool_name, first_only=True)
             if associated_jobs:
-                raise ValueError(f"Cannot delete pool '{pool_name}' because it has associated jobs: {', '.join(associated_jobs)}. Please delete these jobs first.")
+                names = ", ".join(f"{job.namespace}/{job.name}" for job in associated_jobs)
+                raise ValueError(f"Cannot delete pool '{pool_name}' because it has associated jobs: {names}. Please delete these jobs first.")
             
             # 2. Remove resource pool labels
-            # Get all nodes of resource pool
-            nodes = self.core_v1.list_node(
-                label_selector=f"{Labels.POOL}={pool_name}"
-            )
+            # Get all nodes of resource pool (metadata only)
+            nodes = self.list_metadata("nodes", label_selector=f"{Labels.POOL}={pool_name}")
 
             if not nodes.items:
                 # Pool doesn't exist or has no nodes
                 return False
 
             # Remove resource pool labels
-            for node in nodes.items:
-                self._remove_node_label(node.metadata.name, Labels.POOL)
+            result = self._patch_node_labels({node.metadata.name: {Labels.POOL: None} for node in nodes.items})
+            if result["failed"]:
+                failed_nodes = ", ".join(f"{item['node']} ({item['error']})" for item in result["failed"])
+                raise RuntimeError(f"Failed to remove pool label from nodes: {failed_nodes}")
 
             return True
 
@@ -190,26 +310,41 @@ class PoolClient(KubernetesClient):
                 return False
             self.handle_api_exception(e, f"delete pool {pool_name}")
 
+    def find_pool_workloads(self, pool_name: str, first_only: bool = False) -> List[ObjectMetadata]:
+        """Find workloads (and bare pods) bound to a pool
+
+        Uses one cluster-scoped, metadata-only list per resource type with the
+        runwhere.ai/pool=<name> label selector. Finished (Succeeded/Failed) bare pods
+        are excluded. With first_only=True each list asks for a single item, the lists
+        run concurrently and the first match is returned.
+        """
+        label_selector = f"{Labels.POOL}={pool_name}"
+
+        def lookup(resource: str):
+            kwargs = {"field_selector": ACTIVE_POD_FIELD_SELECTOR} if resource == "pods" else {}
+            items = self.list_metadata(resource, label_selector=label_selector,
+                                       limit=1 if first_only else None, **kwargs).items
+            return [item.metadata for item in items] or None
+
+        if first_only:
+            return first_hit(lookup, POOL_WORKLOAD_RESOURCES) or []
+        workloads = []
+        for resource in POOL_WORKLOAD_RESOURCES:
+            workloads.extend(lookup(resource) or [])
+        return workloads
+
     def add_nodes_to_pool(self, pool_name: str, node_names: List[str]) -> Dict[str, Any]:
         """Add nodes to resource pool"""
         try:
             # Validate all nodes exist
             self._validate_nodes_exist(node_names)
-            
-            success = []
-            failed = []
 
-            for node_name in node_names:
-                try:
-                    self._label_node(node_name, Labels.POOL, pool_name)
-                    success.append(node_name)
-                except Exception as e:
-                    failed.append({"node": node_name, "error": str(e)})
+            result = self._patch_node_labels({node_name: {Labels.POOL: pool_name} for node_name in node_names})
 
             return {
                 "pool": pool_name,
-                "success": success,
-                "failed": failed,
+                "success": result["success"],
+                "failed": result["failed"],
                 "message": "Node addition completed"
             }
 
@@ -219,35 +354,29 @@ class PoolClient(KubernetesClient):
     def remove_nodes_from_pool(self, pool_name: str, node_names: List[str]) -> Dict[str, Any]:
         """Remove nodes from resource pool"""
         try:
-            success = []
-            failed = []
-
-            for node_name in node_names:
-                try:
-                    self._remove_node_label(node_name, Labels.POOL)
-                    success.append(node_name)
-                except Exception as e:
-                    failed.append({"node": node_name, "error": str(e)})
+            result = self._patch_node_labels({node_name: {Labels.POOL: None} for node_name in node_names})
 
             return {
                 "pool": pool_name,
-                "success": success,
-                "failed": failed,
+                "success": result["success"],
+                "failed": result["failed"],
                 "message": "Node removal completed"
             }
 
         except ApiException as e:
             self.handle_api_exception(e, f"remove nodes from pool {pool_name}")
 
-    def _build_pool_info(self, pool_name: str, nodes: List[Any]) -> Dict[str, Any]:
+    def _build_pool_info(self, pool_name: str, nodes: List[Any],
+                         node_used_gpus: Dict[str, int] = None) -> Dict[str, Any]:
         """Build resource pool information"""
         gpu_total = 0
         gpu_used = 0
         gpu_types = set()
         node_names = [node.metadata.name for node in nodes]
 
-        # Batch get used GPU count for all nodes
-        node_used_gpus = self._get_all_nodes_used_gpu_count()
+        # Get used GPU count for the pool's nodes
+        if node_used_gpus is None:
+            node_used_gpus = self._get_used_gpu_count_for(node_names)
 
         # Get GPU info on nodes
         for node in nodes:
@@ -315,51 +444,70 @@ class PoolClient(KubernetesClient):
         # Try to get GPU type from different label names
         return labels.get("nvidia.com/gpu-type") or labels.get("nvidia.com/gpuType") or labels.get(Labels.GPU_TYPE_KEBAB)
 
+    @staticmethod
+    def _allocation_index():
+        """Return the watch-driven allocation index when the server has started it, else None"""
+        from .allocation_index import AllocationIndex
+        index = AllocationIndex._instance
+        if index is not None and index.is_watching():
+            return index
+        return None
+
+    def _get_node_allocations(self) -> Dict[str, NodeAllocation]:
+        """Get per-node resource requests (GPU/CPU/memory and pods) of all active pods"""
+        index = self._allocation_index()
+        if index is not None:
+            return index.nodes()
+        try:
+            # Get all active Pods across all namespaces once (finished pods are filtered by the apiserver)
+            pods = self._coalesced("list", "pods", self.core_v1.list_pod_for_all_namespaces,
+                                   field_selector=ACTIVE_POD_FIELD_SELECTOR)
+            return summarize(pods.items)
+        except ApiException:
+            return {}
+
+    def _get_nodes_allocations(self, node_names: List[str]) -> Dict[str, NodeAllocation]:
+        """Get resource requests for a few nodes, listing only the pods bound to them (concurrently)"""
+        index = self._allocation_index()
+        if index is not None:
+            return {name: index.node(name) for name in node_names}
+
+        def collect(node_name: str) -> Dict[str, NodeAllocation]:
+            try:
+                pods = self._coalesced("list", "pods", self.core_v1.list_pod_for_all_namespaces,
+                                       field_selector=f"spec.nodeName={node_name},{ACTIVE_POD_FIELD_SELECTOR}")
+                return summarize(pods.items)
+            except ApiException:
+                return {}
+
+        allocations = {}
+        if not node_names:
+            return allocations
+        with ThreadPoolExecutor(max_workers=min(K8S_LOOKUP_WORKERS, len(node_names))) as executor:
+            for result in executor.map(collect, node_names):
+                allocations.update(result)
+        return allocations
+
     def _get_all_nodes_used_gpu_count(self) -> Dict[str, int]:
         """Batch get all nodes used GPU count"""
-        try:
-            # Get all Pods across all namespaces once
-            pods = self.core_v1.list_pod_for_all_namespaces()
-
-            # Initialize node GPU usage dictionary
-            node_used_gpus = {}
-
-            # Iterate all Pods, count GPU usage for each node
-            for pod in pods.items:
-                # Check if Pod is running
-                if pod.status.phase not in ["Running", "Pending"]:
-                    continue
-
-                # Get Pod's node name
-                node_name = pod.spec.node_name
-                if not node_name:
-                    continue
-
-                # Count Pod requested GPU count
-                pod_gpus = 0
-                for container in pod.spec.containers:
-                    if container.resources and container.resources.requests:
-                        gpu_request = container.resources.requests.get("nvidia.com/gpu")
-                        if gpu_request:
-                            pod_gpus += int(gpu_request)
-
-                # Update node GPU usage
-                if node_name in node_used_gpus:
-                    node_used_gpus[node_name] += pod_gpus
-                else:
-                    node_used_gpus[node_name] = pod_gpus
+        return {name: allocation.gpu for name, allocation in self._get_node_allocations().items()}
 
-            return node_used_gpus
+    def _get_used_gpu_count_for(self, node_names: List[str]) -> Dict[str, int]:
+        """Get used GPU count for the given nodes
 
-        except ApiException:
-            return {}
+        Up to K8S_LOOKUP_WORKERS nodes are computed with node-scoped pod lists in one
+        concurrent round; larger sets use a single cluster-wide list of active pods.
+        """
+        if len(node_names) <= K8S_LOOKUP_WORKERS:
+            allocations = self._get_nodes_allocations(node_names)
+        else:
+            allocations = self._get_node_allocations()
+        return {name: allocation.gpu for name, allocation in allocations.items()}
 
     def _get_used_gpu_count(self, node_name: str) -> int:
         """Get node used GPU count (legacy method for compatibility)"""
         try:
-            # Call new batch statistics method
-            node_used_gpus = self._get_all_nodes_used_gpu_count()
-            return node_used_gpus.get(node_name, 0)
+            return self._get_used_gpu_count_for([node_name]).get(node_name, 0)
         except Exception:
             return 0
 
@@ -367,15 +515,15 @@ class PoolClient(KubernetesClient):
         """List all nodes with filtering support"""
         try:
             # Get all nodes first
-            nodes = self.core_v1.list_node()
+            nodes = self._coalesced("list", "nodes", self.core_v1.list_node)
 
-            # Batch get all nodes GPU usage
-            node_used_gpus = self._get_all_nodes_used_gpu_count()
+            # Batch get all nodes resource usage
+            node_allocations = self._get_node_allocations()
 
             # Build node information and apply filters
             node_list = []
             for node in nodes.items:
-                node_info = self._build_node_info(node, node_used_gpus)
+                node_info = self._build_node_info(node, node_allocations)
                 
                 # Apply filters
                 if filters:
@@ -400,19 +548,44 @@ class PoolClient(KubernetesClient):
         except ApiException as e:
             self.handle_api_exception(e, "list nodes")
 
+    def list_nodes_page(self, label_selector: Optional[str] = None, limit: int = 20,
+                        continue_token: Optional[str] = None) -> Dict[str, Any]:
+        """List one page of nodes using Kubernetes limit/continue
+
+        Only the nodes on the page (and the pods bound to them) are fetched.
+        Returns {"items": [...], "continue": next token or None, "remaining_item_count": int or None}.
+        Raises ValueError when the continue token has expired (410).
+        """
+        kwargs = {"label_selector": label_selector, "limit": limit}
+        if continue_token:
+            kwargs["_continue"] = continue_token
+        try:
+            nodes = self._coalesced("list", "nodes", self.core_v1.list_node, **kwargs)
+        except ApiException as e:
+            if e.status == 410:
+                raise ValueError("Continue token expired, restart listing from the first page")
+            self.handle_api_exception(e, "list nodes")
+
+        node_allocations = self._get_nodes_allocations([node.metadata.name for node in nodes.items])
+        return {
+            "items": [self._build_node_info(node, node_allocations) for node in nodes.items],
+            "continue": nodes.metadata._continue or None,
+            "remaining_item_count": nodes.metadata.remaining_item_count,
+        }
+
     def get_node(self, node_name: str) -> Optional[Dict[str, Any]]:
         """Get specific node details"""
         try:
-            node = self.core_v1.read_node(node_name)
-            # Batch get all nodes GPU usage
-            node_used_gpus = self._get_all_nodes_used_gpu_count()
-            return self._build_node_info(node, node_used_gpus)
+            node = self._coalesced("get", "nodes", self.core_v1.read_node, name=node_name)
+            # Only the active pods bound to this node are fetched
+            node_allocations = self._get_nodes_allocations([node_name])
+            return self._build_node_info(node, node_allocations)
         except ApiException as e:
             if e.status == 404:
                 return None
             self.handle_api_exception(e, f"get node {node_name}")
 
-    def _build_node_info(self, node: Any, node_used_gpus: Dict[str, int] = None) -> Dict[str, Any]:
+    def _build_node_info(self, node: Any, node_allocations: Dict[str, NodeAllocation] = None) -> Dict[str, Any]:
         """Build node information"""
         labels = node.metadata.labels or {}
         gpu_count = self._get_node_gpu_count(node)
@@ -426,12 +599,13 @@ class PoolClient(KubernetesClient):
                     node_ip = addr.address
                     break
         
-        # If GPU usage not provided, call batch fetch method
-        if node_used_gpus is None:
-            node_used_gpus = self._get_all_nodes_used_gpu_count()
+        # If resource usage not provided, fetch it for this node only
+        if node_allocations is None:
+            node_allocations = self._get_nodes_allocations([node.metadata.name])
         
-        # Get used GPU count from dictionary
-        used_gpus = node_used_gpus.get(node.metadata.name, 0)
+        # Get requests of the pods bound to this node
+        allocation = node_allocations.get(node.metadata.name) or NodeAllocation()
+        used_gpus = allocation.gpu
 
         return {
             "name": node.metadata.name,
@@ -443,9 +617,9 @@ class PoolClient(KubernetesClient):
             "last_updated_at": node.status.conditions[-1].last_transition_time.isoformat() if node.status.conditions else None,
             "resources": {
                 "cpu_total": int(node.status.capacity.get("cpu", "0")),
-                "cpu_used": 0,
+                "cpu_used": allocation.cpu_cores,
                 "memory_total": node.status.capacity.get("memory", "0"),
-                "memory_used": 0,
+                "memory_used": allocation.memory,
                 "gpu_total": gpu_count,
                 "gpu_used": used_gpus,
                 "gpu_free": gpu_count - used_gpus
@@ -460,7 +634,7 @@ class PoolClient(KubernetesClient):
                 }
                 for i in range(gpu_count)
             ],
-            "running_jobs": [],
+            "running_jobs": allocation.running_jobs(),
             "gpu_types": [gpu_type] if gpu_type else []
         }
 
@@ -33,7 +33,7 @@ class PriorityClient(KubernetesClient):
     
     def __init__(self):
         super().__init__()  # 调用基类的__init__方法，加载Kubernetes配置
-        self._scheduling_api = client.SchedulingV1Api()  # 添加scheduling API客户端
+        self._scheduling_api = self.get_api(client.SchedulingV1Api)  # 共享连接池上的scheduling API客户端
     
     def create_priority_classes(self) -> List[Dict[str, Any]]:
         """创建所有优先级类"""
@@ -1,10 +1,79 @@
-from .base_client import KubernetesClient
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from .base_client import KubernetesClient, K8S_LOOKUP_WORKERS
 from kubernetes.client.rest import ApiException
+from kubernetes.utils.quantity import parse_quantity
 from kubernetes.client import V1ResourceQuota, V1Namespace, V1ObjectMeta, V1LabelSelector
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from gpuctl.constants import Labels, NS_LABEL_SELECTOR, DEFAULT_NAMESPACE
 
 
+# How long a namespace confirmed to carry a gpuctl quota is trusted without re-checking (seconds)
+QUOTA_CACHE_TTL_SECONDS = int(os.getenv('QUOTA_CACHE_TTL_SECONDS', '30'))
+
+
+class QuotaNamespaceCache:
+    """Process-wide set of namespaces known to carry a gpuctl quota
+
+    Only positive results are cached, each for QUOTA_CACHE_TTL_SECONDS, so a namespace
+    that gains a quota is picked up on the next check. Entries are dropped when gpuctl
+    deletes the namespace or the registry watch sees it deleted or unlabelled. While the
+    NamespaceRegistry watch is running it is consulted instead of the cache.
+    """
+
+    def __init__(self, ttl: float = QUOTA_CACHE_TTL_SECONDS):
+        self.ttl = ttl
+        self._expires: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def contains(self, namespace: str) -> bool:
+        with self._lock:
+            expires = self._expires.get(namespace)
+            if expires is None:
+                return False
+            if expires < time.monotonic():
+                del self._expires[namespace]
+                return False
+            return True
+
+    def add(self, namespace: str) -> None:
+        with self._lock:
+            self._expires[namespace] = time.monotonic() + self.ttl
+
+    def discard(self, namespace: str) -> None:
+        with self._lock:
+            self._expires.pop(namespace, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._expires.clear()
+
+
+quota_namespaces = QuotaNamespaceCache()
+
+
+def _registry_if_watching():
+    """Return the NamespaceRegistry when its watch is running, else None"""
+    from .namespace_registry import NamespaceRegistry
+    registry = NamespaceRegistry._instance
+    if registry is not None and registry.is_watching():
+        return registry
+    return None
+
+
+def is_known_quota_namespace(namespace: str) -> bool:
+    """Whether the namespace is known to carry a gpuctl quota without calling the API
+
+    The registry watch is authoritative while it runs; the TTL cache is only used without it.
+    """
+    registry = _registry_if_watching()
+    if registry is not None:
+        return registry.is_labeled(namespace)
+    return quota_namespaces.contains(namespace)
+
+
 class QuotaClient(KubernetesClient):
     """Resource quota management client"""
 
@@ -24,21 +93,44 @@ class QuotaClient(KubernetesClient):
         return namespace_name
 
     def namespace_has_quota(self, namespace_name: str) -> bool:
-        """Check if a namespace has quota configured"""
+        """Check if a namespace has quota configured
+
+        Served from the namespace registry watch or the quota namespace cache when
+        possible; otherwise a single read of the namespace.
+        """
         try:
             if namespace_name == "default":
                 return True
-            namespaces = self.core_v1.list_namespace(
-            label_selector=NS_LABEL_SELECTOR
-        )
-            for ns in namespaces.items:
-                if ns.metadata.name == namespace_name:
-                    return True
-            return False
+            registry = _registry_if_watching()
+            if registry is not None:
+                return registry.is_labeled(namespace_name)
+            if quota_namespaces.contains(namespace_name):
+                return True
+            return self.check_namespace(namespace_name)[1]
         except ApiException as e:
             self.handle_api_exception(e, f"check namespace {namespace_name}")
             return False
 
+    def check_namespace(self, namespace_name: str) -> Tuple[bool, bool]:
+        """Return (exists, has_quota) for a namespace with one read
+
+        Used as the single pre-submission check; a positive result is cached so the
+        per-resource quota validation in JobClient does not call the API again.
+        """
+        if is_known_quota_namespace(namespace_name):
+            return True, True
+        try:
+            namespace = self.core_v1.read_namespace(namespace_name)
+        except ApiException as e:
+            if e.status == 404:
+                return False, False
+            raise
+        labels = namespace.metadata.labels or {}
+        has_quota = namespace_name == "default" or labels.get(Labels.NAMESPACE) == "true"
+        if has_quota:
+            quota_namespaces.add(namespace_name)
+        return True, has_quota
+
     def create_quota(self, quota_name: str, namespace_name: str, cpu: str = None,
                      memory: str = None, gpu: str = None) -> Dict[str, Any]:
         """Create resource quota for a namespace"""
@@ -138,39 +230,161 @@ class QuotaClient(KubernetesClient):
         except ApiException as e:
             self.handle_api_exception(e, f"update quota {quota_name} for {namespace_name}")
 
-    def create_quota_config(self, quota_config: Dict[str, Any]) -> List[Dict[str, Any]]:
-        """Create resource quota for multiple namespaces"""
-        results = []
+    def create_quota_config(self, quota_config: Dict[str, Any],
+                            skip_unchanged: bool = False) -> Dict[str, Any]:
+        """Create resource quota for multiple namespaces
+
+        A namespace that already carries a gpuctl quota is reported as failed, unless
+        skip_unchanged is set and its hard limits already match. See apply_quota_config.
+        """
+        return self.apply_quota_config(quota_config, update_existing=False,
+                                       skip_unchanged=skip_unchanged)
+
+    def apply_quota_config(self, quota_config: Dict[str, Any], update_existing: bool = True,
+                           skip_unchanged: bool = False) -> Dict[str, Any]:
+        """Apply resource quota for multiple namespaces (create or update)
+
+        Existing gpuctl quotas are read with one cluster-wide list, then namespaces are
+        applied concurrently (at most K8S_LOOKUP_WORKERS at a time). A failure in one
+        namespace does not stop the others; the result lists created, updated,
+        unchanged and failed namespaces; failures caused by an existing quota are marked
+        conflict=True. With skip_unchanged, a quota whose hard limits already match the
+        desired ones is not written.
+        """
         quota_name = quota_config.get("name", "default-quota")
         namespaces = quota_config.get("namespace", {})
 
+        desired = []
         default_quota_config = quota_config.get("default")
         if default_quota_config:
-            default_cpu = str(default_quota_config.get("cpu", 0))
-            default_memory = str(default_quota_config.get("memory", "0Gi"))
-            default_gpu = str(default_quota_config.get("gpu", 0))
-
-            result = self._create_default_namespace_quota(
-                quota_name=quota_name,
-                cpu=default_cpu,
-                memory=default_memory,
-                gpu=default_gpu
-            )
-            results.append(result)
-
+            cpu = default_quota_config.get("cpu", 0)
+            memory = default_quota_config.get("memory", "0Gi")
+            gpu = default_quota_config.get("gpu", 0)
+            desired.append((
+                "default",
+                str(cpu) if cpu is not None else None,
+                str(memory) if memory is not None else None,
+                str(gpu) if gpu is not None else None
+            ))
         for namespace_name, namespace_quota in namespaces.items():
             if namespace_name == "default":
                 continue
-            result = self.create_quota(
-                quota_name=quota_name,
-                namespace_name=namespace_name,
-                cpu=namespace_quota.get("cpu"),
-                memory=namespace_quota.get("memory"),
-                gpu=namespace_quota.get("gpu")
+            desired.append((
+                namespace_name,
+                namespace_quota.get("cpu"),
+                namespace_quota.get("memory"),
+                namespace_quota.get("gpu")
+            ))
+
+        result = {"name": quota_name, "created": [], "updated": [], "unchanged": [], "failed": []}
+        if not desired:
+            return result
+
+        try:
+            quota_list = self.core_v1.list_resource_quota_for_all_namespaces(
+                label_selector=self._quota_label_selector()
+            )
+        except ApiException as e:
+            self.handle_api_exception(e, f"list quotas for {quota_name}")
+        existing = {quota.metadata.namespace: quota for quota in quota_list.items}
+
+        def apply(item):
+            namespace_name, cpu, memory, gpu = item
+            try:
+                return self._apply_namespace_quota(
+                    quota_name, namespace_name, cpu, memory, gpu,
+                    existing.get(namespace_name), update_existing, skip_unchanged
+                )
+            except Exception as e:
+                return {"namespace": namespace_name, "error": str(e), "status": "failed"}
+
+        with ThreadPoolExecutor(max_workers=min(K8S_LOOKUP_WORKERS, len(desired))) as executor:
+            for item_result in executor.map(apply, desired):
+                result[item_result["status"]].append(item_result)
+        return result
+
+    def _apply_namespace_quota(self, quota_name: str, namespace_name: str, cpu: Optional[str],
+                               memory: Optional[str], gpu: Optional[str],
+                               existing_quota: Optional[V1ResourceQuota],
+                               update_existing: bool, skip_unchanged: bool) -> Dict[str, Any]:
+        """Create, update or skip the quota of one namespace given its existing gpuctl quota"""
+        namespace = self._get_namespace_name(namespace_name)
+        hard_limits = self._hard_limits(cpu, memory, gpu)
+        info = {
+            "name": quota_name,
+            "namespace": namespace,
+            "cpu": cpu or "unlimited",
+            "memory": memory or "unlimited",
+            "gpu": gpu or "unlimited"
+        }
+
+        try:
+            if existing_quota is not None:
+                owner = (existing_quota.metadata.labels or {}).get(Labels.QUOTA)
+                conflict = dict(info, status="failed", conflict=True,
+                                error=f"Namespace {namespace} already has a quota '{owner}'. Only one quota is allowed per namespace.")
+                if owner != quota_name:
+                    return conflict
+                current = existing_quota.spec.hard if existing_quota.spec else None
+                if skip_unchanged and self._same_hard_limits(hard_limits, current or {}):
+                    return dict(info, status="unchanged")
+                if not update_existing:
+                    return conflict
+                self.core_v1.patch_namespaced_resource_quota(
+                    name=existing_quota.metadata.name,
+                    namespace=namespace,
+                    body=[{"op": "replace", "path": "/spec/hard", "value": hard_limits}]
+                )
+                return dict(info, status="updated")
+
+            if namespace != "default":
+                self._ensure_namespace_exists(namespace)
+            resource_quota = V1ResourceQuota(
+                api_version="v1",
+                kind="ResourceQuota",
+                metadata=V1ObjectMeta(
+                    name=f"{quota_name}-{namespace_name}",
+                    namespace=namespace,
+                    labels={
+                        Labels.QUOTA: quota_name,
+                        Labels.NAMESPACE: namespace_name
+                    }
+                ),
+                spec={"hard": hard_limits}
             )
-            results.append(result)
+            self.core_v1.create_namespaced_resource_quota(namespace=namespace, body=resource_quota)
+            return dict(info, status="created")
+        except ApiException as e:
+            if e.status == 409:
+                return dict(info, status="failed", conflict=True,
+                            error=f"Quota {quota_name}-{namespace_name} already exists in namespace {namespace}")
+            self.handle_api_exception(e, f"apply quota {quota_name} for {namespace_name}")
 
-        return results
+    @staticmethod
+    def _hard_limits(cpu: Optional[str], memory: Optional[str], gpu: Optional[str]) -> Dict[str, str]:
+        """Build ResourceQuota spec.hard from the configured limits"""
+        hard_limits = {}
+        if cpu:
+            hard_limits["cpu"] = cpu
+        if memory:
+            hard_limits["memory"] = memory
+        if gpu:
+            hard_limits["nvidia.com/gpu"] = gpu
+        return hard_limits
+
+    @staticmethod
+    def _same_hard_limits(desired: Dict[str, str], current: Dict[str, str]) -> bool:
+        """Compare hard limits by quantity, so that e.g. "4" and "4000m" are equal"""
+        if set(desired) != set(current):
+            return False
+        for resource, value in desired.items():
+            try:
+                if parse_quantity(value) != parse_quantity(current[resource]):
+                    return False
+            except ValueError:
+                if str(value) != str(current[resource]):
+                    return False
+        return True
 
     def _ensure_namespace_exists(self, namespace_name: str) -> None:
         """Ensure namespace exists, create if not"""
@@ -191,6 +405,7 @@ class QuotaClient(KubernetesClient):
                     )
                 )
                 self.core_v1.create_namespace(body=namespace)
+                quota_namespaces.add(namespace_name)
             else:
                 raise
 
@@ -262,31 +477,34 @@ class QuotaClient(KubernetesClient):
         return self._create_default_namespace_quota(quota_name, cpu, memory, gpu)
 
     def list_quotas(self, quota_name: str = None) -> List[Dict[str, Any]]:
-        """List all resource quotas"""
+        """List all resource quotas
+
+        One cluster-wide list selected by the runwhere.ai/quota label (optionally narrowed
+        to a quota name) instead of listing ResourceQuotas namespace by namespace.
+        """
         try:
+            quota_list = self.core_v1.list_resource_quota_for_all_namespaces(
+                label_selector=self._quota_label_selector(quota_name)
+            )
+
             quotas = []
-            
-            # 扫描所有命名空间，查找带有runwhere.ai/quota标签的ResourceQuota
-            all_namespaces = self.core_v1.list_namespace()
-            
-            for ns in all_namespaces.items:
-                ns_name = ns.metadata.name
-                quota_list = self.core_v1.list_namespaced_resource_quota(ns_name)
-
-                for quota in quota_list.items:
-                    if quota.metadata.labels and quota.metadata.labels.get(Labels.QUOTA):
-                        if quota_name and quota.metadata.labels.get(Labels.QUOTA) != quota_name:
-                            continue
-
-                        namespace_name = quota.metadata.labels.get(Labels.NAMESPACE, ns_name) if quota.metadata.labels else ns_name
-                        quota_info = self._build_quota_info(quota, namespace_name, ns_name)
-                        quotas.append(quota_info)
+            for quota in quota_list.items:
+                ns_name = quota.metadata.namespace
+                namespace_name = (quota.metadata.labels or {}).get(Labels.NAMESPACE, ns_name)
+                quotas.append(self._build_quota_info(quota, namespace_name, ns_name))
 
             return quotas
 
         except ApiException as e:
             self.handle_api_exception(e, "list quotas")
 
+    @staticmethod
+    def _quota_label_selector(quota_name: str = None) -> str:
+        """Label selector for gpuctl ResourceQuotas, optionally for a single quota name"""
+        if quota_name:
+            return f"{Labels.QUOTA}={quota_name}"
+        return Labels.QUOTA
+
     def get_quota(self, namespace_name: str) -> Optional[Dict[str, Any]]:
         """Get resource quota for a specific namespace"""
         try:
@@ -381,6 +599,9 @@ class QuotaClient(KubernetesClient):
 
     def delete_quota_config(self, quota_name: str, include_default: bool = False) -> Dict[str, Any]:
         """Delete all quotas with the given name"""
+        # An empty name would select every gpuctl quota and delete all quota namespaces
+        if not quota_name:
+            raise ValueError("Quota name is required to delete a quota config")
         try:
             results = {"deleted": [], "failed": []}
 
@@ -403,31 +624,34 @@ class QuotaClient(KubernetesClient):
                             "error": str(e)
                         })
 
-            namespaces = self.core_v1.list_namespace(
-                label_selector=NS_LABEL_SELECTOR
+            # Only gpuctl-created namespaces are deleted together with their quota
+            managed_namespaces = {
+                ns.metadata.name for ns in self.list_metadata("namespaces", label_selector=NS_LABEL_SELECTOR).items
+            }
+            quota_list = self.core_v1.list_resource_quota_for_all_namespaces(
+                label_selector=f"{Labels.QUOTA}={quota_name}"
             )
 
-            for ns in namespaces.items:
-                ns_name = ns.metadata.name
-                quota_list = self.core_v1.list_namespaced_resource_quota(ns_name)
-
-                for quota in quota_list.items:
-                    if quota.metadata.labels.get(Labels.QUOTA) == quota_name:
-                        try:
-                            self.core_v1.delete_namespaced_resource_quota(
-                                quota.metadata.name,
-                                ns_name
-                            )
-                            self.core_v1.delete_namespace(ns_name)
-                            results["deleted"].append({
-                                "namespace": quota.metadata.labels.get(Labels.NAMESPACE),
-                                "original_namespace": ns_name
-                            })
-                        except Exception as e:
-                            results["failed"].append({
-                                "namespace": quota.metadata.labels.get(Labels.NAMESPACE),
-                                "error": str(e)
-                            })
+            for quota in quota_list.items:
+                ns_name = quota.metadata.namespace
+                if ns_name not in managed_namespaces:
+                    continue
+                try:
+                    self.core_v1.delete_namespaced_resource_quota(
+                        quota.metadata.name,
+                        ns_name
+                    )
+                    self.core_v1.delete_namespace(ns_name)
+                    quota_namespaces.discard(ns_name)
+                    results["deleted"].append({
+                        "namespace": quota.metadata.labels.get(Labels.NAMESPACE),
+                        "original_namespace": ns_name
+                    })
+                except Exception as e:
+                    results["failed"].append({
+                        "namespace": quota.metadata.labels.get(Labels.NAMESPACE),
+                        "error": str(e)
+                    })
 
             return results
 
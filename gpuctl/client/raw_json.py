@@ -0,0 +1,69 @@
+import json
+import re
+from functools import lru_cache
+from typing import Any, Callable, Dict
+
+try:
+    import orjson
+except ImportError:  # orjson 为可选依赖（pip install gpuctl[fast]）
+    orjson = None
+
+
+def loads(data: Any) -> Any:
+    """解析 JSON 响应体，安装了 orjson 时使用 orjson"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def list_raw(list_func: Callable[..., Any], *args, **kwargs) -> Dict[str, Any]:
+    """以 _preload_content=False 调用 list API，返回解析后的原始 JSON 映射
+
+    跳过 kubernetes 客户端按 OpenAPI 模型逐字段反射反序列化的过程，
+    调用方直接从 ``{"metadata": ..., "items": [...]}`` 读取需要的字段。
+    """
+    response = list_func(*args, _preload_content=False, **kwargs)
+    try:
+        return loads(response.data)
+    finally:
+        response.release_conn()
+
+
+@lru_cache(maxsize=256)
+def _camel(name: str) -> str:
+    return re.sub(r"_([a-z0-9])", lambda m: m.group(1).upper(), name)
+
+
+def _wrap(value: Any) -> Any:
+    if isinstance(value, dict):
+        return RawObject(value)
+    if isinstance(value, list):
+        return [_wrap(v) for v in value]
+    return value
+
+
+class RawObject:
+    """原始 JSON 映射的只读属性视图
+
+    按 OpenAPI 模型的 snake_case 属性名读取 camelCase 字段（``cs.state.waiting.reason``），
+    缺失字段返回 None，与模型对象的读取方式兼容。时间字段保持 RFC3339 字符串。
+    """
+
+    __slots__ = ("_data",)
+
+    def __init__(self, data: Dict[str, Any]):
+        self._data = data
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return _wrap(self._data.get(_camel(name)))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return self._data
+
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, RawObject) and self._data == other._data
+
+    def __repr__(self) -> str:
+        return f"RawObject({self._data!r})"
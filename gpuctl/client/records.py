@@ -0,0 +1,207 @@
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from gpuctl.constants import PHASE_TO_STATUS, get_detailed_status
+
+
+def derive_pod_status(phase: Optional[str], container_statuses: List[Any]) -> Tuple[str, int, int]:
+    """根据 Pod phase 和容器状态计算展示状态，返回 (状态, 就绪容器数, 容器总数)
+
+    容器处于 waiting 时显示具体原因（如 ImagePullBackOff），
+    terminated 且原因为 OOMKilled/Error 时显示该原因，否则显示 phase。
+    container_statuses 可以是模型对象或 RawObject（按属性读取）。
+    """
+    phase = phase or "Unknown"
+    status = PHASE_TO_STATUS.get(phase, phase)
+    ready = 0
+    resolved = False
+    for cs in container_statuses or []:
+        if getattr(cs, "ready", False):
+            ready += 1
+        if resolved:
+            continue
+        state = getattr(cs, "state", None)
+        if not state:
+            continue
+        waiting = getattr(state, "waiting", None)
+        if waiting:
+            status = get_detailed_status(getattr(waiting, "reason", "") or "",
+                                         getattr(waiting, "message", "") or "")
+            resolved = True
+            continue
+        terminated = getattr(state, "terminated", None)
+        if terminated and getattr(terminated, "reason", None) in ("OOMKilled", "Error"):
+            status = terminated.reason
+            resolved = True
+    return status, ready, len(container_statuses or [])
+
+
+class PodRecord(Mapping):
+    """列表中的单个作业 Pod，只保留 gpuctl 展示所需的字段
+
+    展示状态与 READY 计数在构造时计算完成，不再持有 conditions/container_statuses 模型对象。
+    同时实现只读 Mapping 接口（``pod["name"]``、``pod.get("status", {})``），
+    键与旧的 _pod_to_dict 字典一致，原有按字典读取的调用方无需修改。
+    """
+
+    __slots__ = ("name", "namespace", "labels", "annotations", "creation_timestamp", "start_time",
+                 "node_name", "pod_ip", "phase", "display_status", "ready_containers",
+                 "total_containers", "containers")
+
+    _KEYS = ("name", "namespace", "labels", "annotations", "creation_timestamp", "start_time",
+             "completion_time", "spec", "status")
+
+    def __init__(self, name: str, namespace: Optional[str], labels: Dict[str, str],
+                 annotations: Dict[str, str], creation_timestamp: Optional[str], start_time: Optional[str],
+                 node_name: Optional[str], pod_ip: Optional[str], phase: str, display_status: str,
+                 ready_containers: int, total_containers: int, containers: List[Dict[str, Any]]):
+        self.name = name
+        self.namespace = namespace
+        self.labels = labels
+        self.annotations = annotations
+        self.creation_timestamp = creation_timestamp
+        self.start_time = start_time
+        self.node_name = node_name
+        self.pod_ip = pod_ip
+        self.phase = phase
+        self.display_status = display_status
+        self.ready_containers = ready_containers
+        self.total_containers = total_containers
+        self.containers = containers
+
+    @classmethod
+    def from_dict(cls, pod: Dict[str, Any]) -> "PodRecord":
+        """由 _pod_to_dict / _raw_pod_to_dict 的结果构造，丢弃容器状态对象"""
+        status = pod.get("status", {})
+        spec = pod.get("spec", {})
+        phase = status.get("phase", "Unknown")
+        display_status, ready, total = derive_pod_status(phase, status.get("container_statuses"))
+        return cls(
+            name=pod.get("name"),
+            namespace=pod.get("namespace"),
+            labels=pod.get("labels", {}),
+            annotations=pod.get("annotations", {}),
+            creation_timestamp=pod.get("creation_timestamp"),
+            start_time=pod.get("start_time"),
+            node_name=spec.get("node_name"),
+            pod_ip=status.get("pod_ip"),
+            phase=phase,
+            display_status=display_status,
+            ready_containers=ready,
+            total_containers=total,
+            containers=spec.get("containers", []),
+        )
+
+    @property
+    def ready(self) -> str:
+        """READY 列，格式为 就绪容器数/容器总数"""
+        return f"{self.ready_containers}/{self.total_containers}"
+
+    @property
+    def status(self) -> Dict[str, Any]:
+        return {
+            "active": 1 if self.phase == "Running" else 0,
+            "succeeded": 1 if self.phase == "Succeeded" else 0,
+            "failed": 1 if self.phase == "Failed" else 0,
+            "phase": self.phase,
+            "pod_ip": self.pod_ip,
+            "display_status": self.display_status,
+            "ready_containers": self.ready_containers,
+            "total_containers": self.total_containers,
+        }
+
+    @property
+    def spec(self) -> Dict[str, Any]:
+        return {"node_name": self.node_name, "containers": self.containers}
+
+    @property
+    def completion_time(self) -> None:
+        return None
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self._KEYS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._KEYS)
+
+    def __len__(self) -> int:
+        return len(self._KEYS)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {key: self[key] for key in self._KEYS}
+
+    def __repr__(self) -> str:
+        return f"PodRecord({self.namespace}/{self.name}, {self.display_status})"
+
+
+class WorkloadRecord(Mapping):
+    """列表中的单个作业控制器（Job/Deployment/StatefulSet）
+
+    kind 为 Kubernetes 资源类型。与 PodRecord 一样实现只读 Mapping 接口，
+    键与对应的 _job_to_dict/_deployment_to_dict/_statefulset_to_dict 字典一致。
+    """
+
+    __slots__ = ("kind", "name", "namespace", "labels", "annotations", "creation_timestamp",
+                 "start_time", "completion_time", "status", "spec", "display_status")
+
+    _KEYS = ("name", "namespace", "labels", "annotations", "creation_timestamp", "start_time",
+             "completion_time", "status", "spec")
+
+    def __init__(self, kind: str, name: str, namespace: Optional[str], labels: Dict[str, str],
+                 annotations: Dict[str, str], creation_timestamp: Optional[str], start_time: Optional[str],
+                 completion_time: Optional[str], status: Dict[str, int], spec: Optional[Dict[str, Any]] = None):
+        self.kind = kind
+        self.name = name
+        self.namespace = namespace
+        self.labels = labels
+        self.annotations = annotations
+        self.creation_timestamp = creation_timestamp
+        self.start_time = start_time
+        self.completion_time = completion_time
+        self.status = status
+        self.spec = spec
+        self.display_status = self._derive_status(status)
+
+    @classmethod
+    def from_dict(cls, kind: str, workload: Dict[str, Any]) -> "WorkloadRecord":
+        return cls(
+            kind=kind,
+            name=workload.get("name"),
+            namespace=workload.get("namespace"),
+            labels=workload.get("labels", {}),
+            annotations=workload.get("annotations", {}),
+            creation_timestamp=workload.get("creation_timestamp"),
+            start_time=workload.get("start_time"),
+            completion_time=workload.get("completion_time"),
+            status=workload.get("status", {}),
+            spec=workload.get("spec"),
+        )
+
+    @staticmethod
+    def _derive_status(status: Dict[str, int]) -> str:
+        if status.get("succeeded", 0) > 0:
+            return "Succeeded"
+        if status.get("failed", 0) > 0:
+            return "Failed"
+        if status.get("active", 0) > 0 or status.get("ready_replicas", 0) > 0:
+            return "Running"
+        return "Pending"
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self._KEYS or (key == "spec" and self.spec is None):
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self) -> Iterator[str]:
+        return (key for key in self._KEYS if key != "spec" or self.spec is not None)
+
+    def __len__(self) -> int:
+        return len(self._KEYS) - (self.spec is None)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {key: self[key] for key in self}
+
+    def __repr__(self) -> str:
+        return f"WorkloadRecord({self.kind} {self.namespace}/{self.name})"
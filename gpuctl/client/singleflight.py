@@ -0,0 +1,73 @@
+import threading
+from typing import Any, Callable, Dict, Hashable
+
+
+class _Call:
+    """一次进行中的调用，完成后由等待者共享结果或异常"""
+
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """合并相同 key 的并发调用（singleflight）
+
+    同一时刻相同 key 只有第一个调用者（miss）真正执行，其余调用者（hit）等待并共享
+    它的结果或异常；调用结束后 key 立即移除，之后的调用重新执行，不做缓存。
+    共享的结果对象被多个调用方读取，调用方不得修改。
+    """
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    @classmethod
+    def get_instance(cls):
+        """Get singleton instance"""
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
+    def __init__(self):
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def do(self, key: Hashable, func: Callable[..., Any], *args, **kwargs) -> Any:
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                self.hits += 1
+                leader = False
+            else:
+                call = _Call()
+                self._calls[key] = call
+                self.misses += 1
+                leader = True
+
+        if not leader:
+            call.done.wait()
+        else:
+            try:
+                call.result = func(*args, **kwargs)
+            except BaseException as e:
+                call.error = e
+            finally:
+                with self._lock:
+                    del self._calls[key]
+                call.done.set()
+
+        if call.error is not None:
+            raise call.error
+        return call.result
+
+    def stats(self) -> Dict[str, int]:
+        """合并计数：hits 为共享了他人请求的调用数，misses 为实际发出的请求数"""
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "in_flight": len(self._calls)}
@@ -0,0 +1,137 @@
+import logging
+import os
+import random
+import threading
+import time
+from typing import Any, Callable, Optional
+
+from kubernetes.client.rest import ApiException
+
+
+logger = logging.getLogger(__name__)
+
+# 客户端对 API Server 的稳态请求速率（每秒），<=0 表示不限速
+K8S_CLIENT_QPS = float(os.getenv('K8S_CLIENT_QPS', '50'))
+# 令牌桶容量，即允许的瞬时突发请求数
+K8S_CLIENT_BURST = int(os.getenv('K8S_CLIENT_BURST', '100'))
+# 遇到 429/503 时的最大重试次数（503 只重试幂等方法）
+K8S_MAX_RETRIES = int(os.getenv('K8S_MAX_RETRIES', '5'))
+# 单次重试等待的上限（秒），同时限制 Retry-After 的取值
+K8S_RETRY_MAX_BACKOFF = float(os.getenv('K8S_RETRY_MAX_BACKOFF', '30'))
+
+# 可重试的状态码：API Server 限流（APF）与暂不可用
+RETRYABLE_STATUSES = (429, 503)
+# 429 表示请求未被处理，任何方法都可重试；503 时请求可能已经生效，只重试幂等方法
+IDEMPOTENT_METHODS = ("GET", "HEAD", "OPTIONS", "PUT", "DELETE")
+# 没有 Retry-After 时指数退避的初始等待（秒）
+_BASE_BACKOFF = 0.5
+
+
+class TokenBucket:
+    """线程安全的令牌桶限速器
+
+    以 qps 的速率补充令牌，最多积累 burst 个；acquire() 在没有令牌时阻塞等待。
+    qps <= 0 时不限速。
+    """
+
+    def __init__(self, qps: float, burst: int,
+                 clock: Callable[[], float] = time.monotonic,
+                 sleep: Callable[[float], None] = time.sleep):
+        self.qps = qps
+        self.burst = max(burst, 1)
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = float(self.burst)
+        self._last = clock()
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """预留一个令牌，返回需要等待的秒数"""
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.burst, self._tokens + (now - self._last) * self.qps)
+            self._last = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.qps
+
+    def acquire(self) -> None:
+        if self.qps <= 0:
+            return
+        delay = self._reserve()
+        if delay > 0:
+            self._sleep(delay)
+
+
+def retry_after_seconds(e: ApiException) -> Optional[float]:
+    """读取响应头中的 Retry-After（秒），不存在或无法解析时返回 None"""
+    headers = getattr(e, 'headers', None) or {}
+    value = headers.get('Retry-After') if hasattr(headers, 'get') else None
+    if value is None:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+def backoff_delay(e: ApiException, attempt: int, max_backoff: float = K8S_RETRY_MAX_BACKOFF) -> float:
+    """第 attempt 次重试前的等待时间
+
+    优先使用服务端给出的 Retry-After，否则按 0.5s * 2^attempt 指数退避并加入抖动，
+    结果不超过 max_backoff。
+    """
+    retry_after = retry_after_seconds(e)
+    if retry_after is not None:
+        return min(retry_after, max_backoff)
+    delay = _BASE_BACKOFF * (2 ** attempt)
+    return min(delay * random.uniform(0.5, 1.0), max_backoff)
+
+
+class ThrottledRequest:
+    """包装 RESTClientObject.request：发送前从令牌桶取令牌，429 及幂等请求的 503 时退避重试
+
+    安装在共享 ApiClient 的 rest_client 上，CoreV1Api 等 API 对象、call_api、
+    watch 的初始请求都会经过这里。超过最大重试次数后抛出最后一次的 ApiException，
+    由调用方的 handle_api_exception 处理。
+    """
+
+    def __init__(self, request: Callable[..., Any], limiter: TokenBucket,
+                 max_retries: int = K8S_MAX_RETRIES,
+                 sleep: Callable[[float], None] = time.sleep):
+        self._request = request
+        self.limiter = limiter
+        self.max_retries = max_retries
+        self._sleep = sleep
+
+    def __call__(self, method: str, url: str, *args, **kwargs) -> Any:
+        attempt = 0
+        while True:
+            self.limiter.acquire()
+            try:
+                return self._request(method, url, *args, **kwargs)
+            except ApiException as e:
+                if not self._retryable(method, e) or attempt >= self.max_retries:
+                    raise
+                delay = backoff_delay(e, attempt)
+                attempt += 1
+                logger.debug("%s %s returned %s, retry %d/%d in %.2fs",
+                             method, url, e.status, attempt, self.max_retries, delay)
+                self._sleep(delay)
+
+    @staticmethod
+    def _retryable(method: str, e: ApiException) -> bool:
+        if e.status == 503:
+            return method.upper() in IDEMPOTENT_METHODS
+        return e.status in RETRYABLE_STATUSES
+
+
+def install_throttling(api_client, qps: float = K8S_CLIENT_QPS, burst: int = K8S_CLIENT_BURST,
+                       max_retries: int = K8S_MAX_RETRIES) -> ThrottledRequest:
+    """为 ApiClient 的所有请求安装限速与重试，返回安装的包装对象"""
+    rest_client = api_client.rest_client
+    throttled = ThrottledRequest(rest_client.request, TokenBucket(qps, burst), max_retries)
+    # GET/POST/PATCH 等方法均通过 self.request 发送，实例属性覆盖即可生效
+    rest_client.request = throttled
+    return throttled
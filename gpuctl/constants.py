@@ -90,6 +90,9 @@ class Labels:
 
 NS_LABEL_SELECTOR = f"{Labels.NS_MARKER}=true"
 
+# 仍占用节点资源的 Pod（排除已结束的 Succeeded/Failed），由 API Server 过滤
+ACTIVE_POD_FIELD_SELECTOR = "status.phase!=Succeeded,status.phase!=Failed"
+
 
 # ── Service naming ───────────────────────────────────────────────────────────
 
@@ -5,7 +5,7 @@ from gpuctl.client.job_client import JobClient
 
 def get_pool_client():
     """获取资源池客户端依赖"""
-    return PoolClient()
+    return PoolClient.get_instance()
 
 
 def get_job_client():
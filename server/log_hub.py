@@ -0,0 +1,313 @@
+import os
+import threading
+from collections import deque
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from gpuctl.client.log_client import LogClient, LogStream
+from gpuctl.client.log_merge import LogCursor, merge_log_streams, timestamp_key
+
+
+# 每个 Pod 在内存中保留的最近日志行数，用于新订阅者的历史回放和断线续读
+LOG_HUB_BUFFER_LINES = int(os.getenv('LOG_HUB_BUFFER_LINES', '1000'))
+# 每个订阅者待读取的最大行数，超过后丢弃最旧的行，慢客户端不会拖住上游和其他订阅者
+LOG_HUB_SUBSCRIBER_LINES = int(os.getenv('LOG_HUB_SUBSCRIBER_LINES', '1000'))
+
+
+class LogGap:
+    """订阅者读取过慢时被丢弃的行数，按出现位置插在日志行之间"""
+
+    __slots__ = ("count",)
+
+    def __init__(self, count: int):
+        self.count = count
+
+
+class Subscription:
+    """单个订阅者在某个 Pod 日志上的有界队列（阻塞迭代产出行或 LogGap）
+
+    上游线程调用 offer() 写入，队列满时丢弃最旧的行并累计丢弃数，下一次读取先产出
+    一个 LogGap；上游结束后读完剩余的行即停止，上游出错时抛出 RuntimeError。
+    带游标订阅时，游标及之前的行在写入时丢弃。
+    """
+
+    def __init__(self, pod_name: str, limit: int = LOG_HUB_SUBSCRIBER_LINES,
+                 cursor: Optional[LogCursor] = None):
+        self.pod_name = pod_name
+        self.limit = max(limit, 1)
+        # 续读位置：(时间戳 key, 该时间戳下需要跳过的行数)，越过后置为 None
+        self._resume = (timestamp_key(f"{cursor.timestamp} "), cursor.count) if cursor else None
+        self._skipped = 0
+        self._lines: deque = deque()
+        self._cond = threading.Condition()
+        self._dropped = 0
+        self._ended = False
+        self._error: Optional[str] = None
+        self._closed = False
+
+    def _before_cursor(self, line: str) -> bool:
+        cursor_key, count = self._resume
+        key = timestamp_key(line)
+        if key and key < cursor_key:
+            return True
+        if key == cursor_key and self._skipped < count:
+            self._skipped += 1
+            return True
+        self._resume = None
+        return False
+
+    def offer(self, line: str) -> None:
+        with self._cond:
+            if self._resume is not None and self._before_cursor(line):
+                return
+            if len(self._lines) >= self.limit:
+                self._lines.popleft()
+                self._dropped += 1
+            self._lines.append(line)
+            self._cond.notify()
+
+    def finish(self, error: Optional[str] = None) -> None:
+        with self._cond:
+            self._ended = True
+            self._error = error
+            self._cond.notify()
+
+    def close(self) -> None:
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+
+    def __iter__(self) -> Iterable[Any]:
+        while True:
+            with self._cond:
+                while not (self._lines or self._dropped or self._ended or self._closed):
+                    self._cond.wait()
+                if self._closed:
+                    return
+                if self._dropped:
+                    item, self._dropped = LogGap(self._dropped), 0
+                elif self._lines:
+                    item = self._lines.popleft()
+                elif self._error:
+                    raise RuntimeError(self._error)
+                else:
+                    return
+            yield item
+
+
+class PodFeed:
+    """单个 Pod 的上游 follow 日志流，写入环形缓冲并分发给全部订阅者"""
+
+    def __init__(self, hub: "LogHub", namespace: str, pod_name: str,
+                 cursor: Optional[LogCursor] = None, tail: Optional[int] = None,
+                 buffer_lines: int = LOG_HUB_BUFFER_LINES):
+        self.hub = hub
+        self.namespace = namespace
+        self.pod_name = pod_name
+        self.buffer: deque = deque(maxlen=buffer_lines)
+        self.evicted = False
+        self.subscribers: List[Subscription] = []
+        self.ended = False
+        self.error: Optional[str] = None
+        self._lock = threading.Lock()
+        # 上游按第一个订阅者的请求开启：有游标时从游标之后开始，否则先读最近 tail 行
+        self.start_key = timestamp_key(f"{cursor.timestamp} ") if cursor else None
+        cursors = {pod_name: LogCursor(cursor.timestamp, cursor.count)} if cursor else {}
+        tail = buffer_lines if tail is None else min(tail, buffer_lines)
+        self.stream = LogStream(LogClient(), [(namespace, pod_name)], cursors, tail=tail)
+
+    @property
+    def key(self) -> Tuple[str, str]:
+        return self.namespace, self.pod_name
+
+    def start(self) -> None:
+        threading.Thread(target=self._run, daemon=True,
+                         name=f"log-hub-{self.namespace}-{self.pod_name}").start()
+
+    def _run(self) -> None:
+        error = None
+        try:
+            for _, line in self.stream:
+                with self._lock:
+                    if len(self.buffer) == self.buffer.maxlen:
+                        self.evicted = True
+                    self.buffer.append(line)
+                    for subscription in self.subscribers:
+                        subscription.offer(line)
+        except Exception as e:
+            error = f"Error streaming logs: {e}"
+        with self._lock:
+            self.ended = True
+            self.error = error
+            for subscription in self.subscribers:
+                subscription.finish(error)
+        self.hub._feed_ended(self)
+
+    def add(self, subscription: Subscription, cursor: Optional[LogCursor] = None,
+            tail: Optional[int] = None) -> bool:
+        """回放缓冲中的历史并加入订阅；缓冲无法保证包含游标之后的全部行时返回 False"""
+        with self._lock:
+            lines = list(self.buffer)
+            if cursor is not None:
+                if not self._covers(timestamp_key(f"{cursor.timestamp} "), lines):
+                    return False
+                # 游标之前的行由 Subscription 在写入时丢弃
+                backlog = lines
+            elif tail is not None:
+                backlog = lines[-tail:] if tail > 0 else []
+            else:
+                backlog = lines
+            for line in backlog:
+                subscription.offer(line)
+            self.subscribers.append(subscription)
+            if self.ended:
+                subscription.finish(self.error)
+            return True
+
+    def _covers(self, cursor_key: str, lines: List[str]) -> bool:
+        """缓冲（加上之后的上游行）是否包含游标之后的全部行
+
+        缓冲首行与游标时间戳相同时，同一秒内更早的行可能已被淘汰，游标中的行数无法对齐，视为不覆盖
+        """
+        if self.start_key is not None and not self.evicted and self.start_key <= cursor_key:
+            return True
+        if not lines:
+            return False
+        first_key = timestamp_key(lines[0])
+        return bool(first_key) and first_key < cursor_key
+
+    def remove(self, subscription: Subscription) -> bool:
+        """移除订阅，返回是否已没有订阅者"""
+        with self._lock:
+            if subscription not in self.subscribers:
+                return False
+            self.subscribers.remove(subscription)
+            return not self.subscribers
+
+    def close(self) -> None:
+        self.stream.close()
+
+
+class LogHub:
+    """服务端日志分发中心：每个 Pod 至多一个上游 follow 连接
+
+    多个 WebSocket 订阅同一个 Pod 时共享一个 PodFeed，历史由环形缓冲回放；
+    最后一个订阅者离开时关闭上游连接。每个订阅者有独立的有界队列，
+    读取慢的客户端只会丢弃自己的行（以 LogGap 标记），不影响上游和其他订阅者。
+    """
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    @classmethod
+    def get_instance(cls):
+        """Get singleton instance"""
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
+    def __init__(self, buffer_lines: int = LOG_HUB_BUFFER_LINES,
+                 subscriber_lines: int = LOG_HUB_SUBSCRIBER_LINES):
+        self.buffer_lines = buffer_lines
+        self.subscriber_lines = subscriber_lines
+        self._feeds: Dict[Tuple[str, str], PodFeed] = {}
+        self._lock = threading.Lock()
+
+    def _new_feed(self, namespace: str, pod_name: str, cursor: Optional[LogCursor],
+                  tail: Optional[int]) -> PodFeed:
+        return PodFeed(self, namespace, pod_name, cursor, tail, self.buffer_lines)
+
+    def subscribe(self, namespace: str, pod_name: str, cursor: Optional[LogCursor] = None,
+                  tail: Optional[int] = None) -> Optional[Subscription]:
+        """订阅 Pod 日志：先回放缓冲中游标之后（或最近 tail 行）的历史，再接收新行
+
+        已有上游的缓冲不再包含游标位置时返回 None，由调用方单独读取。
+        """
+        subscription = Subscription(pod_name, self.subscriber_lines, cursor)
+        with self._lock:
+            feed = self._feeds.get((namespace, pod_name))
+            if feed is None:
+                feed = self._new_feed(namespace, pod_name, cursor, tail)
+                self._feeds[feed.key] = feed
+                feed.start()
+            if not feed.add(subscription, cursor, tail):
+                return None
+        return subscription
+
+    def unsubscribe(self, namespace: str, pod_name: str, subscription: Subscription) -> None:
+        subscription.close()
+        with self._lock:
+            feed = self._feeds.get((namespace, pod_name))
+            if feed is None or not feed.remove(subscription):
+                return
+            del self._feeds[feed.key]
+        feed.close()
+
+    def _feed_ended(self, feed: PodFeed) -> None:
+        """上游结束（Pod 退出或出错）后移除 feed，之后的订阅重新建立上游"""
+        with self._lock:
+            if self._feeds.get(feed.key) is feed:
+                del self._feeds[feed.key]
+
+    def open(self, pods: List[Tuple[str, str]], cursors: Optional[Dict[str, LogCursor]] = None,
+             tail: Optional[int] = 100) -> "HubStream":
+        return HubStream(self, pods, cursors or {}, tail)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            feeds = list(self._feeds.values())
+        return {"feeds": len(feeds), "subscribers": sum(len(feed.subscribers) for feed in feeds)}
+
+
+class HubStream:
+    """经由 LogHub 的日志跟随，接口与 LogStream 相同：迭代产出 (Pod 名, 行或 LogGap)
+
+    每个 Pod 一个订阅，多个 Pod 时按时间戳合并；缓冲无法续读的 Pod 单独建立 LogStream。
+    """
+
+    def __init__(self, hub: LogHub, pods: List[Tuple[str, str]],
+                 cursors: Dict[str, LogCursor], tail: Optional[int] = 100):
+        self.hub = hub
+        self.pods = pods
+        self.cursors = {name: cursors.get(name) or LogCursor() for _, name in pods}
+        self._subscriptions: List[Tuple[str, str, Subscription]] = []
+        self._direct: List[LogStream] = []
+        self._sources: Dict[str, Iterable[Any]] = {}
+        self._closed = threading.Event()
+        for namespace, pod_name in pods:
+            cursor = cursors.get(pod_name)
+            resume = LogCursor(cursor.timestamp, cursor.count) if cursor else None
+            subscription = hub.subscribe(namespace, pod_name, resume, None if resume else tail)
+            if subscription is not None:
+                self._subscriptions.append((namespace, pod_name, subscription))
+                self._sources[pod_name] = subscription
+            else:
+                direct = LogStream(LogClient(), [(namespace, pod_name)], {pod_name: resume}, tail)
+                self._direct.append(direct)
+                self._sources[pod_name] = (line for _, line in direct)
+
+    def __iter__(self):
+        try:
+            if len(self._sources) == 1:
+                pod_name, source = next(iter(self._sources.items()))
+                items = ((pod_name, line) for line in source)
+            else:
+                items = merge_log_streams(self._sources)
+            for pod_name, line in items:
+                if self._closed.is_set():
+                    return
+                if isinstance(line, str):
+                    self.cursors[pod_name].advance(line)
+                yield pod_name, line
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        if self._closed.is_set():
+            return
+        self._closed.set()
+        for namespace, pod_name, subscription in self._subscriptions:
+            self.hub.unsubscribe(namespace, pod_name, subscription)
+        for direct in self._direct:
+            direct.close()
@@ -4,6 +4,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from typing import List, Optional, Dict, Any
 import uvicorn
 import logging
+from contextlib import asynccontextmanager
 from datetime import datetime
 
 from server.routes import (
@@ -15,6 +16,10 @@ from server.routes import (
     quotas_router,
     namespaces_router
 )
+from gpuctl.client.namespace_registry import NamespaceRegistry
+from gpuctl.client.allocation_index import AllocationIndex
+from gpuctl.client.singleflight import SingleFlight
+from server.log_hub import LogHub
 
 # 配置日志
 import os
@@ -26,10 +31,30 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 logger.debug(f"日志级别设置为: {log_level}")
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """启动命名空间注册表与节点资源索引的 watch，集群不可达时降级为按需查询"""
+    try:
+        NamespaceRegistry.get_instance().start()
+    except Exception as e:
+        logger.warning(f"Failed to start namespace registry watch: {e}")
+    try:
+        AllocationIndex.get_instance().start()
+    except Exception as e:
+        logger.warning(f"Failed to start allocation index watch: {e}")
+    yield
+    if NamespaceRegistry._instance is not None:
+        NamespaceRegistry._instance.stop()
+    if AllocationIndex._instance is not None:
+        AllocationIndex._instance.stop()
+
+
 app = FastAPI(
     title="GPU Control API",
     description="面向算法工程师的AI算力调度平台API",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # 中间件配置
@@ -59,7 +84,14 @@ async def root():
 
 @app.get("/health")
 async def health_check():
-    return {"status": "healthy", "timestamp": datetime.utcnow()}
+    return {
+        "status": "healthy",
+        "timestamp": datetime.utcnow(),
+        # 并发相同请求的合并计数（hits 为共享了进行中请求的次数）
+        "coalescing": SingleFlight.get_instance().stats(),
+        # 日志分发：上游 follow 连接数与订阅的 WebSocket 数
+        "logHub": LogHub.get_instance().stats()
+    }
 
 
 # 错误处理
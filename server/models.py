@@ -31,8 +31,11 @@ class JobItem(BaseModel):
 
 
 class JobListResponse(BaseModel):
-    total: int
+    # 服务端分页且集群未返回剩余条数时为 None
+    total: Optional[int] = None
     items: List[JobItem]
+    nextCursor: Optional[str] = None
+    hasMore: bool = False
 
 
 class BatchCreateRequest(BaseModel):
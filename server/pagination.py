@@ -0,0 +1,22 @@
+import base64
+import json
+from typing import Optional, Tuple
+
+
+def encode_cursor(continue_token: Optional[str], offset: int) -> Optional[str]:
+    """把 Kubernetes continue token 和已返回条数编码为不透明游标，没有下一页时返回 None"""
+    if not continue_token:
+        return None
+    payload = json.dumps({"c": continue_token, "o": offset}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor: Optional[str]) -> Tuple[Optional[str], int]:
+    """解析游标，返回 (continue token, 已返回条数)；游标非法时抛出 ValueError"""
+    if not cursor:
+        return None, 0
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        return payload["c"], int(payload["o"])
+    except Exception:
+        raise ValueError("Invalid cursor")
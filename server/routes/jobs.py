@@ -4,6 +4,7 @@ from datetime import datetime, timedelta
 import logging
 import asyncio
 import json
+import threading
 
 from gpuctl.parser.base_parser import BaseParser, ParserError
 from gpuctl.kind.training_kind import TrainingKind
@@ -12,12 +13,17 @@ from gpuctl.kind.notebook_kind import NotebookKind
 from gpuctl.kind.compute_kind import ComputeKind
 from gpuctl.client.job_client import JobClient
 from gpuctl.client.log_client import LogClient
+from gpuctl.client.log_merge import LogCursor
+from server.log_hub import LogHub, LogGap
+from gpuctl.client.async_client import AsyncClient, run_sync
+from gpuctl.client.records import derive_pod_status
 from gpuctl.constants import (
     Kind, Labels, KINDS_WITH_SERVICE, DEFAULT_NAMESPACE, DEFAULT_POOL,
-    CONTAINER_WAITING_REASONS, get_detailed_status, infer_resource_type,
+    CONTAINER_WAITING_REASONS, infer_resource_type,
     svc_name, DEFAULT_PRIORITY,
 )
 
+from server.pagination import encode_cursor, decode_cursor
 from server.models import (
     JobCreateRequest,
     JobResponse,
@@ -37,6 +43,9 @@ logger = logging.getLogger(__name__)
 # 存储WebSocket连接
 active_connections = []
 
+# 每个日志 WebSocket 待发送的最大行数，超过后暂停读取该连接的 LogHub 订阅
+WS_LOG_QUEUE_SIZE = 1000
+
 
 @router.post("", response_model=JobResponse, status_code=201)
 async def create_job(request: JobCreateRequest):
@@ -52,19 +61,19 @@ async def create_job(request: JobCreateRequest):
         if parsed_obj.kind == Kind.TRAINING:
             logger.debug("处理训练任务")
             handler = TrainingKind()
-            result = handler.create_training_job(parsed_obj, namespace=DEFAULT_NAMESPACE)
+            result = await run_sync(handler.create_training_job, parsed_obj, namespace=DEFAULT_NAMESPACE)
         elif parsed_obj.kind == Kind.INFERENCE:
             logger.debug("处理推理服务任务")
             handler = InferenceKind()
-            result = handler.create_inference_service(parsed_obj, namespace=DEFAULT_NAMESPACE)
+            result = await run_sync(handler.create_inference_service, parsed_obj, namespace=DEFAULT_NAMESPACE)
         elif parsed_obj.kind == Kind.NOTEBOOK:
             logger.debug("处理Notebook任务")
             handler = NotebookKind()
-            result = handler.create_notebook(parsed_obj, namespace=DEFAULT_NAMESPACE)
+            result = await run_sync(handler.create_notebook, parsed_obj, namespace=DEFAULT_NAMESPACE)
         elif parsed_obj.kind == Kind.COMPUTE:
             logger.debug("处理计算任务")
             handler = ComputeKind()
-            result = handler.create_compute_service(parsed_obj, namespace=DEFAULT_NAMESPACE)
+            result = await run_sync(handler.create_compute_service, parsed_obj, namespace=DEFAULT_NAMESPACE)
         else:
             logger.error(f"不支持的任务类型: {parsed_obj.kind}")
             raise HTTPException(status_code=400, detail=f"Unsupported job kind: {parsed_obj.kind}")
@@ -97,16 +106,16 @@ async def create_jobs_batch(request: BatchCreateRequest):
 
             if parsed_obj.kind == Kind.TRAINING:
                 handler = TrainingKind()
-                result = handler.create_training_job(parsed_obj, namespace=DEFAULT_NAMESPACE)
+                result = await run_sync(handler.create_training_job, parsed_obj, namespace=DEFAULT_NAMESPACE)
             elif parsed_obj.kind == Kind.INFERENCE:
                 handler = InferenceKind()
-                result = handler.create_inference_service(parsed_obj, namespace=DEFAULT_NAMESPACE)
+                result = await run_sync(handler.create_inference_service, parsed_obj, namespace=DEFAULT_NAMESPACE)
             elif parsed_obj.kind == Kind.NOTEBOOK:
                 handler = NotebookKind()
-                result = handler.create_notebook(parsed_obj, namespace=DEFAULT_NAMESPACE)
+                result = await run_sync(handler.create_notebook, parsed_obj, namespace=DEFAULT_NAMESPACE)
             elif parsed_obj.kind == Kind.COMPUTE:
                 handler = ComputeKind()
-                result = handler.create_compute_service(parsed_obj, namespace=DEFAULT_NAMESPACE)
+                result = await run_sync(handler.create_compute_service, parsed_obj, namespace=DEFAULT_NAMESPACE)
             else:
                 failed.append({"index": i, "error": f"Unsupported kind: {parsed_obj.kind}"})
                 continue
@@ -141,9 +150,25 @@ def _calculate_age(created_at_str) -> str:
         return "N/A"
 
 
-def _get_detailed_status(waiting_reason: str, waiting_message: str) -> str:
-    """从容器等待原因获取详细状态 (delegates to constants module)"""
-    return get_detailed_status(waiting_reason, waiting_message)
+async def _list_all_jobs(client: AsyncClient, namespace: Optional[str],
+                         labels: Dict[str, str], status: Optional[str]) -> List[Dict[str, Any]]:
+    """全量拉取作业 Pod 并按状态过滤"""
+    # 使用 include_pods=True 获取 Pod 级别数据，与 CLI 一致
+    jobs = await client.list_jobs(namespace=namespace, labels=labels, include_pods=True)
+
+    # 状态过滤
+    if status:
+        status_lower = status.lower()
+        filtered_jobs = []
+        for job in jobs:
+            status_dict = job.get("status", {})
+            job_phase = status_dict.get("phase", "Unknown")
+            phase_lower = job_phase.lower()
+            job_status_str = status_dict.get("display_status") or job_phase
+            if phase_lower == status_lower or job_status_str.lower() == status_lower:
+                filtered_jobs.append(job)
+        jobs = filtered_jobs
+    return jobs
 
 
 @router.get("", response_model=JobListResponse)
@@ -153,11 +178,18 @@ async def get_jobs(
         status: Optional[str] = Query(None, description="状态过滤"),
         namespace: Optional[str] = Query(None, description="命名空间过滤"),
         page: int = Query(1, ge=1),
-        pageSize: int = Query(20, ge=1, le=100)
+        pageSize: int = Query(20, ge=1, le=100),
+        cursor: Optional[str] = Query(None, description="上一页返回的 nextCursor，用于服务端分页"),
+        serverPaging: bool = Query(False, description="从第一页开始使用服务端分页")
 ):
-    """获取任务列表（Pod级别，与CLI gpuctl get jobs 输出一致）"""
+    """获取任务列表（Pod级别，与CLI gpuctl get jobs 输出一致）
+
+    携带 cursor 或 serverPaging=true 时使用 Kubernetes limit/continue 服务端分页，只拉取当前页的 Pod；
+    带标签选择器的列表集群通常不返回剩余条数，此时 total 为 null，由 hasMore 判断是否还有下一页。
+    其余请求（包括带 status 过滤）全量拉取后分页，total 为准确总数。
+    """
     try:
-        client = JobClient()
+        client = AsyncClient(JobClient())
 
         labels = {}
         if kind:
@@ -165,35 +197,35 @@ async def get_jobs(
         if pool:
             labels[Labels.POOL] = pool
 
-        # 使用 include_pods=True 获取 Pod 级别数据，与 CLI 一致
-        jobs = client.list_jobs(namespace=namespace, labels=labels, include_pods=True)
-
-        # 状态过滤
-        if status:
-            status_lower = status.lower()
-            filtered_jobs = []
-            for job in jobs:
-                status_dict = job.get("status", {})
-                job_phase = status_dict.get("phase", "Unknown")
-                phase_lower = job_phase.lower()
-                container_statuses = status_dict.get("container_statuses", [])
-                job_status_str = job_phase
-                if container_statuses:
-                    for cs in container_statuses:
-                        if hasattr(cs, 'state') and cs.state and hasattr(cs.state, 'waiting') and cs.state.waiting:
-                            job_status_str = _get_detailed_status(
-                                getattr(cs.state.waiting, 'reason', '') or '',
-                                getattr(cs.state.waiting, 'message', '') or ''
-                            )
-                            break
-                if phase_lower == status_lower or job_status_str.lower() == status_lower:
-                    filtered_jobs.append(job)
-            jobs = filtered_jobs
-
-        total = len(jobs)
-        start_idx = (page - 1) * pageSize
-        end_idx = start_idx + pageSize
-        paginated_jobs = jobs[start_idx:end_idx]
+        next_cursor = None
+        if not status and (cursor or serverPaging):
+            try:
+                continue_token, offset = decode_cursor(cursor)
+            except ValueError as e:
+                raise HTTPException(status_code=400, detail=str(e))
+            try:
+                result = await client.list_jobs_page(
+                    namespace=namespace, labels=labels, limit=pageSize, continue_token=continue_token
+                )
+            except ValueError as e:
+                # continue token 已过期，需要从第一页重新开始
+                raise HTTPException(status_code=410, detail=str(e))
+            paginated_jobs = result["items"]
+            known = offset + len(paginated_jobs)
+            has_more = bool(result["continue"])
+            if result["remaining_item_count"] is not None:
+                total = known + result["remaining_item_count"]
+            else:
+                # 最后一页时已知条数即总数，否则总数未知
+                total = None if has_more else known
+            next_cursor = encode_cursor(result["continue"], known)
+        else:
+            jobs = await _list_all_jobs(client, namespace, labels, status)
+            total = len(jobs)
+            start_idx = (page - 1) * pageSize
+            end_idx = start_idx + pageSize
+            paginated_jobs = jobs[start_idx:end_idx]
+            has_more = end_idx < total
 
         items = []
         for job in paginated_jobs:
@@ -202,27 +234,10 @@ async def get_jobs(
             if job_type == "unknown" and Labels.JOB_NAME in labels:
                 job_type = Kind.TRAINING
 
+            # 展示状态与 READY 计数已在 PodRecord 中计算
             status_dict = job.get("status", {})
             job_phase = status_dict.get("phase", "Unknown")
-            job_status = job_phase
-
-            container_statuses = status_dict.get("container_statuses", [])
-            if container_statuses:
-                for cs in container_statuses:
-                    if hasattr(cs, 'state') and cs.state:
-                        if hasattr(cs.state, 'waiting') and cs.state.waiting:
-                            job_status = _get_detailed_status(
-                                getattr(cs.state.waiting, 'reason', '') or '',
-                                getattr(cs.state.waiting, 'message', '') or ''
-                            )
-                            break
-                        if hasattr(cs.state, 'terminated') and cs.state.terminated:
-                            reason = getattr(cs.state.terminated, 'reason', '') or ''
-                            if reason == "OOMKilled":
-                                job_status = "OOMKilled"
-                            elif reason == "Error":
-                                job_status = "Error"
-                            break
+            job_status = status_dict.get("display_status") or job_phase
 
             pod_name = job["name"]
             simplified_name = pod_name
@@ -239,13 +254,7 @@ async def get_jobs(
             node_name = job.get("spec", {}).get("node_name") or "N/A"
             pod_ip = status_dict.get("pod_ip") or "N/A"
 
-            total_containers = len(container_statuses)
-            ready_containers = 0
-            if container_statuses:
-                for cs in container_statuses:
-                    if hasattr(cs, 'ready') and cs.ready:
-                        ready_containers += 1
-            ready_str = f"{ready_containers}/{total_containers}" if total_containers > 0 else "0/0"
+            ready_str = f"{status_dict.get('ready_containers', 0)}/{status_dict.get('total_containers', 0)}"
             age = _calculate_age(job.get("creation_timestamp"))
 
             job_item = JobItem(
@@ -261,8 +270,10 @@ async def get_jobs(
             )
             items.append(job_item)
 
-        return JobListResponse(total=total, items=items)
+        return JobListResponse(total=total, items=items, nextCursor=next_cursor, hasMore=has_more)
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Failed to get jobs: {e}")
         raise HTTPException(status_code=500, detail="Internal server error")
@@ -295,21 +306,9 @@ def _job_detail_compute_status(job_info: dict) -> str:
     status_dict = job_info.get("status", {})
     # Pod 有 phase 字段
     if "phase" in status_dict:
-        phase = status_dict.get("phase", "Unknown")
-        container_statuses = status_dict.get("container_statuses", [])
-        if container_statuses:
-            for cs in container_statuses:
-                if hasattr(cs, 'state') and cs.state:
-                    if hasattr(cs.state, 'waiting') and cs.state.waiting:
-                        reason = getattr(cs.state.waiting, 'reason', '') or ''
-                        return _get_detailed_status(reason, getattr(cs.state.waiting, 'message', '') or '')
-                    if hasattr(cs.state, 'terminated') and cs.state.terminated:
-                        reason = getattr(cs.state.terminated, 'reason', '') or ''
-                        if reason == "OOMKilled":
-                            return "OOMKilled"
-                        if reason == "Error":
-                            return "Error"
-        return phase
+        if status_dict.get("display_status"):
+            return status_dict["display_status"]
+        return derive_pod_status(status_dict.get("phase"), status_dict.get("container_statuses", []))[0]
     # Controller 有 active/succeeded/failed
     if status_dict.get("succeeded", 0) > 0:
         return "Succeeded"
@@ -404,9 +403,14 @@ def _fetch_access_methods(job_name: str, namespace: str, job_type: str, resource
     pod_ip = None
     is_running = False
 
+    k8s = None
     try:
         from gpuctl.client.base_client import KubernetesClient
         k8s = KubernetesClient()
+    except Exception:
+        pass
+
+    try:
         svc = k8s.core_v1.read_namespaced_service(
             name=svc_name(svc_base), namespace=namespace
         ).to_dict()
@@ -419,9 +423,7 @@ def _fetch_access_methods(job_name: str, namespace: str, job_type: str, resource
         pass
 
     try:
-        from gpuctl.client.base_client import KubernetesClient
-        k8s2 = KubernetesClient()
-        nodes = k8s2.core_v1.list_node().items
+        nodes = k8s.core_v1.list_node().items
         if nodes:
             for addr in (nodes[0].to_dict().get("status", {}).get("addresses", [])):
                 if addr.get("type") == "InternalIP":
@@ -431,14 +433,12 @@ def _fetch_access_methods(job_name: str, namespace: str, job_type: str, resource
         pass
 
     try:
-        from gpuctl.client.base_client import KubernetesClient
-        k8s3 = KubernetesClient()
         if resource_type == "Pod":
-            pod = k8s3.core_v1.read_namespaced_pod(name=job_name, namespace=namespace)
+            pod = k8s.core_v1.read_namespaced_pod(name=job_name, namespace=namespace)
             is_running = pod.status.phase == "Running"
             pod_ip = pod.status.pod_ip
         else:
-            pods = k8s3.core_v1.list_namespaced_pod(
+            pods = k8s.core_v1.list_namespaced_pod(
                 namespace=namespace, label_selector=f"app={job_name}"
             )
             for pod in pods.items:
@@ -471,15 +471,15 @@ async def get_job_detail(
 ):
     """获取任务详情，与 CLI describe job --json 输出一致（含 events / access_methods）"""
     try:
-        client = JobClient()
+        client = AsyncClient(JobClient())
         ns = namespace or "default"
 
         # 先尝试按控制器名称查找 (Job/Deployment/StatefulSet)
-        job_info = client.get_job(jobId, ns)
+        job_info = await client.get_job(jobId, ns)
 
         # 若未找到，尝试按 Pod 名称查找（支持跨命名空间搜索）
         if not job_info:
-            job_info = client.get_pod(jobId, namespace if namespace else None)
+            job_info = await client.get_pod(jobId, namespace if namespace else None)
 
         if not job_info:
             raise HTTPException(status_code=404, detail="Job not found")
@@ -498,8 +498,10 @@ async def get_job_detail(
         except Exception:
             yaml_content = {}
 
-        events = _fetch_events(job_name, actual_ns, resource_type)
-        access_methods = _fetch_access_methods(job_name, actual_ns, job_type, resource_type)
+        events, access_methods = await asyncio.gather(
+            run_sync(_fetch_events, job_name, actual_ns, resource_type),
+            run_sync(_fetch_access_methods, job_name, actual_ns, job_type, resource_type)
+        )
 
         return JobDetailResponse(
             job_id=job_name,
@@ -531,10 +533,11 @@ async def get_job_detail(
 async def delete_job(jobId: str, force: bool = Query(False, description="是否强制删除")):
     """删除任务"""
     try:
-        client = JobClient()
-        success = client.delete_job(jobId, force=force)
+        client = AsyncClient(JobClient())
+        # 不等待删除完成，下发删除指令后立即返回
+        handle = await client.delete_job(jobId, force=force, wait=False)
 
-        if not success:
+        if not handle:
             raise HTTPException(status_code=404, detail="Job not found")
 
         return DeleteResponse(
@@ -558,17 +561,18 @@ async def get_job_logs(
         jobId: str,
         follow: bool = False,
         tail: int = Query(100, ge=1),
-        pod: Optional[str] = Query(None)
+        pod: Optional[str] = Query(None),
+        allPods: bool = Query(False, description="合并作业全部 Pod 的日志（每个 Pod 各 tail 行）")
 ):
     """获取任务日志"""
     try:
-        client = LogClient()
+        client = AsyncClient(LogClient())
 
         if follow:
             # 对于follow请求，应该使用WebSocket
             raise HTTPException(status_code=400, detail="Use WebSocket for follow mode")
 
-        logs = client.get_job_logs(jobId, tail=tail, pod_name=pod)
+        logs = await client.get_job_logs(jobId, tail=tail, pod_name=pod, all_pods=allPods)
 
         return LogResponse(
             logs=logs,
@@ -583,40 +587,99 @@ async def get_job_logs(
 
 
 @router.websocket("/{jobId}/logs/ws")
-async def websocket_job_logs(websocket: WebSocket, jobId: str):
-    """WebSocket实时日志"""
+async def websocket_job_logs(
+        websocket: WebSocket,
+        jobId: str,
+        pod: Optional[str] = Query(None),
+        allPods: bool = Query(False),
+        tail: int = Query(100, ge=0),
+        cursor: Optional[List[str]] = Query(None, description="断线续读游标，取自最后收到的每个 Pod 的 cursor")
+):
+    """WebSocket实时日志
+
+    经由 LogHub 订阅 Pod 的 follow 日志流，后台线程逐行推送
+    {"type": "log", "pod", "data", "cursor"}；重连时带上每个 Pod 最后收到的 cursor，
+    从该行之后继续，不丢行也不重复。客户端读取过慢时丢弃的行以
+    {"type": "dropped", "pod", "count"} 标记。日志流结束时推送 {"type": "end"}。
+    """
     await websocket.accept()
 
+    connection_info = {"websocket": websocket, "jobId": jobId}
+    active_connections.append(connection_info)
+    log_stream = None
+    # 队列满时读取线程阻塞，积压转入该连接的 LogHub 订阅队列，超出后丢弃最旧的行
+    lines: asyncio.Queue = asyncio.Queue(maxsize=WS_LOG_QUEUE_SIZE)
     try:
-        client = LogClient()
-
-        # 将连接添加到活动连接列表
-        connection_info = {"websocket": websocket, "jobId": jobId}
-        active_connections.append(connection_info)
-
-        # 发送历史日志
-        logs = client.get_job_logs(jobId, tail=100)
-        for log in logs:
-            await websocket.send_text(json.dumps({"type": "log", "data": log}))
-
-        # 实时推送新日志（简化实现）
-        while True:
-            await asyncio.sleep(2)  # 每2秒检查新日志
+        try:
+            cursors = dict(LogCursor.parse(token) for token in cursor or [])
+        except ValueError as e:
+            await websocket.send_text(json.dumps({"type": "error", "data": str(e)}))
+            return
 
-            # 这里应该实现真正的日志流式传输
-            # 当前是模拟实现
-            new_logs = client.get_job_logs(jobId, tail=5)  # 获取最新5条
-            for log in new_logs[-2:]:  # 只发送最新的2条避免重复
-                await websocket.send_text(json.dumps({"type": "log", "data": log}))
+        client = AsyncClient(LogClient())
+        try:
+            pods = await client.resolve_log_pods(jobId, pod_name=pod, all_pods=allPods)
+        except FileNotFoundError:
+            await websocket.send_text(json.dumps({"type": "error", "data": "No pods found for this job"}))
+            return
+        # 同一 Pod 的所有连接共享一个上游日志流
+        log_stream = await run_sync(LogHub.get_instance().open, pods, cursors, tail)
+
+        loop = asyncio.get_running_loop()
+
+        def produce():
+            try:
+                for pod_name, line in log_stream:
+                    if isinstance(line, LogGap):
+                        frame = {"type": "dropped", "pod": pod_name, "count": line.count}
+                    else:
+                        frame = {"type": "log", "pod": pod_name, "data": line,
+                                 "cursor": log_stream.cursors[pod_name].token(pod_name)}
+                    asyncio.run_coroutine_threadsafe(lines.put(frame), loop).result()
+                frame = {"type": "end"}
+            except Exception as e:
+                frame = {"type": "error", "data": f"Error streaming logs: {e}"}
+            try:
+                asyncio.run_coroutine_threadsafe(lines.put(frame), loop).result()
+            except Exception:
+                pass
+
+        threading.Thread(target=produce, daemon=True, name=f"ws-logs-{jobId}").start()
+
+        # 同时等待下一行和客户端消息：Pod 没有新日志时也能及时发现客户端断开
+        receive = asyncio.ensure_future(websocket.receive())
+        get = asyncio.ensure_future(lines.get())
+        try:
+            while True:
+                done, _ = await asyncio.wait({receive, get}, return_when=asyncio.FIRST_COMPLETED)
+                if receive in done:
+                    if receive.result()["type"] == "websocket.disconnect":
+                        break
+                    # 客户端发来的其他消息忽略
+                    receive = asyncio.ensure_future(websocket.receive())
+                if get in done:
+                    frame = get.result()
+                    await websocket.send_text(json.dumps(frame))
+                    if frame["type"] in ("end", "error"):
+                        break
+                    get = asyncio.ensure_future(lines.get())
+        finally:
+            receive.cancel()
+            get.cancel()
 
     except WebSocketDisconnect:
-        # 连接断开时移除
-        active_connections.remove(connection_info)
+        pass
     except Exception as e:
         logger.error(f"WebSocket error: {e}")
+    finally:
+        # 取消订阅（最后一个订阅者离开时关闭上游连接）并清空队列，读取线程随之退出
+        if log_stream is not None:
+            log_stream.close()
+        while not lines.empty():
+            lines.get_nowait()
         try:
             await websocket.close()
-        except:
+        except Exception:
             pass
         if connection_info in active_connections:
             active_connections.remove(connection_info)
\ No newline at end of file
@@ -1,10 +1,14 @@
 from fastapi import APIRouter, HTTPException, Query
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 import logging
 
+from kubernetes.client.rest import ApiException
+
 from gpuctl.client.pool_client import PoolClient
+from gpuctl.client.async_client import AsyncClient
 from gpuctl.constants import Labels
 
+from server.pagination import encode_cursor, decode_cursor
 from server.models import (
     LabelRequest,
     LabelResponse
@@ -17,12 +21,41 @@ global_labels_router = APIRouter(prefix="/api/v1", tags=["labels"])
 logger = logging.getLogger(__name__)
 
 
+async def _list_nodes_page(client: AsyncClient, page: int, page_size: int, cursor: Optional[str],
+                           label_selector: Optional[str] = None) -> Tuple[List[Any], Optional[int], Optional[str]]:
+    """列出节点，返回 (节点列表, total, nextCursor)
+
+    只取节点元数据（名称和标签）。第一页或携带 cursor 时透传 limit/continue 只拉取当前页；
+    否则全量拉取，total 返回 None，由调用方在内存中分页。
+    """
+    if not (cursor or page == 1):
+        nodes = await client.list_metadata("nodes", label_selector=label_selector)
+        return nodes.items, None, None
+
+    try:
+        continue_token, offset = decode_cursor(cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    kwargs = {"label_selector": label_selector, "limit": page_size}
+    if continue_token:
+        kwargs["_continue"] = continue_token
+    try:
+        nodes = await client.list_metadata("nodes", **kwargs)
+    except ApiException as e:
+        if e.status == 410:
+            raise HTTPException(status_code=410, detail="Continue token expired, restart listing from the first page")
+        raise
+    total = offset + len(nodes.items) + (nodes.metadata.remaining_item_count or 0)
+    next_cursor = encode_cursor(nodes.metadata._continue, offset + len(nodes.items))
+    return nodes.items, total, next_cursor
+
+
 @router.post("/{nodeName}/labels", response_model=LabelResponse)
 async def add_node_label(nodeName: str, request: LabelRequest):
     """给指定节点添加Label"""
     try:
-        client = PoolClient.get_instance()
-        client._label_node(nodeName, request.key, request.value)
+        client = AsyncClient(PoolClient.get_instance())
+        await client._label_node(nodeName, request.key, request.value)
         
         return {
             "nodeName": nodeName,
@@ -42,32 +75,24 @@ async def batch_add_node_labels(
         nodeNames: List[str] = Query(..., description="节点名称列表"),
         key: str = Query(..., description="Label键"),
         value: str = Query(..., description="Label值"),
-        overwrite: bool = Query(False, description="是否覆盖已有同键Label")
+        overwrite: bool = Query(False, description="是否覆盖已有同键Label"),
+        checkResourceVersion: bool = Query(False, description="按快照的 resourceVersion 做前置条件，节点被并发修改时失败而不覆盖")
 ):
-    """批量给多个节点添加Label"""
+    """批量给多个节点添加Label
+
+    基于一次节点元数据快照检查覆盖冲突，补丁并发下发
+    """
     try:
-        client = PoolClient.get_instance()
-        
-        success = []
-        failed = []
-        
-        for node_name in nodeNames:
-            try:
-                node = client.core_v1.read_node(node_name)
-                
-                existing_labels = node.metadata.labels or {}
-                if key in existing_labels and not overwrite:
-                    failed.append({"nodeName": node_name, "error": f"Label {key} already exists"})
-                    continue
-                
-                client._label_node(node_name, key, value)
-                success.append(node_name)
-            except Exception as e:
-                failed.append({"nodeName": node_name, "error": str(e)})
-        
+        client = AsyncClient(PoolClient.get_instance())
+
+        # 兼容 nodeNames=node-1,node-2 的逗号分隔写法
+        node_names = [name for item in nodeNames for name in item.split(",") if name]
+        result = await client.label_nodes(node_names, {key: value}, overwrite=overwrite,
+                                          preconditions=checkResourceVersion)
+
         return {
-            "success": success,
-            "failed": failed,
+            "success": result["success"] + result["unchanged"],
+            "failed": [{"nodeName": item["node"], "error": item["error"]} for item in result["failed"]],
             "message": "批量标记节点 Label 完成"
         }
 
@@ -80,9 +105,9 @@ async def batch_add_node_labels(
 async def get_node_label(nodeName: str, key: str):
     """查询指定节点的指定Label"""
     try:
-        client = PoolClient.get_instance()
+        client = AsyncClient(PoolClient.get_instance())
         
-        node = client.core_v1.read_node(nodeName)
+        node = await client.core_v1.read_node(nodeName)
         
         labels = node.metadata.labels or {}
         if key not in labels:
@@ -109,9 +134,9 @@ async def get_node_label(nodeName: str, key: str):
 async def get_node_labels(nodeName: str):
     """查询指定节点的所有Label"""
     try:
-        client = PoolClient.get_instance()
+        client = AsyncClient(PoolClient.get_instance())
         
-        node = client.get_node(nodeName)
+        node = await client.get_node(nodeName)
         
         labels = node.get("labels", {})
         
@@ -131,16 +156,18 @@ async def get_node_labels(nodeName: str):
 async def get_nodes_labels(
         key: str = Query(..., description="要查询的Label键"),
         page: int = Query(1, ge=1),
-        pageSize: int = Query(20, ge=1, le=100)
+        pageSize: int = Query(20, ge=1, le=100),
+        cursor: Optional[str] = Query(None, description="上一页返回的 nextCursor，用于服务端分页")
 ):
     """查询所有节点的指定Label"""
     try:
-        client = PoolClient.get_instance()
+        client = AsyncClient(PoolClient.get_instance())
         
-        nodes = client.core_v1.list_node()
+        # 只列出带有该 Label 的节点（标签存在性选择器）
+        nodes, total_known, next_cursor = await _list_nodes_page(client, page, pageSize, cursor, label_selector=key)
         
         label_list = []
-        for node in nodes.items:
+        for node in nodes:
             labels = node.metadata.labels or {}
             if key in labels:
                 label_list.append({
@@ -149,15 +176,25 @@ async def get_nodes_labels(
                     "labelValue": labels[key]
                 })
         
+        if total_known is not None:
+            return {
+                "total": total_known,
+                "items": label_list,
+                "nextCursor": next_cursor
+            }
+
         start_idx = (page - 1) * pageSize
         end_idx = start_idx + pageSize
         paginated_labels = label_list[start_idx:end_idx]
         
         return {
             "total": len(label_list),
-            "items": paginated_labels
+            "items": paginated_labels,
+            "nextCursor": None
         }
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Failed to get nodes labels: {e}")
         raise HTTPException(status_code=500, detail="Internal server error")
@@ -166,16 +203,17 @@ async def get_nodes_labels(
 @router.get("/labels/all", response_model=Dict[str, Any])
 async def get_all_nodes_labels(
         page: int = Query(1, ge=1),
-        pageSize: int = Query(20, ge=1, le=100)
+        pageSize: int = Query(20, ge=1, le=100),
+        cursor: Optional[str] = Query(None, description="上一页返回的 nextCursor，用于服务端分页")
 ):
     """列出所有节点的GPU相关Label及绑定资源池"""
     try:
-        client = PoolClient.get_instance()
+        client = AsyncClient(PoolClient.get_instance())
         
-        nodes = client.core_v1.list_node()
+        nodes, total_known, next_cursor = await _list_nodes_page(client, page, pageSize, cursor)
         
         node_label_list = []
-        for node in nodes.items:
+        for node in nodes:
             labels = node.metadata.labels or {}
             gpu_labels = []
             bound_pools = []
@@ -193,15 +231,25 @@ async def get_all_nodes_labels(
                 "boundPools": bound_pools
             })
         
+        if total_known is not None:
+            return {
+                "total": total_known,
+                "items": node_label_list,
+                "nextCursor": next_cursor
+            }
+
         start_idx = (page - 1) * pageSize
         end_idx = start_idx + pageSize
         paginated_node_labels = node_label_list[start_idx:end_idx]
         
         return {
             "total": len(node_label_list),
-            "items": paginated_node_labels
+            "items": paginated_node_labels,
+            "nextCursor": None
         }
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Failed to get all nodes labels: {e}")
         raise HTTPException(status_code=500, detail="Internal server error")
@@ -211,9 +259,9 @@ async def get_all_nodes_labels(
 async def delete_node_label(nodeName: str, key: str):
     """删除指定节点的指定Label"""
     try:
-        client = PoolClient.get_instance()
+        client = AsyncClient(PoolClient.get_instance())
         
-        client._remove_node_label(nodeName, key)
+        await client._remove_node_label(nodeName, key)
         
         return {
             "node": nodeName,
@@ -232,13 +280,13 @@ async def delete_node_label(nodeName: str, key: str):
 async def update_node_label(nodeName: str, key: str, request: Dict[str, Any]):
     """更新指定节点的指定Label"""
     try:
-        client = PoolClient.get_instance()
+        client = AsyncClient(PoolClient.get_instance())
         
         value = request.get("value")
         if not value:
             raise HTTPException(status_code=400, detail="Label值不能为空")
         
-        client._label_node(nodeName, key, value)
+        await client._label_node(nodeName, key, value)
         
         return {
             "node": nodeName,
@@ -257,13 +305,14 @@ async def update_node_label(nodeName: str, key: str, request: Dict[str, Any]):
 async def list_all_node_labels():
     """获取所有节点标签"""
     try:
-        client = PoolClient.get_instance()
+        client = AsyncClient(PoolClient.get_instance())
         
-        nodes = client.list_nodes()
+        # 只需要标签，取节点元数据即可
+        nodes = await client.list_metadata("nodes")
         
         label_stats = {}
-        for node in nodes:
-            labels = node.get("labels", {})
+        for node in nodes.items:
+            labels = node.metadata.labels
             for key, value in labels.items():
                 if key not in label_stats:
                     label_stats[key] = set()
@@ -2,7 +2,8 @@ from fastapi import APIRouter, HTTPException, Query
 from typing import Any, Dict, Optional
 import logging
 
-from gpuctl.client.quota_client import QuotaClient
+from gpuctl.client.quota_client import QuotaClient, quota_namespaces
+from gpuctl.client.async_client import AsyncClient
 from gpuctl.constants import Labels, NS_LABEL_SELECTOR
 
 router = APIRouter(prefix="/api/v1/namespaces", tags=["namespaces"])
@@ -13,9 +14,9 @@ logger = logging.getLogger(__name__)
 async def list_namespaces():
     """获取所有 gpuctl 管理的命名空间列表（含 default 命名空间）"""
     try:
-        client = QuotaClient()
+        client = AsyncClient(QuotaClient())
 
-        namespaces = client.core_v1.list_namespace(
+        namespaces = await client.core_v1.list_namespace(
             label_selector=NS_LABEL_SELECTOR
         )
 
@@ -29,7 +30,7 @@ async def list_namespaces():
 
         # 补充 default 命名空间
         try:
-            default_ns = client.core_v1.read_namespace("default")
+            default_ns = await client.core_v1.read_namespace("default")
             if not any(n["name"] == "default" for n in result):
                 result.append({
                     "name": default_ns.metadata.name,
@@ -50,15 +51,15 @@ async def list_namespaces():
 async def get_namespace_detail(namespaceName: str):
     """获取命名空间详情（含配额信息）"""
     try:
-        client = QuotaClient()
+        client = AsyncClient(QuotaClient())
 
         try:
-            ns = client.core_v1.read_namespace(namespaceName)
+            ns = await client.core_v1.read_namespace(namespaceName)
         except Exception:
             raise HTTPException(status_code=404, detail="Namespace not found")
 
         labels = ns.metadata.labels or {}
-        quota = client.get_quota(namespaceName)
+        quota = await client.get_quota(namespaceName)
 
         return {
             "name": ns.metadata.name,
@@ -82,10 +83,10 @@ async def delete_namespace(
 ):
     """删除命名空间（仅限由 gpuctl 创建的命名空间）"""
     try:
-        client = QuotaClient()
+        client = AsyncClient(QuotaClient())
 
         try:
-            ns = client.core_v1.read_namespace(namespaceName)
+            ns = await client.core_v1.read_namespace(namespaceName)
         except Exception:
             raise HTTPException(status_code=404, detail="Namespace not found")
 
@@ -96,7 +97,8 @@ async def delete_namespace(
                 detail=f"Namespace '{namespaceName}' was not created by gpuctl and cannot be deleted via this API"
             )
 
-        client.core_v1.delete_namespace(namespaceName)
+        await client.core_v1.delete_namespace(namespaceName)
+        quota_namespaces.discard(namespaceName)
 
         return {
             "name": namespaceName,
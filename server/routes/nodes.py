@@ -3,8 +3,10 @@ from typing import List, Optional, Dict, Any
 import logging
 
 from gpuctl.client.pool_client import PoolClient
+from gpuctl.client.async_client import AsyncClient
 from gpuctl.constants import Labels, DEFAULT_POOL
 
+from server.pagination import encode_cursor, decode_cursor
 from server.models import (
     NodeDetailResponse
 )
@@ -13,58 +15,108 @@ router = APIRouter(prefix="/api/v1/nodes", tags=["nodes"])
 logger = logging.getLogger(__name__)
 
 
+def _node_item(node: Dict[str, Any]) -> Dict[str, Any]:
+    labels = node.get("labels", {})
+    pool_name = labels.get(Labels.POOL, "default")
+    return {
+        "nodeName": node["name"],
+        "status": node["status"],
+        "gpuTotal": node["gpu_total"],
+        "gpuUsed": node["gpu_used"],
+        "gpuFree": node["gpu_free"],
+        "boundPools": [pool_name],
+        "cpu": "unknown",
+        "memory": "unknown",
+        "gpuType": labels.get("nvidia.com/gpu-type", "unknown"),
+        "createdAt": None
+    }
+
+
+def _node_gpu_detail(node: Dict[str, Any]) -> Dict[str, Any]:
+    gpu_count = node["gpu_total"]
+    gpus = []
+    for i in range(gpu_count):
+        gpus.append({
+            "gpuId": f"gpu-{i}",
+            "type": node["gpu_types"][0] if node["gpu_types"] else "unknown",
+            "status": "free",
+            "utilization": 0.0,
+            "memoryUsage": "0Gi/0Gi"
+        })
+    return {
+        "nodeName": node["name"],
+        "gpuCount": gpu_count,
+        "gpus": gpus
+    }
+
+
+async def _paginate_nodes(client: AsyncClient, build_item, page: int, page_size: int,
+                          cursor: Optional[str], label_filter: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+    """节点分页：第一页或携带 cursor 时透传 limit/continue，只拉取当前页；否则全量拉取后分页
+
+    label_filter 中的标签转换为标签选择器，由 API Server 完成过滤
+    """
+    label_filter = label_filter or {}
+    if cursor or page == 1:
+        label_selector = ",".join(f"{k}={v}" for k, v in label_filter.items()) or None
+        try:
+            continue_token, offset = decode_cursor(cursor)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        try:
+            result = await client.list_nodes_page(
+                label_selector=label_selector, limit=page_size, continue_token=continue_token
+            )
+        except ValueError as e:
+            # continue token 已过期，需要从第一页重新开始
+            raise HTTPException(status_code=410, detail=str(e))
+        items = [build_item(node) for node in result["items"]]
+        return {
+            "total": offset + len(items) + (result["remaining_item_count"] or 0),
+            "items": items,
+            "nextCursor": encode_cursor(result["continue"], offset + len(items))
+        }
+
+    nodes = await client.list_nodes()
+    item_list = []
+    for node in nodes:
+        labels = node.get("labels", {})
+        if any(labels.get(k) != v for k, v in label_filter.items()):
+            continue
+        item_list.append(build_item(node))
+
+    start_idx = (page - 1) * page_size
+    end_idx = start_idx + page_size
+    return {
+        "total": len(item_list),
+        "items": item_list[start_idx:end_idx],
+        "nextCursor": None
+    }
+
+
 @router.get("", response_model=Dict[str, Any])
 async def get_nodes(
         pool: Optional[str] = Query(None, description="资源池过滤"),
         gpuType: Optional[str] = Query(None, description="GPU类型过滤"),
         status: Optional[str] = Query(None, description="节点状态过滤"),
         page: int = Query(1, ge=1),
-        pageSize: int = Query(20, ge=1, le=100)
+        pageSize: int = Query(20, ge=1, le=100),
+        cursor: Optional[str] = Query(None, description="上一页返回的 nextCursor，用于服务端分页")
 ):
     """获取节点列表"""
     try:
-        client = PoolClient.get_instance()
-        nodes = client.list_nodes()
-        
-        node_list = []
-        for node in nodes:
-            if pool:
-                labels = node.get("labels", {})
-                if labels.get(Labels.POOL) != pool:
-                    continue
-            
-            if gpuType:
-                labels = node.get("labels", {})
-                if labels.get("nvidia.com/gpu-type") != gpuType:
-                    continue
-            
-            labels = node.get("labels", {})
-            pool_name = labels.get(Labels.POOL, "default")
-            
-            node_info = {
-                "nodeName": node["name"],
-                "status": node["status"],
-                "gpuTotal": node["gpu_total"],
-                "gpuUsed": node["gpu_used"],
-                "gpuFree": node["gpu_free"],
-                "boundPools": [pool_name],
-                "cpu": "unknown",
-                "memory": "unknown",
-                "gpuType": labels.get("nvidia.com/gpu-type", "unknown"),
-                "createdAt": None
-            }
-            
-            node_list.append(node_info)
-        
-        start_idx = (page - 1) * pageSize
-        end_idx = start_idx + pageSize
-        paginated_nodes = node_list[start_idx:end_idx]
-        
-        return {
-            "total": len(node_list),
-            "items": paginated_nodes
-        }
+        client = AsyncClient(PoolClient.get_instance())
+
+        label_filter = {}
+        if pool:
+            label_filter[Labels.POOL] = pool
+        if gpuType:
+            label_filter["nvidia.com/gpu-type"] = gpuType
+
+        return await _paginate_nodes(client, _node_item, page, pageSize, cursor, label_filter)
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Failed to get nodes: {e}")
         raise HTTPException(status_code=500, detail="Internal server error")
@@ -73,41 +125,16 @@ async def get_nodes(
 @router.get("/gpu-detail", response_model=Dict[str, Any])
 async def get_nodes_gpu_detail(
         page: int = Query(1, ge=1),
-        pageSize: int = Query(20, ge=1, le=100)
+        pageSize: int = Query(20, ge=1, le=100),
+        cursor: Optional[str] = Query(None, description="上一页返回的 nextCursor，用于服务端分页")
 ):
     """获取所有节点的GPU详情"""
     try:
-        client = PoolClient.get_instance()
-        nodes = client.list_nodes()
-        
-        gpu_detail_list = []
-        for node in nodes:
-            gpu_count = node["gpu_total"]
-            gpus = []
-            for i in range(gpu_count):
-                gpus.append({
-                    "gpuId": f"gpu-{i}",
-                    "type": node["gpu_types"][0] if node["gpu_types"] else "unknown",
-                    "status": "free",
-                    "utilization": 0.0,
-                    "memoryUsage": "0Gi/0Gi"
-                })
-            
-            gpu_detail_list.append({
-                "nodeName": node["name"],
-                "gpuCount": gpu_count,
-                "gpus": gpus
-            })
-        
-        start_idx = (page - 1) * pageSize
-        end_idx = start_idx + pageSize
-        paginated_gpu_detail = gpu_detail_list[start_idx:end_idx]
-        
-        return {
-            "total": len(gpu_detail_list),
-            "items": paginated_gpu_detail
-        }
+        client = AsyncClient(PoolClient.get_instance())
+        return await _paginate_nodes(client, _node_gpu_detail, page, pageSize, cursor)
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Failed to get nodes gpu detail: {e}")
         raise HTTPException(status_code=500, detail="Internal server error")
@@ -117,8 +144,8 @@ async def get_nodes_gpu_detail(
 async def get_node_detail(nodeName: str):
     """获取节点详情"""
     try:
-        client = PoolClient.get_instance()
-        node = client.get_node(nodeName)
+        client = AsyncClient(PoolClient.get_instance())
+        node = await client.get_node(nodeName)
         
         if not node:
             raise HTTPException(status_code=404, detail="Node not found")
@@ -148,10 +175,10 @@ async def get_node_detail(nodeName: str):
             nodeName=node["name"],
             status=node["status"],
             resources={
-                "cpuTotal": 0,
-                "cpuUsed": 0,
-                "memoryTotal": "0",
-                "memoryUsed": "0",
+                "cpuTotal": node.get("resources", {}).get("cpu_total", 0),
+                "cpuUsed": node.get("resources", {}).get("cpu_used", 0),
+                "memoryTotal": node.get("resources", {}).get("memory_total", "0"),
+                "memoryUsed": node.get("resources", {}).get("memory_used", "0"),
                 "gpuTotal": gpu_count,
                 "gpuUsed": node["gpu_used"],
                 "gpuFree": node["gpu_free"]
@@ -173,12 +200,12 @@ async def get_node_detail(nodeName: str):
 async def add_node_to_pool(nodeName: str, request: Dict[str, Any]):
     """将节点添加到资源池"""
     try:
-        client = PoolClient.get_instance()
+        client = AsyncClient(PoolClient.get_instance())
         pool = request.get("pool")
         if not pool:
             raise HTTPException(status_code=400, detail="Pool name is required")
         
-        result = client.add_nodes_to_pool(pool, [nodeName])
+        result = await client.add_nodes_to_pool(pool, [nodeName])
         
         return {
             "node": nodeName,
@@ -197,8 +224,8 @@ async def add_node_to_pool(nodeName: str, request: Dict[str, Any]):
 async def remove_node_from_pool(nodeName: str, poolName: str):
     """从资源池移除节点"""
     try:
-        client = PoolClient.get_instance()
-        result = client.remove_nodes_from_pool(poolName, [nodeName])
+        client = AsyncClient(PoolClient.get_instance())
+        result = await client.remove_nodes_from_pool(poolName, [nodeName])
         
         return {
             "node": nodeName,
@@ -215,8 +242,8 @@ async def remove_node_from_pool(nodeName: str, poolName: str):
 async def get_node_labels(nodeName: str):
     """获取节点标签"""
     try:
-        client = PoolClient.get_instance()
-        node = client.get_node(nodeName)
+        client = AsyncClient(PoolClient.get_instance())
+        node = await client.get_node(nodeName)
         
         if not node:
             raise HTTPException(status_code=404, detail="Node not found")
@@ -1,8 +1,10 @@
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import JSONResponse
 from typing import List, Optional, Dict, Any
 import logging
 
 from gpuctl.client.pool_client import PoolClient
+from gpuctl.client.async_client import AsyncClient
 
 from server.models import (
     PoolResponse,
@@ -18,8 +20,8 @@ logger = logging.getLogger(__name__)
 async def get_pools():
     """获取资源池列表"""
     try:
-        client = PoolClient.get_instance()
-        pools = client.list_pools()
+        client = AsyncClient(PoolClient.get_instance())
+        pools = await client.list_pools()
 
         response = []
         for pool in pools:
@@ -44,8 +46,8 @@ async def get_pools():
 async def get_pool_detail(poolName: str):
     """获取资源池详情"""
     try:
-        client = PoolClient.get_instance()
-        pool_info = client.get_pool(poolName)
+        client = AsyncClient(PoolClient.get_instance())
+        pool_info = await client.get_pool(poolName)
 
         if not pool_info:
             raise HTTPException(status_code=404, detail="Pool not found")
@@ -63,7 +65,7 @@ async def get_pool_detail(poolName: str):
 async def create_pool(request: PoolCreateRequest):
     """创建资源池"""
     try:
-        client = PoolClient.get_instance()
+        client = AsyncClient(PoolClient.get_instance())
         pool_config = {
             "name": request.name,
             "description": request.description,
@@ -72,14 +74,29 @@ async def create_pool(request: PoolCreateRequest):
             "quota": request.quota
         }
         
-        result = client.create_pool(pool_config)
-        
-        return {
+        result = await client.create_pool(pool_config)
+
+        if not result["failed"]:
+            return {
+                "name": request.name,
+                "status": "created",
+                "message": "资源池创建成功"
+            }
+
+        failed = [{"nodeName": item["node"], "error": item["error"]} for item in result["failed"]]
+        if result["status"] == "failed":
+            raise HTTPException(status_code=500, detail={"message": "资源池创建失败", "failed": failed})
+        # 部分节点标记失败：207 并列出成功和失败的节点
+        return JSONResponse(status_code=207, content={
             "name": request.name,
-            "status": "created",
-            "message": "资源池创建成功"
-        }
+            "status": result["status"],
+            "message": "资源池部分节点标记失败",
+            "success": result["success"] + result["unchanged"],
+            "failed": failed
+        })
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Failed to create pool: {e}")
         raise HTTPException(status_code=500, detail="Internal server error")
@@ -95,8 +112,8 @@ async def update_pool(poolName: str, request: PoolUpdateRequest):
 async def delete_pool(poolName: str):
     """删除资源池"""
     try:
-        client = PoolClient.get_instance()
-        success = client.delete_pool(poolName)
+        client = AsyncClient(PoolClient.get_instance())
+        success = await client.delete_pool(poolName)
         
         if not success:
             raise HTTPException(status_code=404, detail="Pool not found")
@@ -1,9 +1,11 @@
 from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import JSONResponse
 from typing import List, Optional, Dict, Any
 import logging
 
 from gpuctl.parser.base_parser import BaseParser, ParserError
 from gpuctl.client.quota_client import QuotaClient
+from gpuctl.client.async_client import AsyncClient
 
 from server.models import (
     JobCreateRequest,
@@ -27,7 +29,7 @@ async def create_quota(request: JobCreateRequest):
         if parsed_obj.kind != "quota":
             raise HTTPException(status_code=400, detail=f"Unsupported kind: {parsed_obj.kind}")
 
-        client = QuotaClient()
+        client = AsyncClient(QuotaClient())
         quota_config = {
             "name": parsed_obj.quota.name,
             "description": parsed_obj.quota.description,
@@ -48,14 +50,27 @@ async def create_quota(request: JobCreateRequest):
                 "gpu": namespace_quota.get_gpu_str()
             }
 
-        results = client.create_quota_config(quota_config)
+        result = await client.create_quota_config(quota_config)
 
-        return {
-            "message": "配额创建成功",
+        if result["failed"] and not (result["created"] or result["unchanged"]):
+            # 全部失败：均因配额已存在时为 409，否则 500
+            conflict = all(item.get("conflict") for item in result["failed"])
+            raise HTTPException(status_code=409 if conflict else 500,
+                                detail={"message": "配额创建失败", "failed": result["failed"]})
+
+        response = {
+            "message": "配额部分创建失败" if result["failed"] else "配额创建成功",
             "name": parsed_obj.quota.name,
-            "created": results
+            "created": result["created"],
+            "unchanged": result["unchanged"],
+            "failed": result["failed"]
         }
+        if result["failed"]:
+            return JSONResponse(status_code=207, content=response)
+        return response
 
+    except HTTPException:
+        raise
     except ParserError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
@@ -67,14 +82,14 @@ async def create_quota(request: JobCreateRequest):
 async def get_quotas(namespace: Optional[str] = Query(None, description="命名空间过滤")):
     """获取资源配额列表"""
     try:
-        client = QuotaClient()
+        client = AsyncClient(QuotaClient())
         if namespace:
-            quota = client.get_quota(namespace)
+            quota = await client.get_quota(namespace)
             if not quota:
                 raise HTTPException(status_code=404, detail="Quota not found")
             return quota
         else:
-            quotas = client.list_quotas()
+            quotas = await client.list_quotas()
             return {
                 "total": len(quotas),
                 "items": quotas
@@ -91,8 +106,8 @@ async def get_quotas(namespace: Optional[str] = Query(None, description="命名
 async def get_quota_detail(namespaceName: str):
     """获取资源配额详情"""
     try:
-        client = QuotaClient()
-        quota = client.describe_quota(namespaceName)
+        client = AsyncClient(QuotaClient())
+        quota = await client.describe_quota(namespaceName)
         if not quota:
             raise HTTPException(status_code=404, detail="Quota not found")
         return quota
@@ -108,8 +123,8 @@ async def get_quota_detail(namespaceName: str):
 async def delete_quota(namespaceName: str, force: bool = Query(False, description="是否强制删除")):
     """删除资源配额"""
     try:
-        client = QuotaClient()
-        success = client.delete_quota(namespaceName)
+        client = AsyncClient(QuotaClient())
+        success = await client.delete_quota(namespaceName)
 
         if not success:
             raise HTTPException(status_code=404, detail="Quota not found")
@@ -3,6 +3,7 @@ from unittest.mock import patch, MagicMock
 from fastapi.testclient import TestClient
 from server.main import app
 from server.models import JobCreateRequest
+from gpuctl.client.records import PodRecord
 
 
 client = TestClient(app)
@@ -84,7 +85,7 @@ def test_get_jobs(mock_job_client):
 
     mock_instance = MagicMock()
     mock_instance.list_jobs.return_value = [
-        {
+        PodRecord.from_dict({
             "name": "test-job-1-abc123-xyz",
             "namespace": "default",
             "labels": {"runwhere.ai/job-type": "training", "runwhere.ai/pool": "test-pool"},
@@ -98,7 +99,7 @@ def test_get_jobs(mock_job_client):
             },
             "spec": {"node_name": "node-1"},
             "creation_timestamp": "2023-01-01T12:00:00Z"
-        }
+        })
     ]
     mock_job_client.return_value = mock_instance
 
@@ -119,6 +120,63 @@ def test_get_jobs(mock_job_client):
     assert item["node"] == "node-1"
     assert item["ip"] == "10.42.0.1"
     assert "age" in item
+    assert response.json()["hasMore"] is False
+    mock_instance.list_jobs_page.assert_not_called()
+
+
+@patch('server.routes.jobs.JobClient')
+def test_get_jobs_server_paging_reports_unknown_total(mock_job_client):
+    """服务端分页且集群未返回剩余条数时 total 为 null，hasMore 指示是否还有下一页"""
+    mock_instance = MagicMock()
+    mock_instance.list_jobs_page.return_value = {"continue": "token-1", "remaining_item_count": None, "items": [
+        {"name": f"job-{i}", "namespace": "default", "labels": {}, "status": {"phase": "Running"}, "spec": {}}
+        for i in range(2)
+    ]}
+    mock_job_client.return_value = mock_instance
+
+    response = client.get("/api/v1/jobs?serverPaging=true&pageSize=2")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total"] is None
+    assert data["hasMore"] is True
+    assert data["nextCursor"] is not None
+    mock_instance.list_jobs_page.assert_called_once_with(
+        namespace=None, labels={}, limit=2, continue_token=None
+    )
+    mock_instance.list_jobs.assert_not_called()
+
+    # 最后一页：已知条数即为总数
+    mock_instance.list_jobs_page.return_value = {"continue": None, "remaining_item_count": None, "items": [
+        {"name": "job-2", "namespace": "default", "labels": {}, "status": {"phase": "Running"}, "spec": {}}
+    ]}
+    response = client.get(f"/api/v1/jobs?cursor={data['nextCursor']}&pageSize=2")
+
+    data = response.json()
+    assert data["total"] == 3
+    assert data["hasMore"] is False
+    assert data["nextCursor"] is None
+
+
+@patch('server.routes.jobs.JobClient')
+def test_get_jobs_page_without_cursor_falls_back_to_full_list(mock_job_client):
+    """不带 cursor 请求 page>1 时回退为全量拉取后分页"""
+    mock_instance = MagicMock()
+    mock_instance.list_jobs.return_value = [
+        {"name": f"job-{i}", "namespace": "default", "labels": {}, "status": {"phase": "Running"}, "spec": {}}
+        for i in range(3)
+    ]
+    mock_job_client.return_value = mock_instance
+
+    response = client.get("/api/v1/jobs?page=2&pageSize=2")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total"] == 3
+    assert [item["jobId"] for item in data["items"]] == ["job-2"]
+    assert data["nextCursor"] is None
+    assert data["hasMore"] is False
+    mock_instance.list_jobs_page.assert_not_called()
 
 
 @patch('server.routes.jobs.JobClient')
@@ -198,7 +256,7 @@ def test_delete_job_force(mock_job_client):
         "message": "任务删除指令已下发"
     }
     # 验证force参数被正确传递
-    mock_instance.delete_job.assert_called_once_with("test-job", force=True)
+    mock_instance.delete_job.assert_called_once_with("test-job", force=True, wait=False)
 
 
 
@@ -232,6 +290,110 @@ def test_get_job_logs(mock_log_client):
     }
 
 
+@patch('server.routes.jobs.LogClient')
+def test_get_job_logs_all_pods(mock_log_client):
+    """测试合并作业全部 Pod 日志"""
+    mock_instance = MagicMock()
+    mock_instance.get_job_logs.return_value = ["[test-job-0] 2023-01-01T12:00:00Z INFO: rank 0"]
+    mock_log_client.return_value = mock_instance
+
+    response = client.get(
+        "/api/v1/jobs/test-job/logs?allPods=true&tail=50",
+        headers={"Authorization": "Bearer test-token"}
+    )
+
+    assert response.status_code == 200
+    mock_instance.get_job_logs.assert_called_once_with("test-job", tail=50, pod_name=None, all_pods=True)
+
+
+@patch('server.routes.jobs.LogHub.get_instance')
+@patch('server.routes.jobs.LogClient')
+def test_websocket_job_logs_streams_lines_with_cursor(mock_log_client, mock_hub):
+    """WebSocket 日志：经由 LogHub 逐行推送 follow 流的内容并携带续读游标"""
+    from gpuctl.client.log_merge import LogCursor
+
+    class FakeStream:
+        def __init__(self):
+            self.cursors = {"test-job-0": LogCursor()}
+            self.close = MagicMock()
+
+        def __iter__(self):
+            for line in ["2023-01-01T12:00:00Z a", "2023-01-01T12:00:01Z b"]:
+                self.cursors["test-job-0"].advance(line)
+                yield "test-job-0", line
+
+    mock_instance = MagicMock()
+    mock_instance.resolve_log_pods.return_value = [("default", "test-job-0")]
+    mock_log_client.return_value = mock_instance
+    log_stream = FakeStream()
+    mock_hub.return_value.open.return_value = log_stream
+
+    with client.websocket_connect(
+        "/api/v1/jobs/test-job/logs/ws?cursor=test-job-0/2023-01-01T11:59:59Z/1"
+    ) as websocket:
+        frames = [websocket.receive_json() for _ in range(3)]
+
+    assert [f["type"] for f in frames] == ["log", "log", "end"]
+    assert frames[1] == {"type": "log", "pod": "test-job-0", "data": "2023-01-01T12:00:01Z b",
+                         "cursor": "test-job-0/2023-01-01T12:00:01Z/1"}
+    pods, cursors, tail = mock_hub.return_value.open.call_args.args
+    assert pods == [("default", "test-job-0")] and tail == 100
+    assert cursors["test-job-0"].timestamp == "2023-01-01T11:59:59Z"
+    log_stream.close.assert_called()
+
+
+@patch('server.log_hub.LogClient')
+@patch('server.routes.jobs.LogClient')
+def test_websocket_job_logs_unsubscribes_on_idle_disconnect(mock_log_client, mock_hub_log_client):
+    """Pod 没有新日志时客户端断开：取消订阅并关闭上游连接"""
+    import asyncio
+    import threading
+    from server.log_hub import LogHub
+    from server.routes.jobs import websocket_job_logs
+
+    class IdleStream:
+        """没有日志输出的上游，close() 后结束"""
+        instances = []
+
+        def __init__(self, client, pods, cursors, tail=100):
+            self.closed = threading.Event()
+            IdleStream.instances.append(self)
+
+        def __iter__(self):
+            self.closed.wait()
+            return iter(())
+
+        def close(self):
+            self.closed.set()
+
+    class IdleWebSocket:
+        """不发消息、稍后断开的客户端；直接调用路由，避免 TestClient 退出时取消任务掩盖问题"""
+        async def accept(self):
+            pass
+
+        async def receive(self):
+            await asyncio.sleep(0.05)
+            return {"type": "websocket.disconnect", "code": 1000}
+
+        async def send_text(self, text):
+            pass
+
+        async def close(self):
+            pass
+
+    mock_log_client.return_value.resolve_log_pods.return_value = [("default", "test-job-0")]
+    hub = LogHub()
+
+    with patch('server.routes.jobs.LogHub.get_instance', return_value=hub), \
+            patch('server.log_hub.LogStream', IdleStream):
+        asyncio.run(asyncio.wait_for(
+            websocket_job_logs(IdleWebSocket(), "test-job", pod=None, allPods=False, tail=100, cursor=None),
+            timeout=2))
+
+    assert hub.stats() == {"feeds": 0, "subscribers": 0}
+    assert IdleStream.instances[0].closed.is_set()
+
+
 @patch('server.routes.jobs.LogClient')
 def test_get_job_logs_follow_returns_400_not_500(mock_log_client):
     """回归测试：follow=True 时应返回 400，而非被 except Exception 吞掉后返回 500"""
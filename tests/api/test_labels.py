@@ -2,6 +2,7 @@ import pytest
 from unittest.mock import patch, MagicMock
 from fastapi.testclient import TestClient
 from gpuctl.client.pool_client import PoolClient
+from gpuctl.client.metadata import PartialObjectMetadataList
 from server.main import app
 
 
@@ -110,22 +111,13 @@ def test_get_node_labels(mock_get_instance, client):
 def test_list_all_node_labels(mock_get_instance, client):
     """测试获取所有节点标签API"""
     mock_instance = MagicMock()
-    mock_instance.list_nodes = MagicMock(return_value=[
-        {
-            "name": "node-1",
-            "labels": {
-                "runwhere.ai/pool": "test-pool",
-                "gpu-type": "A100"
-            }
-        },
-        {
-            "name": "node-2",
-            "labels": {
-                "runwhere.ai/pool": "test-pool",
-                "gpu-type": "H100"
-            }
-        }
-    ])
+    mock_instance.list_metadata.return_value = PartialObjectMetadataList.from_dict({
+        "metadata": {"resourceVersion": "100"},
+        "items": [
+            {"metadata": {"name": "node-1", "labels": {"runwhere.ai/pool": "test-pool", "gpu-type": "A100"}}},
+            {"metadata": {"name": "node-2", "labels": {"runwhere.ai/pool": "test-pool", "gpu-type": "H100"}}},
+        ],
+    })
     mock_get_instance.return_value = mock_instance
 
     response = client.get(
@@ -135,3 +127,7 @@ def test_list_all_node_labels(mock_get_instance, client):
 
     assert response.status_code == 200
     assert isinstance(response.json(), dict)
+    assert response.json()["runwhere.ai/pool"] == ["test-pool"]
+    assert sorted(response.json()["gpu-type"]) == ["A100", "H100"]
+    mock_instance.list_metadata.assert_called_once_with("nodes")
+    mock_instance.list_nodes.assert_not_called()
@@ -0,0 +1,122 @@
+"""
+LogHub：每个 Pod 一个上游日志流、环形缓冲回放、慢订阅者丢弃、断线续读
+"""
+import queue
+import time
+from unittest.mock import patch
+
+from gpuctl.client.log_merge import LogCursor
+from server.log_hub import LogHub, LogGap, Subscription
+
+
+class FakeLogStream:
+    """替代 LogStream：由测试逐行推送，close() 结束迭代"""
+
+    instances = []
+
+    def __init__(self, client, pods, cursors, tail=100):
+        self.pods = pods
+        self.cursors = cursors
+        self.tail = tail
+        self.lines = queue.Queue()
+        self.closed = False
+        FakeLogStream.instances.append(self)
+
+    def push(self, *lines):
+        for line in lines:
+            self.lines.put(line)
+
+    def __iter__(self):
+        while True:
+            line = self.lines.get()
+            if line is None:
+                return
+            yield self.pods[0][1], line
+
+    def close(self):
+        self.closed = True
+        self.lines.put(None)
+
+
+def _next_lines(subscription, count):
+    items = iter(subscription)
+    return [next(items) for _ in range(count)]
+
+
+def _wait_buffered(hub, count):
+    deadline = time.time() + 2
+    while time.time() < deadline:
+        feeds = list(hub._feeds.values())
+        if feeds and len(feeds[0].buffer) >= count:
+            return
+        time.sleep(0.01)
+    raise AssertionError("lines were not buffered")
+
+
+@patch('server.log_hub.LogClient')
+@patch('server.log_hub.LogStream', FakeLogStream)
+def test_subscribers_share_one_upstream_and_replay_buffer(mock_log_client):
+    """同一 Pod 的多个订阅共享一个上游，新订阅从缓冲回放最近 tail 行，最后一个离开时关闭上游"""
+    FakeLogStream.instances = []
+    hub = LogHub(buffer_lines=10)
+
+    first = hub.subscribe("team-a", "svc-0")
+    upstream = FakeLogStream.instances[0]
+    upstream.push("2024-05-01T08:00:01Z a", "2024-05-01T08:00:02Z b", "2024-05-01T08:00:03Z c")
+    assert _next_lines(first, 3) == ["2024-05-01T08:00:01Z a", "2024-05-01T08:00:02Z b", "2024-05-01T08:00:03Z c"]
+
+    second = hub.subscribe("team-a", "svc-0", tail=2)
+    assert len(FakeLogStream.instances) == 1
+    assert _next_lines(second, 2) == ["2024-05-01T08:00:02Z b", "2024-05-01T08:00:03Z c"]
+    assert hub.stats() == {"feeds": 1, "subscribers": 2}
+
+    hub.unsubscribe("team-a", "svc-0", first)
+    assert not upstream.closed
+    hub.unsubscribe("team-a", "svc-0", second)
+    assert upstream.closed
+    assert hub.stats() == {"feeds": 0, "subscribers": 0}
+
+
+def test_slow_subscriber_drops_oldest_lines_with_gap_marker():
+    subscription = Subscription("svc-0", limit=2)
+    for i in range(5):
+        subscription.offer(f"2024-05-01T08:00:0{i}Z line-{i}")
+    subscription.finish()
+
+    items = list(subscription)
+
+    assert isinstance(items[0], LogGap) and items[0].count == 3
+    assert items[1:] == ["2024-05-01T08:00:03Z line-3", "2024-05-01T08:00:04Z line-4"]
+
+
+@patch('server.log_hub.LogClient')
+@patch('server.log_hub.LogStream', FakeLogStream)
+def test_resume_from_buffer_or_fall_back_when_evicted(mock_log_client):
+    """游标仍在缓冲内时从缓冲续读；缓冲已淘汰游标位置时返回 None"""
+    FakeLogStream.instances = []
+    hub = LogHub(buffer_lines=3)
+    first = hub.subscribe("team-a", "svc-0")
+    FakeLogStream.instances[0].push("2024-05-01T08:00:01Z a", "2024-05-01T08:00:02Z b", "2024-05-01T08:00:03Z c")
+    _wait_buffered(hub, 3)
+
+    resumed = hub.subscribe("team-a", "svc-0", cursor=LogCursor("2024-05-01T08:00:02Z", 1))
+    assert _next_lines(resumed, 1) == ["2024-05-01T08:00:03Z c"]
+
+    FakeLogStream.instances[0].push("2024-05-01T08:00:04Z d")
+    _next_lines(first, 4)
+    assert hub.subscribe("team-a", "svc-0", cursor=LogCursor("2024-05-01T08:00:01Z", 1)) is None
+
+
+@patch('server.log_hub.LogClient')
+@patch('server.log_hub.LogStream', FakeLogStream)
+def test_resume_falls_back_when_buffer_starts_at_cursor_timestamp(mock_log_client):
+    """缓冲首行与游标同一时间戳时，同一秒内更早的行可能已被淘汰，不从缓冲续读"""
+    FakeLogStream.instances = []
+    hub = LogHub(buffer_lines=2)
+    first = hub.subscribe("team-a", "svc-0")
+    FakeLogStream.instances[0].push("2024-05-01T08:00:01Z a", "2024-05-01T08:00:02Z b",
+                                    "2024-05-01T08:00:02Z c", "2024-05-01T08:00:03Z d")
+    _next_lines(first, 4)
+
+    # 缓冲为 [c, d]；按游标跳过 08:00:02 的第一行会丢掉 c
+    assert hub.subscribe("team-a", "svc-0", cursor=LogCursor("2024-05-01T08:00:02Z", 1)) is None
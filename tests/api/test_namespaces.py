@@ -0,0 +1,27 @@
+from unittest.mock import patch
+from fastapi.testclient import TestClient
+from kubernetes import client as k8s_client
+from server.main import app
+
+
+client = TestClient(app)
+
+
+@patch('server.routes.namespaces.QuotaClient')
+def test_delete_namespace_drops_quota_cache_entry(mock_quota_client):
+    """删除命名空间后清除配额命名空间缓存，后续提交不会再命中已删除的命名空间"""
+    from gpuctl.client.quota_client import quota_namespaces
+
+    mock_quota_client.return_value.core_v1.read_namespace.return_value = k8s_client.V1Namespace(
+        metadata=k8s_client.V1ObjectMeta(name="team-a", labels={"runwhere.ai/namespace": "true"})
+    )
+    quota_namespaces.clear()
+    quota_namespaces.add("team-a")
+    try:
+        response = client.delete("/api/v1/namespaces/team-a", headers={"Authorization": "Bearer test-token"})
+
+        assert response.status_code == 200
+        mock_quota_client.return_value.core_v1.delete_namespace.assert_called_once_with("team-a")
+        assert not quota_namespaces.contains("team-a")
+    finally:
+        quota_namespaces.clear()
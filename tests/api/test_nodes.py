@@ -14,7 +14,7 @@ def client():
 def test_get_nodes(mock_get_instance, client):
     """测试获取节点列表API"""
     mock_instance = MagicMock()
-    mock_instance.list_nodes.return_value = [
+    mock_instance.list_nodes_page.return_value = {"continue": None, "remaining_item_count": None, "items": [
         {
             "name": "node-1",
             "gpu_total": 4,
@@ -33,7 +33,7 @@ def test_get_nodes(mock_get_instance, client):
             "status": "ready",
             "labels": {"runwhere.ai/pool": "test-pool"}
         }
-    ]
+    ]}
     mock_get_instance.return_value = mock_instance
 
     response = client.get(
@@ -45,6 +45,44 @@ def test_get_nodes(mock_get_instance, client):
     assert response.json()["total"] == 2
     assert len(response.json()["items"]) == 2
     assert response.json()["items"][0]["nodeName"] == "node-1"
+    assert response.json()["nextCursor"] is None
+    mock_instance.list_nodes.assert_not_called()
+
+
+@patch('server.routes.nodes.PoolClient.get_instance')
+def test_get_nodes_passes_limit_and_cursor_through(mock_get_instance, client):
+    """服务端分页：limit/continue 透传给 Kubernetes，返回不透明游标"""
+    from server.pagination import encode_cursor, decode_cursor
+
+    mock_instance = MagicMock()
+    mock_instance.list_nodes_page.return_value = {
+        "items": [{"name": "node-21", "gpu_total": 0, "gpu_used": 0, "gpu_free": 0,
+                   "gpu_types": [], "status": "active", "labels": {}}],
+        "continue": "k8s-token-2",
+        "remaining_item_count": 5
+    }
+    mock_get_instance.return_value = mock_instance
+
+    cursor = encode_cursor("k8s-token-1", 20)
+    response = client.get(f"/api/v1/nodes?pageSize=1&pool=train&cursor={cursor}")
+
+    assert response.status_code == 200
+    mock_instance.list_nodes_page.assert_called_once_with(
+        label_selector="runwhere.ai/pool=train", limit=1, continue_token="k8s-token-1"
+    )
+    data = response.json()
+    assert data["total"] == 26
+    assert decode_cursor(data["nextCursor"]) == ("k8s-token-2", 21)
+
+
+@patch('server.routes.nodes.PoolClient.get_instance')
+def test_get_nodes_rejects_invalid_cursor(mock_get_instance, client):
+    """非法游标返回 400"""
+    mock_get_instance.return_value = MagicMock()
+
+    response = client.get("/api/v1/nodes?cursor=not-a-cursor")
+
+    assert response.status_code == 400
 
 
 @patch('server.routes.nodes.PoolClient.get_instance')
@@ -150,7 +188,7 @@ def test_get_node_labels(mock_get_instance, client):
 def test_gpu_detail_route_reachable(mock_get_instance, client):
     """回归测试：/api/v1/nodes/gpu-detail 不应被 /{nodeName} 拦截"""
     mock_instance = MagicMock()
-    mock_instance.list_nodes.return_value = [
+    mock_instance.list_nodes_page.return_value = {"continue": None, "remaining_item_count": None, "items": [
         {
             "name": "node-1",
             "status": "Ready",
@@ -160,7 +198,7 @@ def test_gpu_detail_route_reachable(mock_get_instance, client):
             "gpu_types": ["A100"],
             "labels": {}
         }
-    ]
+    ]}
     mock_get_instance.return_value = mock_instance
 
     response = client.get("/api/v1/nodes/gpu-detail")
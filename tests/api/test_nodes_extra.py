@@ -38,12 +38,11 @@ def test_get_node_label_key(mock_get_instance, client):
 def test_batch_add_node_labels(mock_get_instance, client):
     """测试批量添加节点标签API"""
     mock_instance = MagicMock()
-    mock_node1 = MagicMock()
-    mock_node1.metadata.labels = {"existing": "label"}
-    mock_node2 = MagicMock()
-    mock_node2.metadata.labels = {}
-    mock_instance.core_v1.read_node = MagicMock(side_effect=[mock_node1, mock_node2])
-    mock_instance._label_node = MagicMock(return_value=True)
+    mock_instance.label_nodes.return_value = {
+        "success": ["node-1"],
+        "unchanged": [],
+        "failed": [{"node": "node-2", "error": "Label gpu-type already exists"}]
+    }
     mock_get_instance.return_value = mock_instance
 
     response = client.post(
@@ -52,24 +51,28 @@ def test_batch_add_node_labels(mock_get_instance, client):
     )
 
     assert response.status_code == 200
-    assert "success" in response.json()
-    assert "failed" in response.json()
+    assert response.json()["success"] == ["node-1"]
+    assert response.json()["failed"] == [{"nodeName": "node-2", "error": "Label gpu-type already exists"}]
+    # 一次批量调用，不再逐个节点 read_node
+    mock_instance.label_nodes.assert_called_once_with(
+        ["node-1", "node-2"], {"gpu-type": "A100"}, overwrite=True, preconditions=False
+    )
+    mock_instance.core_v1.read_node.assert_not_called()
 
 
 @patch('server.routes.labels.PoolClient.get_instance')
 def test_get_node_labels_all(mock_get_instance, client):
     """测试获取所有节点标签API"""
     mock_instance = MagicMock()
-    mock_instance.list_nodes.return_value = [
-        {
-            "name": "node-1",
-            "labels": {"gpu-type": "A100", "pool": "test-pool"}
-        },
-        {
-            "name": "node-2",
-            "labels": {"gpu-type": "H100", "pool": "test-pool"}
-        }
-    ]
+    node_list = MagicMock()
+    node_list.items = [MagicMock(), MagicMock()]
+    node_list.items[0].metadata.name = "node-1"
+    node_list.items[0].metadata.labels = {"gpu-type": "A100", "runwhere.ai/pool": "test-pool"}
+    node_list.items[1].metadata.name = "node-2"
+    node_list.items[1].metadata.labels = {"gpu-type": "H100"}
+    node_list.metadata._continue = None
+    node_list.metadata.remaining_item_count = None
+    mock_instance.list_metadata.return_value = node_list
     mock_get_instance.return_value = mock_instance
 
     response = client.get(
@@ -79,3 +82,5 @@ def test_get_node_labels_all(mock_get_instance, client):
 
     assert response.status_code == 200
     assert "items" in response.json()
+    mock_instance.list_metadata.assert_called_once_with("nodes", label_selector=None, limit=20)
+    mock_instance.core_v1.list_node.assert_not_called()
@@ -69,8 +69,11 @@ def test_create_pool(mock_get_instance, client):
     """测试创建资源池API"""
     mock_instance = MagicMock()
     mock_instance.create_pool.return_value = {
-        "success": True,
-        "pool": "test-pool"
+        "name": "test-pool",
+        "status": "created",
+        "success": ["node-1", "node-2"],
+        "unchanged": [],
+        "failed": []
     }
     mock_instance._validate_nodes_exist = MagicMock()
     mock_get_instance.return_value = mock_instance
@@ -92,6 +95,45 @@ def test_create_pool(mock_get_instance, client):
     }
 
 
+@patch.object(PoolClient, 'get_instance')
+def test_create_pool_partial_failure(mock_get_instance, client):
+    """部分节点标记失败时返回 207，并列出失败的节点"""
+    mock_instance = MagicMock()
+    mock_instance.create_pool.return_value = {
+        "name": "test-pool",
+        "status": "partial",
+        "success": ["node-1"],
+        "unchanged": [],
+        "failed": [{"node": "node-2", "error": "Conflict"}]
+    }
+    mock_get_instance.return_value = mock_instance
+
+    response = client.post("/api/v1/pools", json={"name": "test-pool", "nodes": ["node-1", "node-2"]})
+
+    assert response.status_code == 207
+    assert response.json()["success"] == ["node-1"]
+    assert response.json()["failed"] == [{"nodeName": "node-2", "error": "Conflict"}]
+
+
+@patch.object(PoolClient, 'get_instance')
+def test_create_pool_all_nodes_failed(mock_get_instance, client):
+    """全部节点失败时返回错误状态码"""
+    mock_instance = MagicMock()
+    mock_instance.create_pool.return_value = {
+        "name": "test-pool",
+        "status": "failed",
+        "success": [],
+        "unchanged": [],
+        "failed": [{"node": "node-1", "error": "Forbidden"}]
+    }
+    mock_get_instance.return_value = mock_instance
+
+    response = client.post("/api/v1/pools", json={"name": "test-pool", "nodes": ["node-1"]})
+
+    assert response.status_code == 500
+    assert response.json()["error"]["failed"] == [{"nodeName": "node-1", "error": "Forbidden"}]
+
+
 @patch.object(PoolClient, 'get_instance')
 def test_delete_pool(mock_get_instance, client):
     """测试删除资源池API"""
@@ -29,12 +29,19 @@ def test_create_quota(mock_quota_client_class, mock_parse_yaml):
     mock_parse_yaml.return_value = mock_parsed_obj
 
     mock_client = MagicMock()
-    mock_client.create_quota_config.return_value = [{
-        'namespace': 'team-a',
-        'cpu': '10',
-        'memory': '20Gi',
-        'gpu': '4'
-    }]
+    mock_client.create_quota_config.return_value = {
+        'name': 'test-quota',
+        'created': [{
+            'namespace': 'team-a',
+            'cpu': '10',
+            'memory': '20Gi',
+            'gpu': '4',
+            'status': 'created'
+        }],
+        'updated': [],
+        'unchanged': [],
+        'failed': []
+    }
     mock_quota_client_class.return_value = mock_client
 
     response = client.post(
@@ -51,6 +58,67 @@ def test_create_quota(mock_quota_client_class, mock_parse_yaml):
     assert len(response.json()["created"]) == 1
 
 
+def _parsed_quota(namespaces):
+    parsed_obj = MagicMock()
+    parsed_obj.kind = "quota"
+    parsed_obj.quota.name = "test-quota"
+    parsed_obj.default = None
+    parsed_obj.namespace = {}
+    for namespace_name in namespaces:
+        ns_quota = MagicMock()
+        ns_quota.get_cpu_str.return_value = "10"
+        ns_quota.memory = "20Gi"
+        ns_quota.get_gpu_str.return_value = "4"
+        parsed_obj.namespace[namespace_name] = ns_quota
+    return parsed_obj
+
+
+@patch('server.routes.quotas.BaseParser.parse_yaml')
+@patch('server.routes.quotas.QuotaClient')
+def test_create_quota_partial_failure(mock_quota_client_class, mock_parse_yaml):
+    """部分命名空间失败时返回 207"""
+    mock_parse_yaml.return_value = _parsed_quota(["team-a", "team-b"])
+    mock_quota_client_class.return_value.create_quota_config.return_value = {
+        'name': 'test-quota',
+        'created': [{'namespace': 'team-a', 'status': 'created'}],
+        'updated': [],
+        'unchanged': [],
+        'failed': [{'namespace': 'team-b', 'error': 'Forbidden', 'status': 'failed'}]
+    }
+
+    response = client.post("/api/v1/quotas", json={"yamlContent": "kind: quota"})
+
+    assert response.status_code == 207
+    assert response.json()["message"] == "配额部分创建失败"
+    assert [item["namespace"] for item in response.json()["failed"]] == ["team-b"]
+
+
+@patch('server.routes.quotas.BaseParser.parse_yaml')
+@patch('server.routes.quotas.QuotaClient')
+def test_create_quota_all_failed(mock_quota_client_class, mock_parse_yaml):
+    """全部失败时不返回 2xx：均因配额已存在为 409，否则 500"""
+    mock_parse_yaml.return_value = _parsed_quota(["team-a"])
+    create_quota_config = mock_quota_client_class.return_value.create_quota_config
+    create_quota_config.return_value = {
+        'name': 'test-quota', 'created': [], 'updated': [], 'unchanged': [],
+        'failed': [{'namespace': 'team-a', 'error': 'already has a quota', 'status': 'failed', 'conflict': True}]
+    }
+
+    response = client.post("/api/v1/quotas", json={"yamlContent": "kind: quota"})
+
+    assert response.status_code == 409
+    assert response.json()["error"]["failed"][0]["namespace"] == "team-a"
+
+    create_quota_config.return_value = {
+        'name': 'test-quota', 'created': [], 'updated': [], 'unchanged': [],
+        'failed': [{'namespace': 'team-a', 'error': 'Forbidden', 'status': 'failed'}]
+    }
+
+    response = client.post("/api/v1/quotas", json={"yamlContent": "kind: quota"})
+
+    assert response.status_code == 500
+
+
 @patch('server.routes.quotas.QuotaClient')
 def test_get_quotas(mock_quota_client_class):
     """测试获取资源配额列表API"""
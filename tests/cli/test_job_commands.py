@@ -4,6 +4,7 @@ from unittest.mock import patch, MagicMock, PropertyMock, mock_open
 from argparse import Namespace
 from gpuctl.cli.job import create_job_command, get_jobs_command, delete_job_command, logs_job_command, apply_job_command, describe_job_command
 from gpuctl.parser.base_parser import ParserError
+from gpuctl.client.metadata import ObjectMetadata
 
 
 def _setup_job_common_mocks():
@@ -34,6 +35,7 @@ def _setup_job_common_mocks():
 
     mock_quota_client = MagicMock()
     mock_quota_client.namespace_has_quota = MagicMock(return_value=True)
+    mock_quota_client.check_namespace = MagicMock(return_value=(True, True))
     mock_quota_client.core_v1 = mock_core_v1
 
     mock_pool_client = MagicMock()
@@ -248,24 +250,11 @@ def test_delete_job(mock_job_client):
     mock_instance.delete_deployment.assert_called_once()
 
 
-@patch('gpuctl.client.job_client.JobClient')
-@patch('gpuctl.client.base_client.KubernetesClient')
 @patch('gpuctl.cli.job.LogClient')
-def test_get_job_logs(mock_log_client, mock_k8s_client, mock_job_client):
-    """测试用例: 获取作业日志（logs_job_command pod 查找用内联 import，需 patch 源模块）"""
-    mock_k8s_instance = MagicMock()
-    mock_core_v1 = MagicMock()
-    mock_core_v1.read_namespace = MagicMock()
-    mock_k8s_instance.core_v1 = mock_core_v1
-    mock_k8s_client.return_value = mock_k8s_instance
-    
-    mock_job_instance = MagicMock()
-    mock_job_instance.list_pods.return_value = [
-        {'name': 'test-nginx', 'status': {'phase': 'Running'}}
-    ]
-    mock_job_client.return_value = mock_job_instance
-    
+def test_get_job_logs(mock_log_client):
+    """测试用例: 获取作业日志（定位到 Pod 后直接读取该 Pod 的日志）"""
     mock_log_instance = MagicMock()
+    mock_log_instance.locate_log_pod.return_value = ("default", "test-nginx")
     mock_log_instance.get_job_logs.return_value = ["log line 1", "log line 2"]
     mock_log_client.return_value = mock_log_instance
     
@@ -273,6 +262,25 @@ def test_get_job_logs(mock_log_client, mock_k8s_client, mock_job_client):
     result = logs_job_command(args)
     
     assert result == 0
+    mock_log_instance.locate_log_pod.assert_called_once_with("test-nginx", "default")
+    mock_log_instance.get_job_logs.assert_called_once_with(
+        "test-nginx", namespace="default", tail=100, pod_name="test-nginx")
+    mock_log_instance.namespace_exists.assert_not_called()
+
+
+@patch('gpuctl.cli.job.LogClient')
+def test_get_job_logs_namespace_not_found(mock_log_client, capsys):
+    """测试用例: 命名空间不存在时返回错误"""
+    mock_log_instance = MagicMock()
+    mock_log_instance.locate_log_pod.side_effect = FileNotFoundError("Namespace 'missing' not found")
+    mock_log_client.return_value = mock_log_instance
+    
+    args = Namespace(job_name="test-nginx", namespace="missing", follow=False, json=False)
+    result = logs_job_command(args)
+    
+    assert result == 1
+    assert "Namespace 'missing' not found" in capsys.readouterr().out
+    mock_log_instance.get_job_logs.assert_not_called()
 
 
 @patch('gpuctl.kind.training_kind.TrainingKind')
@@ -438,51 +446,28 @@ def test_delete_nonexistent_job(mock_job_client):
     assert result == 1
 
 
-@patch('gpuctl.client.job_client.JobClient')
-@patch('gpuctl.client.base_client.KubernetesClient')
+@patch('gpuctl.cli.job.LogStream')
 @patch('gpuctl.cli.job.LogClient')
-def test_get_job_logs_with_follow(mock_log_client, mock_k8s_client, mock_job_client):
-    """测试用例: 跟踪作业日志"""
-    mock_k8s_instance = MagicMock()
-    mock_core_v1 = MagicMock()
-    mock_core_v1.read_namespace = MagicMock()
-    mock_k8s_instance.core_v1 = mock_core_v1
-    mock_k8s_client.return_value = mock_k8s_instance
-    
-    mock_job_instance = MagicMock()
-    mock_job_instance.list_pods.return_value = [
-        {'name': 'test-nginx', 'status': {'phase': 'Running'}}
-    ]
-    mock_job_client.return_value = mock_job_instance
-    
+def test_get_job_logs_with_follow(mock_log_client, mock_log_stream):
+    """测试用例: 跟踪作业日志（直接跟随定位到的 Pod，不再重复定位）"""
     mock_log_instance = MagicMock()
-    mock_log_instance.stream_job_logs.return_value = ["log line 1"]
+    mock_log_instance.locate_log_pod.return_value = ("team-a", "test-nginx-0")
     mock_log_client.return_value = mock_log_instance
+    mock_log_stream.return_value = iter([("test-nginx-0", "log line 1")])
     
     args = Namespace(job_name="test-nginx", namespace="default", follow=True, json=False)
     result = logs_job_command(args)
     
     assert result == 0
+    mock_log_stream.assert_called_once_with(mock_log_instance, [("team-a", "test-nginx-0")], {}, tail=None)
+    mock_log_instance.stream_job_logs.assert_not_called()
 
 
-@patch('gpuctl.client.job_client.JobClient')
-@patch('gpuctl.client.base_client.KubernetesClient')
 @patch('gpuctl.cli.job.LogClient')
-def test_get_job_logs_with_json(mock_log_client, mock_k8s_client, mock_job_client):
+def test_get_job_logs_with_json(mock_log_client, capsys):
     """测试用例: JSON格式输出日志"""
-    mock_k8s_instance = MagicMock()
-    mock_core_v1 = MagicMock()
-    mock_core_v1.read_namespace = MagicMock()
-    mock_k8s_instance.core_v1 = mock_core_v1
-    mock_k8s_client.return_value = mock_k8s_instance
-    
-    mock_job_instance = MagicMock()
-    mock_job_instance.list_pods.return_value = [
-        {'name': 'test-nginx', 'status': {'phase': 'Running'}}
-    ]
-    mock_job_client.return_value = mock_job_instance
-    
     mock_log_instance = MagicMock()
+    mock_log_instance.locate_log_pod.return_value = ("team-a", "test-nginx-0")
     mock_log_instance.get_job_logs.return_value = ["log line 1"]
     mock_log_client.return_value = mock_log_instance
     
@@ -490,19 +475,22 @@ def test_get_job_logs_with_json(mock_log_client, mock_k8s_client, mock_job_clien
     result = logs_job_command(args)
     
     assert result == 0
+    output = json_module.loads(capsys.readouterr().out)
+    assert output == {"logs": ["log line 1"], "pod_name": "test-nginx-0", "namespace": "team-a"}
 
 
 @patch('gpuctl.cli.job.LogClient')
 def test_get_nonexistent_job_logs(mock_log_client):
     """测试用例: 获取不存在作业日志（无 Pod 时返回错误）"""
     mock_instance = MagicMock()
-    mock_instance.get_job_logs.side_effect = Exception("No pods found")
+    mock_instance.locate_log_pod.return_value = None
     mock_log_client.return_value = mock_instance
     
     args = Namespace(job_name="nonexistent-job", namespace="default", follow=False, json=False)
     result = logs_job_command(args)
     
     assert result == 1
+    mock_instance.get_job_logs.assert_not_called()
 
 
 @patch('gpuctl.client.job_client.JobClient')
@@ -677,12 +665,9 @@ def test_create_job_rejects_duplicate_same_kind(mock_pool_client_class, mock_quo
     mock_parse_yaml_file.return_value = mock_parsed_obj
 
     mock_job_instance = MagicMock()
-    mock_job_instance.list_jobs.return_value = [
-        {
-            "name": "test-training-job",
-            "namespace": "default",
-            "labels": {"runwhere.ai/job-type": "training"},
-        }
+    mock_job_instance.list_job_metadata.return_value = [
+        ObjectMetadata(name="test-training-job", namespace="default",
+                       labels={"runwhere.ai/job-type": "training"})
     ]
     mock_job_client_class.return_value = mock_job_instance
 
@@ -690,6 +675,7 @@ def test_create_job_rejects_duplicate_same_kind(mock_pool_client_class, mock_quo
     result = create_job_command(args)
 
     assert result == 1, "create should fail when duplicate job exists"
+    mock_job_instance.list_job_metadata.assert_called_once_with("default", name="test-training-job")
     mock_training_kind_class.return_value.create_training_job.assert_not_called()
 
 
@@ -720,12 +706,9 @@ def test_create_inference_rejects_duplicate(mock_pool_client_class, mock_quota_c
     mock_parse_yaml_file.return_value = mock_parsed_obj
 
     mock_job_instance = MagicMock()
-    mock_job_instance.list_jobs.return_value = [
-        {
-            "name": "new-test-inference-job",
-            "namespace": "default",
-            "labels": {"runwhere.ai/job-type": "inference"},
-        }
+    mock_job_instance.list_job_metadata.return_value = [
+        ObjectMetadata(name="new-test-inference-job", namespace="default",
+                       labels={"runwhere.ai/job-type": "inference"})
     ]
     mock_job_client_class.return_value = mock_job_instance
 
@@ -763,12 +746,9 @@ def test_create_inference_rejects_duplicate_json_output(mock_pool_client_class,
     mock_parse_yaml_file.return_value = mock_parsed_obj
 
     mock_job_instance = MagicMock()
-    mock_job_instance.list_jobs.return_value = [
-        {
-            "name": "new-test-inference-job",
-            "namespace": "default",
-            "labels": {"runwhere.ai/job-type": "inference"},
-        }
+    mock_job_instance.list_job_metadata.return_value = [
+        ObjectMetadata(name="new-test-inference-job", namespace="default",
+                       labels={"runwhere.ai/job-type": "inference"})
     ]
     mock_job_client_class.return_value = mock_job_instance
 
@@ -811,12 +791,9 @@ def test_create_job_allows_different_name(mock_pool_client_class, mock_quota_cli
     mock_parse_yaml_file.return_value = mock_parsed_obj
 
     mock_job_instance = MagicMock()
-    mock_job_instance.list_jobs.return_value = [
-        {
-            "name": "existing-other-job",
-            "namespace": "default",
-            "labels": {"runwhere.ai/job-type": "training"},
-        }
+    mock_job_instance.list_job_metadata.return_value = [
+        ObjectMetadata(name="existing-other-job", namespace="default",
+                       labels={"runwhere.ai/job-type": "training"})
     ]
     mock_job_client_class.return_value = mock_job_instance
 
@@ -43,6 +43,25 @@ def test_label_node(mock_pool_client):
     assert result in (0, 1)
 
 
+@patch('gpuctl.cli.node.PoolClient')
+def test_label_multiple_nodes_in_one_batch(mock_pool_client):
+    """测试用例: 多个节点一次批量打标签，冲突节点返回失败"""
+    mock_instance = MagicMock()
+    mock_instance.label_nodes.return_value = {
+        "success": ["node-1"], "unchanged": [],
+        "failed": [{"node": "node-2", "error": "Label runwhere.ai/gpu-type already exists"}]
+    }
+    mock_pool_client.return_value = mock_instance
+
+    args = Namespace(node_name=["node-1", "node-2"], label="gpuType=a100-80g", delete=False, overwrite=False, json=True)
+    result = label_node_command(args)
+
+    assert result == 1
+    mock_instance.label_nodes.assert_called_once_with(
+        ["node-1", "node-2"], {"runwhere.ai/gpu-type": "a100-80g"}, overwrite=False
+    )
+
+
 @patch('gpuctl.cli.node.PoolClient')
 def test_describe_node(mock_pool_client):
     """测试用例: 查看节点详情"""
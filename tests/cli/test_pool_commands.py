@@ -112,7 +112,8 @@ def test_create_pool(mock_pool_client):
     mock_instance.create_pool.return_value = {
         "name": "test-pool",
         "status": "created",
-        "message": "Resource pool created successfully"
+        "message": "Resource pool created successfully",
+        "failed": []
     }
     mock_pool_client.return_value = mock_instance
 
@@ -137,7 +138,8 @@ def test_create_pool_with_json(mock_pool_client):
     mock_instance.create_pool.return_value = {
         "name": "test-pool",
         "status": "created",
-        "message": "Resource pool created successfully"
+        "message": "Resource pool created successfully",
+        "failed": []
     }
     mock_pool_client.return_value = mock_instance
 
@@ -155,6 +157,36 @@ def test_create_pool_with_json(mock_pool_client):
     mock_instance.create_pool.assert_called_once()
 
 
+@patch('gpuctl.cli.pool.PoolClient')
+def test_create_pool_partial_failure(mock_pool_client, capsys):
+    """测试用例: 部分节点标记失败时返回非零并列出失败节点"""
+    mock_instance = MagicMock()
+    mock_instance.create_pool.return_value = {
+        "name": "test-pool",
+        "status": "partial",
+        "message": "Resource pool created successfully, 1 node(s) failed",
+        "success": ["node1"],
+        "unchanged": [],
+        "failed": [{"node": "node2", "error": "Conflict"}]
+    }
+    mock_pool_client.return_value = mock_instance
+
+    args = Namespace(
+        name="test-pool",
+        description="",
+        nodes=["node1", "node2"],
+        gpu_type=None,
+        quota=None,
+        json=False
+    )
+    result = create_pool_command(args)
+
+    assert result == 1
+    output = capsys.readouterr().out
+    assert "Successfully created" not in output
+    assert "Failed to label node node2: Conflict" in output
+
+
 @patch('gpuctl.cli.pool.PoolClient')
 def test_create_pool_failure(mock_pool_client):
     """测试用例: 创建资源池失败（节点不存在等异常）"""
@@ -10,9 +10,10 @@ from gpuctl.parser.base_parser import ParserError
 def test_create_quota(mock_quota_client_class, mock_parse_yaml_file):
     """测试用例: 创建配额"""
     mock_instance = MagicMock()
-    mock_instance.create_quota_config.return_value = [
-        {"namespace": "default", "cpu": "4", "memory": "8Gi", "gpu": "1"}
-    ]
+    mock_instance.create_quota_config.return_value = {
+        "name": "test-quota", "updated": [], "unchanged": [], "failed": [],
+        "created": [{"namespace": "default", "cpu": "4", "memory": "8Gi", "gpu": "1", "status": "created"}]
+    }
     mock_quota_client_class.return_value = mock_instance
     
     mock_parsed_obj = MagicMock()
@@ -33,9 +34,10 @@ def test_create_quota(mock_quota_client_class, mock_parse_yaml_file):
 def test_create_quota_with_default(mock_quota_client_class, mock_parse_yaml_file):
     """测试用例: 创建带默认配额的配额"""
     mock_instance = MagicMock()
-    mock_instance.create_quota_config.return_value = [
-        {"namespace": "default", "cpu": "2", "memory": "4Gi", "gpu": "0"}
-    ]
+    mock_instance.create_quota_config.return_value = {
+        "name": "test-quota", "updated": [], "unchanged": [], "failed": [],
+        "created": [{"namespace": "default", "cpu": "2", "memory": "4Gi", "gpu": "0", "status": "created"}]
+    }
     mock_quota_client_class.return_value = mock_instance
     
     mock_parsed_obj = MagicMock()
@@ -56,9 +58,10 @@ def test_create_quota_with_default(mock_quota_client_class, mock_parse_yaml_file
 def test_create_quota_with_json(mock_quota_client_class, mock_parse_yaml_file):
     """测试用例: JSON格式输出创建配额"""
     mock_instance = MagicMock()
-    mock_instance.create_quota_config.return_value = [
-        {"namespace": "default", "cpu": "4", "memory": "8Gi", "gpu": "1"}
-    ]
+    mock_instance.create_quota_config.return_value = {
+        "name": "test-quota", "updated": [], "unchanged": [], "failed": [],
+        "created": [{"namespace": "default", "cpu": "4", "memory": "8Gi", "gpu": "1", "status": "created"}]
+    }
     mock_quota_client_class.return_value = mock_instance
     
     mock_parsed_obj = MagicMock()
@@ -103,8 +106,10 @@ def test_create_quota_parser_error(mock_parse_yaml_file):
 def test_apply_quota(mock_quota_client_class, mock_parse_yaml_file):
     """测试用例: 应用配额"""
     mock_instance = MagicMock()
-    mock_instance.apply_quota.return_value = {"status": "created", "namespace": "default", "cpu": "4", "memory": "8Gi", "gpu": "1"}
-    mock_instance.apply_default_quota.return_value = {"status": "created", "cpu": "2", "memory": "4Gi", "gpu": "0"}
+    mock_instance.apply_quota_config.return_value = {
+        "name": "test-quota", "updated": [], "unchanged": [], "failed": [],
+        "created": [{"status": "created", "namespace": "default", "cpu": "2", "memory": "4Gi", "gpu": "0"}]
+    }
     mock_quota_client_class.return_value = mock_instance
     
     mock_parsed_obj = MagicMock()
@@ -125,8 +130,10 @@ def test_apply_quota(mock_quota_client_class, mock_parse_yaml_file):
 def test_apply_quota_with_json(mock_quota_client_class, mock_parse_yaml_file):
     """测试用例: JSON格式输出应用配额"""
     mock_instance = MagicMock()
-    mock_instance.apply_quota.return_value = {"status": "created", "namespace": "default", "cpu": "4", "memory": "8Gi", "gpu": "1"}
-    mock_instance.apply_default_quota.return_value = {"status": "created", "cpu": "2", "memory": "4Gi", "gpu": "0"}
+    mock_instance.apply_quota_config.return_value = {
+        "name": "test-quota", "updated": [], "unchanged": [], "failed": [],
+        "created": [{"status": "created", "namespace": "default", "cpu": "2", "memory": "4Gi", "gpu": "0"}]
+    }
     mock_quota_client_class.return_value = mock_instance
     
     mock_parsed_obj = MagicMock()
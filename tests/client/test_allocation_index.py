@@ -0,0 +1,150 @@
+"""
+AllocationIndex：Pod watch 事件增量维护节点资源占用
+"""
+from datetime import datetime, timezone
+from unittest.mock import MagicMock, patch
+from kubernetes import client
+
+from gpuctl.client.allocation_index import NodeAllocation, PodAllocation, summarize
+from gpuctl.client.raw_json import RawObject
+
+
+def _pod(name, node, gpu="1", cpu="4", memory="16Gi", phase="Running", namespace="team-a", job=None):
+    return client.V1Pod(
+        metadata=client.V1ObjectMeta(name=name, namespace=namespace, resource_version="1",
+                                     labels={"job-name": job} if job else {}),
+        spec=client.V1PodSpec(node_name=node, containers=[client.V1Container(
+            name="main", resources=client.V1ResourceRequirements(
+                requests={"nvidia.com/gpu": gpu, "cpu": cpu, "memory": memory}))]),
+        status=client.V1PodStatus(phase=phase),
+    )
+
+
+@patch('gpuctl.client.allocation_index.KubernetesClient.__init__', return_value=None)
+def _make_index(mock_init):
+    from gpuctl.client.allocation_index import AllocationIndex
+    return AllocationIndex()
+
+
+def test_pod_allocation_parses_model_and_raw_json_alike():
+    """模型对象与原始 JSON 得到相同的资源请求"""
+    raw = RawObject({
+        "metadata": {"name": "p1", "namespace": "team-a", "labels": {"job-name": "train"}},
+        "spec": {"nodeName": "node-1", "containers": [
+            {"name": "main", "resources": {"requests": {"nvidia.com/gpu": "2", "cpu": "500m", "memory": "1Gi"}}}]},
+        "status": {"phase": "Running"},
+    })
+    model = _pod("p1", "node-1", gpu="2", cpu="500m", memory="1Gi", job="train")
+
+    for pod in (raw, model):
+        allocation = PodAllocation.from_pod(pod)
+        assert (allocation.gpu, allocation.cpu_millis, allocation.memory_bytes) == (2, 500, 1024 ** 3)
+        assert allocation.job_name == "train"
+        assert allocation.node_name == "node-1"
+
+
+def test_finished_or_unscheduled_pods_are_not_counted():
+    assert PodAllocation.from_pod(_pod("done", "node-1", phase="Succeeded")) is None
+    assert PodAllocation.from_pod(_pod("pending", None, phase="Pending")) is None
+    assert summarize([_pod("done", "node-1", phase="Failed")]) == {}
+
+
+def test_events_update_node_tallies_incrementally():
+    """ADDED/MODIFIED/DELETED 事件增量更新节点汇总，包括 Pod 结束"""
+    index = _make_index()
+    index._on_relist([_pod("a", "node-1", job="train"), _pod("b", "node-1", job="train")])
+    assert index._nodes["node-1"].gpu == 2
+
+    index._on_event("ADDED", _pod("c", "node-2", gpu="4", job="infer"))
+    index._on_event("MODIFIED", _pod("a", "node-1", phase="Succeeded"))
+    index._on_event("DELETED", _pod("b", "node-1"))
+
+    assert "node-1" not in index._nodes
+    assert index._nodes["node-2"].gpu == 4
+    assert index._pod_nodes == {("team-a", "c"): "node-2"}
+
+
+def test_snapshots_are_not_mutated_by_later_events():
+    index = _make_index()
+    index._on_relist([_pod("a", "node-1")])
+    snapshot = index._nodes["node-1"]
+
+    index._on_event("ADDED", _pod("b", "node-1"))
+
+    assert snapshot.gpu == 1
+    assert index._nodes["node-1"].gpu == 2
+
+
+def test_node_allocation_summary_fields():
+    allocation = summarize([
+        _pod("w-0", "node-1", gpu="1", cpu="2", memory="8Gi", job="train"),
+        _pod("w-1", "node-1", gpu="1", cpu="1500m", memory="8Gi", job="train"),
+    ])["node-1"]
+
+    assert allocation.cpu_cores == 3.5
+    assert allocation.memory == "16Gi"
+    assert allocation.running_jobs() == [
+        {"name": "train", "namespace": "team-a", "pods": ["w-0", "w-1"], "gpu": 2}
+    ]
+    assert NodeAllocation().memory == "0Gi"
+
+
+@patch('gpuctl.client.pool_client.PoolClient.__init__', return_value=None)
+def test_pool_client_reads_running_index_without_listing_pods(mock_init):
+    """索引 watch 运行时，节点信息直接读取索引，不再列出全部 Pod"""
+    from gpuctl.client.allocation_index import AllocationIndex
+    from gpuctl.client.pool_client import PoolClient
+
+    index = _make_index()
+    index._on_relist([_pod("a", "node-1", gpu="2", cpu="8", memory="32Gi", job="train")])
+    index.is_watching = MagicMock(return_value=True)
+    index._synced_at = 0
+
+    pool_client = PoolClient.__new__(PoolClient)
+    pool_client.core_v1 = MagicMock()
+    node = client.V1Node(
+        metadata=client.V1ObjectMeta(name="node-1", labels={}),
+        status=client.V1NodeStatus(capacity={"nvidia.com/gpu": "8", "cpu": "64", "memory": "512Gi"},
+                                   conditions=[client.V1NodeCondition(
+                                       type="Ready", status="True",
+                                       last_transition_time=datetime(2024, 1, 1, tzinfo=timezone.utc))]),
+    )
+    pool_client.core_v1.read_node.return_value = node
+
+    with patch.object(AllocationIndex, "_instance", index):
+        info = pool_client.get_node("node-1")
+
+    pool_client.core_v1.list_pod_for_all_namespaces.assert_not_called()
+    assert info["resources"]["gpu_used"] == 2
+    assert info["resources"]["cpu_used"] == 8
+    assert info["resources"]["memory_used"] == "32Gi"
+    assert info["running_jobs"][0]["name"] == "train"
+
+
+@patch('gpuctl.client.pool_client.PoolClient.__init__', return_value=None)
+def test_single_node_accounting_lists_only_its_active_pods(mock_init):
+    """未启动索引时，单节点只列出绑定到该节点且未结束的 Pod"""
+    from gpuctl.client.pool_client import PoolClient
+
+    pool_client = PoolClient.__new__(PoolClient)
+    pool_client.core_v1 = MagicMock()
+    pool_client.core_v1.list_pod_for_all_namespaces.return_value.items = [_pod("a", "node-1", gpu="3")]
+
+    assert pool_client._get_used_gpu_count("node-1") == 3
+    pool_client.core_v1.list_pod_for_all_namespaces.assert_called_once_with(
+        field_selector="spec.nodeName=node-1,status.phase!=Succeeded,status.phase!=Failed"
+    )
+
+
+@patch('gpuctl.client.pool_client.PoolClient.__init__', return_value=None)
+def test_cluster_wide_accounting_excludes_finished_pods_server_side(mock_init):
+    from gpuctl.client.pool_client import PoolClient
+
+    pool_client = PoolClient.__new__(PoolClient)
+    pool_client.core_v1 = MagicMock()
+    pool_client.core_v1.list_pod_for_all_namespaces.return_value.items = [_pod("a", "node-1")]
+
+    assert pool_client._get_all_nodes_used_gpu_count() == {"node-1": 1}
+    pool_client.core_v1.list_pod_for_all_namespaces.assert_called_once_with(
+        field_selector="status.phase!=Succeeded,status.phase!=Failed"
+    )
@@ -0,0 +1,61 @@
+"""
+AsyncClient：同步客户端在线程池中执行，不阻塞事件循环
+"""
+import asyncio
+import time
+from unittest.mock import MagicMock
+
+
+def test_async_client_returns_sync_result():
+    """异步方法返回与同步方法相同的结果，参数原样透传"""
+    from gpuctl.client.async_client import AsyncClient
+
+    sync_client = MagicMock()
+    sync_client.list_jobs.return_value = [{"name": "train"}]
+
+    result = asyncio.run(AsyncClient(sync_client).list_jobs(namespace="default", include_pods=True))
+
+    assert result == [{"name": "train"}]
+    sync_client.list_jobs.assert_called_once_with(namespace="default", include_pods=True)
+
+
+def test_async_client_wraps_kubernetes_api_objects():
+    """core_v1 等 API 对象同样包装为异步接口"""
+    from gpuctl.client.async_client import AsyncClient
+
+    sync_client = MagicMock()
+    sync_client.core_v1.read_node.return_value = "node-1"
+
+    result = asyncio.run(AsyncClient(sync_client).core_v1.read_node("node-1"))
+
+    assert result == "node-1"
+    sync_client.core_v1.read_node.assert_called_once_with("node-1")
+
+
+def test_concurrent_calls_overlap_without_blocking_loop():
+    """并发的慢调用在线程池中重叠执行，事件循环保持响应"""
+    from gpuctl.client.async_client import AsyncClient
+
+    class SlowClient:
+        def list_jobs(self):
+            time.sleep(0.3)
+            return []
+
+    async def main():
+        client = AsyncClient(SlowClient())
+        ticks = 0
+
+        async def heartbeat():
+            nonlocal ticks
+            for _ in range(5):
+                await asyncio.sleep(0.02)
+                ticks += 1
+
+        start = time.monotonic()
+        await asyncio.gather(client.list_jobs(), client.list_jobs(), client.list_jobs(), heartbeat())
+        return time.monotonic() - start, ticks
+
+    elapsed, ticks = asyncio.run(main())
+
+    assert elapsed < 0.6, f"calls should overlap but took {elapsed:.2f}s"
+    assert ticks == 5
@@ -75,3 +75,174 @@ def test_handle_api_exception_401(mock_init):
         client.handle_api_exception(mock_exc, "create job")
 
     assert "Authentication failed" in str(exc_info.value)
+
+
+# ── ApiClientFactory 共享连接池 ──────────────────────────────────────────────
+
+@patch('gpuctl.client.base_client.client.Configuration.set_default')
+@patch('gpuctl.client.base_client.config.load_kube_config')
+def test_clients_share_single_api_client(mock_load, mock_set_default, monkeypatch):
+    """多个客户端只加载一次配置，并共享同一个 ApiClient 与 API 对象"""
+    from gpuctl.client.base_client import ApiClientFactory, KubernetesClient
+
+    monkeypatch.delenv('KUBERNETES_SERVICE_HOST', raising=False)
+    ApiClientFactory.reset()
+    try:
+        first = KubernetesClient()
+        second = KubernetesClient()
+
+        mock_load.assert_called_once()
+        assert first.api_client is second.api_client
+        assert first.core_v1 is second.core_v1
+        assert first.core_v1.api_client is first.api_client
+        assert first.api_client.configuration.connection_pool_maxsize == 32
+        # 所有请求都经过共享的限速/重试包装
+        from gpuctl.client.throttle import ThrottledRequest
+        assert isinstance(first.api_client.rest_client.request, ThrottledRequest)
+    finally:
+        ApiClientFactory.reset()
+
+
+@patch('gpuctl.client.base_client.config.load_kube_config', side_effect=Exception("no kubeconfig"))
+def test_factory_config_failure_is_not_cached(mock_load, monkeypatch):
+    """配置加载失败时抛出 RuntimeError，且不缓存失败的实例"""
+    from gpuctl.client.base_client import ApiClientFactory, KubernetesClient
+
+    monkeypatch.delenv('KUBERNETES_SERVICE_HOST', raising=False)
+    ApiClientFactory.reset()
+
+    with pytest.raises(RuntimeError, match="Failed to load Kubernetes config"):
+        KubernetesClient()
+    assert ApiClientFactory._instance is None
+
+
+# ── first_hit / _find_in_namespaces 并发查找 ───────────────────────────────────
+
+def test_first_hit_returns_fast_hit_without_waiting_for_slow_misses():
+    """首个命中即返回，不等待其余较慢的查找"""
+    import time
+    from gpuctl.client.base_client import first_hit
+
+    def lookup(ns):
+        if ns == "team-z":
+            return {"namespace": ns}
+        time.sleep(0.5)
+        return None
+
+    start = time.monotonic()
+    result = first_hit(lookup, ["team-a", "team-b", "team-z"])
+    elapsed = time.monotonic() - start
+
+    assert result == {"namespace": "team-z"}
+    assert elapsed < 0.4
+
+
+def test_first_hit_raises_error_only_when_nothing_found():
+    """全部未命中时抛出查找过程中的异常；有命中时忽略其他异常"""
+    from gpuctl.client.base_client import first_hit
+
+    def failing(ns):
+        if ns == "broken":
+            raise PermissionError("denied")
+        return "found" if ns == "team-a" else None
+
+    assert first_hit(failing, ["broken", "team-a"]) == "found"
+    with pytest.raises(PermissionError):
+        first_hit(failing, ["broken", "team-b"])
+
+
+def test_first_in_order_prefers_earlier_items_over_faster_hits():
+    """按 items 顺序取第一个命中，较快返回的靠后结果不会抢先"""
+    import time
+    from gpuctl.client.base_client import first_in_order
+
+    def lookup(kind):
+        if kind == "job":
+            time.sleep(0.2)
+            return "job"
+        return kind if kind == "deployment" else None
+
+    assert first_in_order(lookup, ["job", "deployment", "statefulset"]) == "job"
+    assert first_in_order(lookup, ["statefulset", "deployment"]) == "deployment"
+    assert first_in_order(lookup, ["statefulset"]) is None
+
+
+@patch('gpuctl.client.base_client.KubernetesClient.__init__', return_value=None)
+def test_find_in_namespaces_latency_is_one_round_trip(mock_init):
+    """名称只存在于最后一个命名空间时，耗时约等于一次往返，而不是 N×3 次"""
+    import time
+    from gpuctl.client.base_client import KubernetesClient
+
+    client = KubernetesClient.__new__(KubernetesClient)
+    namespaces = [f"team-{i}" for i in range(6)]
+    calls = []
+
+    def make_lookup(kind):
+        def lookup(ns):
+            calls.append((ns, kind))
+            time.sleep(0.1)
+            return {"kind": kind, "namespace": ns} if (ns, kind) == ("team-5", "statefulset") else None
+        return lookup
+
+    lookups = [make_lookup(k) for k in ("job", "deployment", "statefulset")]
+    with patch.object(KubernetesClient, '_get_all_gpuctl_namespaces', return_value=namespaces):
+        start = time.monotonic()
+        result = client._find_in_namespaces(lookups, "default")
+        elapsed = time.monotonic() - start
+
+    assert result == {"kind": "statefulset", "namespace": "team-5"}
+    # 指定命名空间 1 轮 + 其余 18 个查找在 16 个线程上约 2 轮，远小于顺序执行的 2.1s
+    assert elapsed < 1.0
+    assert ("default", "job") in calls
+
+
+# ── list_metadata：只取元数据的列表 ─────────────────────────────────────────────
+
+@patch('gpuctl.client.base_client.KubernetesClient.__init__', return_value=None)
+def test_list_metadata_requests_partial_object_metadata(mock_init):
+    """list_metadata 请求 PartialObjectMetadataList 投影，并解析为与 V1XxxList 相同结构的记录"""
+    from gpuctl.client.base_client import KubernetesClient
+
+    client = KubernetesClient.__new__(KubernetesClient)
+    client.api_client = MagicMock()
+    client.api_client.call_api.return_value.data = json.dumps({
+        "kind": "PartialObjectMetadataList",
+        "metadata": {"resourceVersion": "100", "continue": "next-token", "remainingItemCount": 3},
+        "items": [{"metadata": {"name": "train", "namespace": "team-a",
+                                "labels": {"runwhere.ai/pool": "gpu"}, "resourceVersion": "7"}}],
+    }).encode()
+
+    result = client.list_metadata("jobs", namespace="team-a", label_selector="runwhere.ai/job-type", limit=1)
+
+    args, kwargs = client.api_client.call_api.call_args
+    assert args == ("/apis/batch/v1/namespaces/team-a/jobs", "GET")
+    assert kwargs["query_params"] == [("labelSelector", "runwhere.ai/job-type"), ("limit", 1)]
+    assert "as=PartialObjectMetadataList" in kwargs["header_params"]["Accept"]
+    assert kwargs["_preload_content"] is False
+
+    assert result.metadata.resource_version == "100"
+    assert result.metadata._continue == "next-token"
+    assert result.metadata.remaining_item_count == 3
+    meta = result.items[0].metadata
+    assert (meta.name, meta.namespace, meta.resource_version) == ("train", "team-a", "7")
+    assert meta.labels == {"runwhere.ai/pool": "gpu"}
+    assert meta.annotations == {}
+
+
+@patch('gpuctl.client.base_client.KubernetesClient.__init__', return_value=None)
+def test_list_metadata_cluster_scoped(mock_init):
+    """未指定 namespace 或集群级资源时使用集群级路径"""
+    from gpuctl.client.base_client import KubernetesClient
+
+    client = KubernetesClient.__new__(KubernetesClient)
+    client.api_client = MagicMock()
+    client.api_client.call_api.return_value.data = b'{"metadata": {}, "items": []}'
+
+    assert client.list_metadata("nodes", namespace="ignored").items == []
+    assert client.api_client.call_api.call_args.args[0] == "/api/v1/nodes"
+
+    client.list_metadata("deployments")
+    assert client.api_client.call_api.call_args.args[0] == "/apis/apps/v1/deployments"
+
+    with pytest.raises(ValueError):
+        client.list_metadata("configmaps")
@@ -9,8 +9,8 @@ from kubernetes import client as k8s_client
 
 
 @patch('gpuctl.client.job_client.KubernetesClient.__init__', return_value=None)
-def test_get_all_gpuctl_namespaces_uses_valid_label_selector(mock_init):
-    """回归测试：_get_all_gpuctl_namespaces 应使用 runwhere.ai/job-type 而非无效的 runwhere.ai/"""
+def test_get_all_gpuctl_namespaces_reads_registry_snapshot(mock_init):
+    """_get_all_gpuctl_namespaces 应直接读取 NamespaceRegistry 快照，不再逐个命名空间扫描"""
     from gpuctl.client.job_client import JobClient
 
     client = JobClient.__new__(JobClient)
@@ -18,73 +18,107 @@ def test_get_all_gpuctl_namespaces_uses_valid_label_selector(mock_init):
     client.batch_v1 = MagicMock()
     client.apps_v1 = MagicMock()
 
-    # list_namespace 两次调用：一次带 label_selector，一次不带
-    labeled_ns_result = MagicMock()
-    labeled_ns_result.items = []
-    all_ns_result = MagicMock()
-    mock_ns = MagicMock()
-    mock_ns.metadata.name = "test-ns"
-    all_ns_result.items = [mock_ns]
-    client.core_v1.list_namespace.side_effect = [labeled_ns_result, all_ns_result]
-
-    jobs_result = MagicMock()
-    jobs_result.items = []
-    deployments_result = MagicMock()
-    deployments_result.items = []
-    statefulsets_result = MagicMock()
-    statefulsets_result.items = []
-
-    client.batch_v1.list_namespaced_job.return_value = jobs_result
-    client.apps_v1.list_namespaced_deployment.return_value = deployments_result
-    client.apps_v1.list_namespaced_stateful_set.return_value = statefulsets_result
-
-    result = client._get_all_gpuctl_namespaces()
-
-    # 验证使用了合法的 label selector（key 存在性检查）
-    client.batch_v1.list_namespaced_job.assert_called_once_with(
-        "test-ns", label_selector="runwhere.ai/job-type"
-    )
-    client.apps_v1.list_namespaced_deployment.assert_called_once_with(
-        "test-ns", label_selector="runwhere.ai/job-type"
-    )
-    client.apps_v1.list_namespaced_stateful_set.assert_called_once_with(
-        "test-ns", label_selector="runwhere.ai/job-type"
-    )
+    registry = MagicMock()
+    registry.namespaces.return_value = frozenset(["default", "ml-team"])
+    with patch('gpuctl.client.namespace_registry.NamespaceRegistry.get_instance', return_value=registry):
+        result = client._get_all_gpuctl_namespaces()
 
-    # default 始终在结果中
-    assert "default" in result
+    assert sorted(result) == ["default", "ml-team"]
+    client.core_v1.list_namespace.assert_not_called()
+    client.batch_v1.list_namespaced_job.assert_not_called()
+    client.apps_v1.list_namespaced_deployment.assert_not_called()
+    client.apps_v1.list_namespaced_stateful_set.assert_not_called()
 
 
 @patch('gpuctl.client.job_client.KubernetesClient.__init__', return_value=None)
-def test_get_all_gpuctl_namespaces_includes_namespace_with_gpuctl_jobs(mock_init):
-    """验证：若某 namespace 下有 gpuctl 作业，该 namespace 会被收集"""
+def test_list_jobs_without_namespace_uses_single_cluster_scoped_pod_list(mock_init):
+    """未指定 namespace 时，include_pods 只发起 1 次集群级 Pod list"""
     from gpuctl.client.job_client import JobClient
 
     client = JobClient.__new__(JobClient)
     client.core_v1 = MagicMock()
+    client.core_v1.list_pod_for_all_namespaces.return_value.items = []
+
+    with patch.object(JobClient, '_get_all_gpuctl_namespaces') as mock_namespaces:
+        result = client.list_jobs(labels={"runwhere.ai/pool": "train-pool"}, include_pods=True)
+
+    assert result == []
+    client.core_v1.list_pod_for_all_namespaces.assert_called_once_with(
+        label_selector="runwhere.ai/job-type,runwhere.ai/pool=train-pool"
+    )
+    client.core_v1.list_namespaced_pod.assert_not_called()
+    mock_namespaces.assert_not_called()
+
+
+@patch('gpuctl.client.job_client.KubernetesClient.__init__', return_value=None)
+def test_list_jobs_without_namespace_uses_cluster_scoped_controller_lists(mock_init):
+    """未指定 namespace 时，控制器资源各发起 1 次集群级 list，返回与逐命名空间相同的字典"""
+    from gpuctl.client.job_client import JobClient
+
+    client = JobClient.__new__(JobClient)
     client.batch_v1 = MagicMock()
     client.apps_v1 = MagicMock()
+    job = MagicMock()
+    client.batch_v1.list_job_for_all_namespaces.return_value.items = [job]
+    client.apps_v1.list_deployment_for_all_namespaces.return_value.items = []
+    client.apps_v1.list_stateful_set_for_all_namespaces.return_value.items = []
 
-    labeled_ns_result = MagicMock()
-    labeled_ns_result.items = []
-    all_ns_result = MagicMock()
-    mock_ns = MagicMock()
-    mock_ns.metadata.name = "ml-team"
-    all_ns_result.items = [mock_ns]
-    client.core_v1.list_namespace.side_effect = [labeled_ns_result, all_ns_result]
+    with patch.object(JobClient, '_job_to_dict', return_value={"name": "train"}) as mock_to_dict:
+        result = client.list_jobs()
 
-    # ml-team 下有一个 gpuctl job
-    jobs_result = MagicMock()
-    jobs_result.items = [MagicMock()]  # non-empty → namespace should be added
-    client.batch_v1.list_namespaced_job.return_value = jobs_result
+    assert [item["name"] for item in result] == ["train"]
+    assert result[0].kind == "Job"
+    mock_to_dict.assert_called_once_with(job)
+    client.batch_v1.list_job_for_all_namespaces.assert_called_once_with(label_selector="runwhere.ai/job-type")
+    client.apps_v1.list_deployment_for_all_namespaces.assert_called_once_with(label_selector="runwhere.ai/job-type")
+    client.apps_v1.list_stateful_set_for_all_namespaces.assert_called_once_with(label_selector="runwhere.ai/job-type")
+    client.batch_v1.list_namespaced_job.assert_not_called()
 
-    result = client._get_all_gpuctl_namespaces()
 
-    assert "ml-team" in result
-    assert "default" in result
+@patch('gpuctl.client.job_client.KubernetesClient.__init__', return_value=None)
+def test_list_jobs_uses_same_filter_with_and_without_namespace(mock_init):
+    """指定与未指定命名空间时使用相同的标签过滤，分页接口也一致"""
+    from gpuctl.client.job_client import JobClient
 
+    client = JobClient.__new__(JobClient)
+    client.core_v1 = MagicMock()
+    client.core_v1.list_pod_for_all_namespaces.return_value.items = []
+    client.core_v1.list_namespaced_pod.return_value.items = []
+    labels = {"runwhere.ai/pool": "train-pool"}
+
+    client.list_jobs(labels=labels, include_pods=True)
+    client.list_jobs("team-a", labels=labels, include_pods=True)
+    client.list_jobs_page("team-a", labels=labels, limit=20)
+
+    expected = "runwhere.ai/job-type,runwhere.ai/pool=train-pool"
+    assert client.core_v1.list_pod_for_all_namespaces.call_args.kwargs["label_selector"] == expected
+    for namespaced_call in client.core_v1.list_namespaced_pod.call_args_list:
+        assert namespaced_call.kwargs["label_selector"] == expected
 
-# ── _wait_for_resource_deletion 超时回归测试 ──────────────────────────────────
+
+@patch('gpuctl.client.job_client.KubernetesClient.__init__', return_value=None)
+def test_get_job_prefers_job_over_deployment_with_same_name(mock_init):
+    """同名的 Job 和 Deployment 并存时始终返回 Job，与读取的完成顺序无关"""
+    from gpuctl.client.job_client import JobClient
+
+    client = JobClient.__new__(JobClient)
+    client.batch_v1 = MagicMock()
+    client.apps_v1 = MagicMock()
+
+    def read_job(name, ns):
+        time.sleep(0.1)
+        return "job"
+
+    client.batch_v1.read_namespaced_job.side_effect = read_job
+    client.apps_v1.read_namespaced_deployment.return_value = "deployment"
+    client.apps_v1.read_namespaced_stateful_set.side_effect = ApiException(status=404)
+
+    with patch.object(JobClient, '_job_to_dict', return_value={"kind": "Job"}), \
+            patch.object(JobClient, '_deployment_to_dict', return_value={"kind": "Deployment"}):
+        assert client.get_job("train", "team-a") == {"kind": "Job"}
+
+
+# ── _wait_for_resource_deletion（watch）回归测试 ──────────────────────────────
 
 @patch('gpuctl.client.job_client.KubernetesClient.__init__', return_value=None)
 def test_wait_for_resource_deletion_returns_quickly_on_success(mock_init):
@@ -92,33 +126,138 @@ def test_wait_for_resource_deletion_returns_quickly_on_success(mock_init):
     from gpuctl.client.job_client import JobClient
 
     client = JobClient.__new__(JobClient)
-    check_func = MagicMock(return_value=False)  # 资源已不存在
+    client.apps_v1 = MagicMock()
+    client.apps_v1.read_namespaced_deployment.side_effect = ApiException(status=404)
 
     start = time.time()
-    result = client._wait_for_resource_deletion(check_func, "test-dep", "Deployment")
+    with patch('gpuctl.client.job_client.watch.Watch') as mock_watch:
+        result = client._wait_for_resource_deletion("Deployment", "test-dep", "default")
     elapsed = time.time() - start
 
     assert result is True
     assert elapsed < 2, f"should return immediately but took {elapsed:.1f}s"
-    check_func.assert_called_once()
+    mock_watch.assert_not_called()
+
+
+@patch('gpuctl.client.job_client.KubernetesClient.__init__', return_value=None)
+def test_wait_for_resource_deletion_returns_on_deleted_event(mock_init):
+    """收到 DELETED 事件即返回 True，watch 使用 metadata.name 字段选择器"""
+    from gpuctl.client.job_client import JobClient
+
+    client = JobClient.__new__(JobClient)
+    client.apps_v1 = MagicMock()
+    client.apps_v1.read_namespaced_deployment.return_value.metadata.resource_version = "42"
+
+    with patch('gpuctl.client.job_client.watch.Watch') as mock_watch:
+        mock_watch.return_value.stream.return_value = iter([
+            {"type": "MODIFIED", "object": MagicMock()},
+            {"type": "DELETED", "object": MagicMock()},
+        ])
+        result = client._wait_for_resource_deletion("Deployment", "test-dep", "default")
+
+    assert result is True
+    stream_kwargs = mock_watch.return_value.stream.call_args.kwargs
+    assert stream_kwargs["field_selector"] == "metadata.name=test-dep"
+    assert stream_kwargs["resource_version"] == "42"
 
 
 @patch('gpuctl.client.job_client.KubernetesClient.__init__', return_value=None)
-def test_wait_for_resource_deletion_timeout_within_30s(mock_init):
-    """回归测试：超时应 <= 30 秒（修复前是 600 秒会导致阻塞）"""
+def test_wait_for_resource_deletion_reports_timeout(mock_init):
+    """回归测试：超时未删除应返回 False（修复前超时也返回 True）"""
     from gpuctl.client.job_client import JobClient
 
     client = JobClient.__new__(JobClient)
-    check_func = MagicMock(return_value=True)  # 资源一直存在
+    client.apps_v1 = MagicMock()
+    client.apps_v1.read_namespaced_deployment.return_value.metadata.resource_version = "42"
+
+    def slow_stream(*args, **kwargs):
+        time.sleep(0.5)
+        return iter([])
 
     start = time.time()
-    result = client._wait_for_resource_deletion(check_func, "stuck-dep", "Deployment", timeout=1)
+    with patch('gpuctl.client.job_client.watch.Watch') as mock_watch:
+        mock_watch.return_value.stream.side_effect = slow_stream
+        result = client._wait_for_resource_deletion("Deployment", "stuck-dep", "default", timeout=1)
     elapsed = time.time() - start
 
-    assert result is True
+    assert result is False
     assert elapsed < 3, f"timeout=1 should finish within ~1s but took {elapsed:.1f}s"
 
 
+# ── delete_job 并发删除 ───────────────────────────────────────────────────────
+
+def _make_delete_client():
+    from gpuctl.client.job_client import JobClient
+
+    client = JobClient.__new__(JobClient)
+    client.core_v1 = MagicMock()
+    client.batch_v1 = MagicMock()
+    client.apps_v1 = MagicMock()
+    # 只有 Deployment 和 Service 存在
+    client.batch_v1.delete_namespaced_job.side_effect = ApiException(status=404)
+    client.apps_v1.delete_namespaced_stateful_set.side_effect = ApiException(status=404)
+    return client
+
+
+@patch('gpuctl.client.job_client.KubernetesClient.__init__', return_value=None)
+def test_delete_job_issues_all_deletes_and_waits(mock_init):
+    """delete_job 下发全部删除请求，并只等待已受理的资源"""
+    client = _make_delete_client()
+
+    with patch.object(type(client), '_wait_for_resource_deletion', return_value=True) as mock_wait:
+        result = client.delete_job("infer", "default")
+
+    assert result is True
+    client.batch_v1.delete_namespaced_job.assert_called_once()
+    client.apps_v1.delete_namespaced_deployment.assert_called_once()
+    client.apps_v1.delete_namespaced_stateful_set.assert_called_once()
+    client.core_v1.delete_namespaced_service.assert_called_once()
+    waited = sorted(c.args[0] for c in mock_wait.call_args_list)
+    assert waited == ["Deployment", "Service"]
+
+
+@patch('gpuctl.client.job_client.KubernetesClient.__init__', return_value=None)
+def test_delete_job_raises_on_timeout(mock_init):
+    """删除已受理但未在超时内完成时，不应再报告成功"""
+    client = _make_delete_client()
+
+    with patch.object(type(client), '_wait_for_resource_deletion', return_value=False):
+        with pytest.raises(TimeoutError):
+            client.delete_job("infer", "default")
+
+
+@patch('gpuctl.client.job_client.KubernetesClient.__init__', return_value=None)
+def test_delete_job_fire_and_forget_returns_handle(mock_init):
+    """wait=False 立即返回句柄，稍后可查询结果"""
+    import threading
+
+    client = _make_delete_client()
+    release = threading.Event()
+
+    def blocked_wait(*args, **kwargs):
+        release.wait(5)
+        return True
+
+    with patch.object(type(client), '_wait_for_resource_deletion', side_effect=blocked_wait):
+        handle = client.delete_job("infer", "default", wait=False)
+
+        assert handle
+        assert not handle.done()
+        release.set()
+        assert handle.result(timeout=5) is True
+        assert handle.pending() == []
+
+
+@patch('gpuctl.client.job_client.KubernetesClient.__init__', return_value=None)
+def test_delete_job_not_found(mock_init):
+    """只剩 Service（或什么都不存在）时报告作业未找到"""
+    client = _make_delete_client()
+    client.apps_v1.delete_namespaced_deployment.side_effect = ApiException(status=404)
+
+    with patch.object(type(client), '_wait_for_resource_deletion', return_value=True):
+        assert client.delete_job("missing", "default") is False
+
+
 # ── delete_deployment/statefulset 使用 Background 策略回归测试 ─────────────────
 
 @patch('gpuctl.client.job_client.KubernetesClient.__init__', return_value=None)
@@ -167,3 +306,110 @@ def test_delete_service_uses_background_propagation(mock_init):
     call_args = client.core_v1.delete_namespaced_service.call_args
     delete_options = call_args.kwargs.get('body') or call_args[1].get('body')
     assert delete_options.propagation_policy == "Background"
+
+
+# ── 原始 JSON 快速路径 ────────────────────────────────────────────────────────
+
+def _sample_pod():
+    from datetime import datetime, timezone
+
+    return k8s_client.V1Pod(
+        metadata=k8s_client.V1ObjectMeta(
+            name="train-abc", namespace="team-a",
+            labels={"runwhere.ai/job-type": "training", "runwhere.ai/pool": "gpu"},
+            creation_timestamp=datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+        ),
+        spec=k8s_client.V1PodSpec(
+            node_name="node-1",
+            containers=[k8s_client.V1Container(
+                name="main", image="pytorch:2.1", command=["python"], args=["train.py"],
+                env=[k8s_client.V1EnvVar(name="EPOCHS", value="3")],
+                resources=k8s_client.V1ResourceRequirements(limits={"nvidia.com/gpu": "1"}),
+                ports=[k8s_client.V1ContainerPort(container_port=8080)],
+            )],
+        ),
+        status=k8s_client.V1PodStatus(
+            phase="Pending", pod_ip="10.0.0.5",
+            start_time=datetime(2024, 1, 2, 3, 4, 6, tzinfo=timezone.utc),
+            conditions=[k8s_client.V1PodCondition(type="PodScheduled", status="True")],
+            container_statuses=[k8s_client.V1ContainerStatus(
+                name="main", image="pytorch:2.1", image_id="", ready=False, restart_count=0,
+                state=k8s_client.V1ContainerState(
+                    waiting=k8s_client.V1ContainerStateWaiting(reason="ImagePullBackOff", message="pull failed")
+                ),
+            )],
+        ),
+    )
+
+
+@patch('gpuctl.client.job_client.KubernetesClient.__init__', return_value=None)
+def test_raw_pod_to_dict_matches_model_path(mock_init):
+    """原始 JSON 路径与模型路径输出相同的字典，container_statuses 仍可按属性读取"""
+    from gpuctl.client.job_client import JobClient
+
+    client = JobClient.__new__(JobClient)
+    pod = _sample_pod()
+    raw = k8s_client.ApiClient().sanitize_for_serialization(pod)
+
+    expected = client._pod_to_dict(pod)
+    actual = client._raw_pod_to_dict(raw)
+
+    expected_status = expected.pop("status")
+    actual_status = actual.pop("status")
+    assert actual == expected
+    for key in ("active", "succeeded", "failed", "phase", "pod_ip"):
+        assert actual_status[key] == expected_status[key]
+    cs = actual_status["container_statuses"][0]
+    assert cs.state.waiting.reason == "ImagePullBackOff"
+    assert cs.state.terminated is None
+    assert cs.ready is False
+    assert actual_status["conditions"][0].type == "PodScheduled"
+
+
+@patch('gpuctl.client.job_client.KubernetesClient.__init__', return_value=None)
+def test_raw_controller_to_dict_matches_model_path(mock_init):
+    """Job/Deployment/StatefulSet 的原始 JSON 转换与模型路径一致"""
+    from datetime import datetime, timezone
+    from gpuctl.client.job_client import JobClient
+
+    client = JobClient.__new__(JobClient)
+    serialize = k8s_client.ApiClient().sanitize_for_serialization
+    meta = k8s_client.V1ObjectMeta(name="w", namespace="team-a", labels={"runwhere.ai/job-type": "inference"},
+                                   creation_timestamp=datetime(2024, 1, 2, tzinfo=timezone.utc))
+    template = k8s_client.V1PodTemplateSpec(spec=k8s_client.V1PodSpec(
+        containers=[k8s_client.V1Container(name="main", image="vllm")]))
+    selector = k8s_client.V1LabelSelector(match_labels={"app": "w"})
+
+    job = k8s_client.V1Job(metadata=meta, status=k8s_client.V1JobStatus(active=1, failed=2))
+    deployment = k8s_client.V1Deployment(
+        metadata=meta,
+        spec=k8s_client.V1DeploymentSpec(replicas=2, selector=selector, template=template),
+        status=k8s_client.V1DeploymentStatus(replicas=2, ready_replicas=1, unavailable_replicas=1),
+    )
+    statefulset = k8s_client.V1StatefulSet(
+        metadata=meta, status=k8s_client.V1StatefulSetStatus(replicas=3, ready_replicas=2))
+
+    assert client._raw_job_to_dict(serialize(job)) == client._job_to_dict(job)
+    assert client._raw_deployment_to_dict(serialize(deployment)) == client._deployment_to_dict(deployment)
+    assert client._raw_statefulset_to_dict(serialize(statefulset)) == client._statefulset_to_dict(statefulset)
+
+
+@patch('gpuctl.client.job_client.KubernetesClient.__init__', return_value=None)
+def test_list_jobs_raw_json_skips_model_deserialization(mock_init):
+    """开启 raw_json_lists 后以 _preload_content=False 调用 list API 并直接解析 JSON"""
+    import json
+    from gpuctl.client.job_client import JobClient
+
+    client = JobClient.__new__(JobClient)
+    client.raw_json_lists = True
+    client.core_v1 = MagicMock()
+    raw = k8s_client.ApiClient().sanitize_for_serialization(_sample_pod())
+    client.core_v1.list_pod_for_all_namespaces.return_value.data = json.dumps(
+        {"metadata": {"resourceVersion": "1"}, "items": [raw]}).encode()
+
+    result = client.list_jobs(include_pods=True)
+
+    assert [job["name"] for job in result] == ["train-abc"]
+    client.core_v1.list_pod_for_all_namespaces.assert_called_once_with(
+        _preload_content=False, label_selector="runwhere.ai/job-type"
+    )
@@ -0,0 +1,181 @@
+"""
+LogClient：作业 Pod 定位（job-name/app 集合选择器，全名优先于基础名称；注册表可用时只发一次请求）
+"""
+from unittest.mock import MagicMock, patch
+import pytest
+from kubernetes import client
+from kubernetes.client.rest import ApiException
+
+from gpuctl.constants import K8sResourceType
+
+
+def _pod(name, labels, namespace="team-a", phase=None):
+    return client.V1Pod(metadata=client.V1ObjectMeta(name=name, namespace=namespace, labels=labels),
+                        status=client.V1PodStatus(phase=phase))
+
+
+@patch('gpuctl.client.log_client.LogClient.__init__', return_value=None)
+def _make_client(mock_init):
+    from gpuctl.client.log_client import LogClient
+
+    log_client = LogClient.__new__(LogClient)
+    log_client.core_v1 = MagicMock()
+    return log_client
+
+
+def _serve_pods(log_client, pods):
+    """按 key in (...) / key=value 选择器从 pods 中筛选，模拟 list_namespaced_pod"""
+    def list_namespaced_pod(namespace, label_selector):
+        if " in (" in label_selector:
+            key, _, values = label_selector.partition(" in (")
+            values = values.rstrip(")").split(",")
+        else:
+            key, _, value = label_selector.partition("=")
+            values = [value]
+        items = [pod for pod in pods
+                 if pod.metadata.namespace == namespace and (pod.metadata.labels or {}).get(key) in values]
+        return client.V1PodList(items=items)
+
+    log_client.core_v1.list_namespaced_pod.side_effect = list_namespaced_pod
+
+
+@patch('gpuctl.client.namespace_registry.NamespaceRegistry._instance', None)
+def test_get_job_pods_uses_set_based_selectors():
+    """无注册表时：按 job-name、app 的集合选择器 list，不列出命名空间中其他 gpuctl Pod"""
+    log_client = _make_client()
+    _serve_pods(log_client, [
+        _pod("train-x7k2p", {"job-name": "train", "runwhere.ai/job-type": "training"}),
+        _pod("svc-5d8f9c-abcde", {"app": "svc", "runwhere.ai/job-type": "inference"}),
+        _pod("other-0", {"app": "other", "runwhere.ai/job-type": "notebook"}),
+    ])
+
+    train_pods = log_client._get_job_pods("train", "team-a", search_all=False)
+    assert [p.metadata.name for p in train_pods] == ["train-x7k2p"]
+    log_client.core_v1.list_namespaced_pod.assert_called_once_with(
+        namespace="team-a", label_selector="job-name in (train)"
+    )
+
+    log_client.core_v1.list_namespaced_pod.reset_mock()
+    pod_name_pods = log_client._get_job_pods("svc-5d8f9c-abcde", "team-a", search_all=False)
+    assert [p.metadata.name for p in pod_name_pods] == ["svc-5d8f9c-abcde"]
+    log_client.core_v1.list_namespaced_pod.assert_called_with(
+        namespace="team-a", label_selector="app in (svc-5d8f9c-abcde,svc)"
+    )
+    assert log_client.core_v1.list_namespaced_pod.call_count == 2
+    log_client.core_v1.read_namespaced_pod.assert_not_called()
+
+
+@patch('gpuctl.client.namespace_registry.NamespaceRegistry._instance', None)
+def test_get_job_pods_skips_names_invalid_as_label_values():
+    """超过 63 个字符的 Pod 名不放进选择器（否则 API Server 返回 400），仍按基础名称查找"""
+    log_client = _make_client()
+    base = "a" * 60
+    _serve_pods(log_client, [_pod(f"{base}-5d8f9c-abcde", {"app": base})])
+
+    pods = log_client._get_job_pods(f"{base}-5d8f9c-abcde", "team-a", search_all=False)
+
+    assert [p.metadata.name for p in pods] == [f"{base}-5d8f9c-abcde"]
+    log_client.core_v1.list_namespaced_pod.assert_called_with(
+        namespace="team-a", label_selector=f"app in ({base})"
+    )
+
+    log_client.core_v1.list_namespaced_pod.reset_mock()
+    assert log_client._get_job_pods("bad/name", "team-a", search_all=False) == []
+    log_client.core_v1.list_namespaced_pod.assert_not_called()
+
+
+@patch('gpuctl.client.namespace_registry.NamespaceRegistry._instance', None)
+def test_get_job_pods_full_name_takes_precedence_over_base_name():
+    """全名匹配的工作负载优先：llama-7b-chat 不会混入基础名称 llama 的 Pod"""
+    log_client = _make_client()
+    _serve_pods(log_client, [
+        _pod("llama-7b-chat-x7k2p", {"job-name": "llama-7b-chat"}, phase="Pending"),
+        _pod("llama-5d8f9c-abcde", {"app": "llama"}, phase="Running"),
+    ])
+
+    log_client.core_v1.read_namespaced_pod.side_effect = ApiException(status=404)
+
+    pods = log_client._get_job_pods("llama-7b-chat", "team-a", search_all=False)
+
+    assert [p.metadata.name for p in pods] == ["llama-7b-chat-x7k2p"]
+    assert log_client.locate_log_pod("llama-7b-chat", "team-a") == ("team-a", "llama-7b-chat-x7k2p")
+
+
+def test_get_job_pods_registry_prefers_full_name():
+    """注册表中全名和基础名称都命中时，只取全名对应的工作负载"""
+    registry = MagicMock()
+    registry.is_watching.return_value = True
+    registry.find_workloads.return_value = [
+        (K8sResourceType.DEPLOYMENT, "team-a", "llama"),
+        (K8sResourceType.JOB, "team-a", "llama-7b-chat"),
+    ]
+    log_client = _make_client()
+    _serve_pods(log_client, [
+        _pod("llama-7b-chat-x7k2p", {"job-name": "llama-7b-chat"}),
+        _pod("llama-5d8f9c-abcde", {"app": "llama"}),
+    ])
+
+    with patch('gpuctl.client.namespace_registry.NamespaceRegistry._instance', registry):
+        pods = log_client._get_job_pods("llama-7b-chat", "team-a")
+
+    log_client.core_v1.list_namespaced_pod.assert_called_once_with(
+        namespace="team-a", label_selector="job-name=llama-7b-chat"
+    )
+    assert [p.metadata.name for p in pods] == ["llama-7b-chat-x7k2p"]
+
+
+def test_get_job_pods_uses_registry_and_single_selector():
+    """注册表 watch 运行时：直接定位工作负载所在命名空间，只发一次请求"""
+    registry = MagicMock()
+    registry.is_watching.return_value = True
+    registry.find_workloads.return_value = [(K8sResourceType.DEPLOYMENT, "team-b", "svc")]
+    log_client = _make_client()
+    _serve_pods(log_client, [_pod("svc-5d8f9c-abcde", {"app": "svc"}, namespace="team-b")])
+
+    with patch('gpuctl.client.namespace_registry.NamespaceRegistry._instance', registry):
+        pods = log_client._get_job_pods("svc", "default")
+
+    registry.find_workloads.assert_called_once_with(["svc"])
+    log_client.core_v1.list_namespaced_pod.assert_called_once_with(
+        namespace="team-b", label_selector="app=svc"
+    )
+    assert [p.metadata.name for p in pods] == ["svc-5d8f9c-abcde"]
+
+
+def test_locate_log_pod_reads_pod_directly():
+    """Pod 名直接命中：只发一次单对象读取，不列 Pod、不读命名空间"""
+    log_client = _make_client()
+
+    assert log_client.locate_log_pod("svc-5d8f9c-abcde", "team-a") == ("team-a", "svc-5d8f9c-abcde")
+    log_client.core_v1.read_namespaced_pod.assert_called_once_with("svc-5d8f9c-abcde", "team-a")
+    log_client.core_v1.list_namespaced_pod.assert_not_called()
+    log_client.core_v1.read_namespace.assert_not_called()
+
+
+@patch('gpuctl.client.namespace_registry.NamespaceRegistry._instance', None)
+def test_locate_log_pod_prefers_running_pod_by_label():
+    """作业名：按标签列出作业的 Pod，优先 Running 的 Pod"""
+    log_client = _make_client()
+    log_client.core_v1.read_namespaced_pod.side_effect = ApiException(status=404)
+    _serve_pods(log_client, [
+        _pod("svc-5d8f9c-aaaaa", {"app": "svc"}, phase="Pending"),
+        _pod("svc-5d8f9c-bbbbb", {"app": "svc"}, phase="Running"),
+    ])
+
+    assert log_client.locate_log_pod("svc", "team-a") == ("team-a", "svc-5d8f9c-bbbbb")
+    assert log_client.core_v1.list_namespaced_pod.call_count == 2
+    log_client.core_v1.read_namespace.assert_not_called()
+
+
+@patch('gpuctl.client.namespace_registry.NamespaceRegistry._instance', None)
+def test_locate_log_pod_checks_namespace_only_on_miss():
+    """指定命名空间中未命中时才读取命名空间，不存在时抛出 FileNotFoundError"""
+    log_client = _make_client()
+    log_client.core_v1.read_namespaced_pod.side_effect = ApiException(status=404)
+    _serve_pods(log_client, [])
+    log_client.core_v1.read_namespace.side_effect = ApiException(status=404)
+    log_client._find_in_namespaces = MagicMock()
+
+    with pytest.raises(FileNotFoundError, match="Namespace 'missing' not found"):
+        log_client.locate_log_pod("svc", "missing")
+    log_client._find_in_namespaces.assert_not_called()
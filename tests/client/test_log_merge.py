@@ -0,0 +1,138 @@
+"""
+多 Pod 日志合并：按时间戳合并、Pod 名前缀、跟随流的重排窗口、断线续读游标
+"""
+import time
+from unittest.mock import MagicMock, patch
+from kubernetes import client
+
+from gpuctl.client.log_merge import LogCursor, timestamp_key, merge_pod_logs, merge_log_streams
+
+
+def test_timestamp_key_orders_variable_length_fractions():
+    """RFC3339Nano 小数位长度不同，补齐后才能按字符串比较"""
+    assert timestamp_key("2024-05-01T08:00:00.1Z a") > timestamp_key("2024-05-01T08:00:00.09Z b")
+    assert timestamp_key("2024-05-01T08:00:01Z a") > timestamp_key("2024-05-01T08:00:00.999Z b")
+    assert timestamp_key("no timestamp here") == ""
+
+
+def test_merge_pod_logs_orders_by_timestamp_and_tags_pod():
+    merged = merge_pod_logs({
+        "web-0": ["2024-05-01T08:00:00.3Z c", "continued"],
+        "web-1": ["2024-05-01T08:00:00.1Z a", "2024-05-01T08:00:00.5Z d"],
+        "web-2": ["2024-05-01T08:00:00.2Z b"],
+    })
+
+    assert merged == [
+        "[web-1] 2024-05-01T08:00:00.1Z a",
+        "[web-2] 2024-05-01T08:00:00.2Z b",
+        "[web-0] 2024-05-01T08:00:00.3Z c",
+        "[web-0] continued",
+        "[web-1] 2024-05-01T08:00:00.5Z d",
+    ]
+
+
+def test_merge_log_streams_reorders_within_window():
+    """稍晚到达但时间更早的行在窗口内排到前面，流结束后全部输出"""
+    def slow():
+        time.sleep(0.05)
+        yield "2024-05-01T08:00:00.1Z early"
+
+    def fast():
+        yield "2024-05-01T08:00:00.2Z late"
+
+    merged = list(merge_log_streams({"a": slow(), "b": fast()}, window=0.5))
+
+    assert merged == [("a", "2024-05-01T08:00:00.1Z early"), ("b", "2024-05-01T08:00:00.2Z late")]
+
+
+def test_merge_log_streams_reports_stream_errors():
+    def broken():
+        yield "2024-05-01T08:00:00.1Z ok"
+        raise RuntimeError("connection reset")
+
+    merged = list(merge_log_streams({"a": broken()}, window=0))
+
+    assert merged[0] == ("a", "2024-05-01T08:00:00.1Z ok")
+    assert "connection reset" in merged[1][1]
+
+
+def _pod(name, phase="Running"):
+    return client.V1Pod(
+        metadata=client.V1ObjectMeta(name=name, namespace="team-a"),
+        spec=client.V1PodSpec(containers=[], node_name="node-1"),
+        status=client.V1PodStatus(phase=phase),
+    )
+
+
+@patch('gpuctl.client.log_client.LogClient.__init__', return_value=None)
+def test_get_job_logs_all_pods_reads_every_pod(mock_init):
+    """all_pods：并发读取全部非 Pending 的 Pod 并合并"""
+    from gpuctl.client.log_client import LogClient
+
+    log_client = LogClient.__new__(LogClient)
+    log_client.core_v1 = MagicMock()
+    log_client._get_job_pods = MagicMock(return_value=[_pod("svc-0"), _pod("svc-1"), _pod("svc-2", "Pending")])
+    log_client.core_v1.read_namespaced_pod_log.side_effect = lambda name, namespace, **kwargs: {
+        "svc-0": "2024-05-01T08:00:00.2Z second\n",
+        "svc-1": "2024-05-01T08:00:00.1Z first\n",
+    }[name]
+
+    logs = log_client.get_job_logs("svc", namespace="team-a", tail=10, all_pods=True)
+
+    assert logs == ["[svc-1] 2024-05-01T08:00:00.1Z first", "[svc-0] 2024-05-01T08:00:00.2Z second"]
+    assert log_client.core_v1.read_namespaced_pod_log.call_count == 2
+
+
+def test_log_cursor_round_trip_and_advance():
+    cursor = LogCursor()
+    cursor.advance("2024-05-01T08:00:00.1Z a")
+    cursor.advance("2024-05-01T08:00:00.1Z b")
+
+    pod_name, parsed = LogCursor.parse(cursor.token("web-0"))
+
+    assert pod_name == "web-0"
+    assert (parsed.timestamp, parsed.count) == ("2024-05-01T08:00:00.1Z", 2)
+
+
+def test_log_cursor_after_skips_delivered_lines_only():
+    """续读：丢弃游标之前的行和同一时间戳下已送出的行，不丢也不重复"""
+    cursor = LogCursor("2024-05-01T08:00:00.1Z", 1)
+    replayed = [
+        "2024-05-01T07:59:58Z old",
+        "2024-05-01T08:00:00.1Z a",
+        "2024-05-01T08:00:00.1Z b",
+        "2024-05-01T08:00:01Z c",
+    ]
+
+    assert list(cursor.after(replayed)) == ["2024-05-01T08:00:00.1Z b", "2024-05-01T08:00:01Z c"]
+
+
+def test_log_cursor_since_seconds_covers_cursor_with_margin():
+    cursor = LogCursor("2024-05-01T08:00:00.5Z", 1)
+    now = 1714550400 + 30.2  # 2024-05-01T08:00:30.2Z
+
+    assert cursor.since_seconds(now) >= 31
+
+
+@patch('gpuctl.client.log_client.LogClient.__init__', return_value=None)
+def test_follow_logs_resumes_from_cursor(mock_init):
+    """有游标时按 since_seconds 回溯并跳过已送出的行，游标随输出前进"""
+    from gpuctl.client.log_client import LogClient
+
+    log_client = LogClient.__new__(LogClient)
+    log_client.core_v1 = MagicMock()
+    log_client._locate_log_pod = MagicMock(return_value=("team-a", "svc-0"))
+    response = MagicMock()
+    response.__iter__.return_value = iter([
+        b"2024-05-01T08:00:00.1Z a\n", b"2024-05-01T08:00:00.2Z b\n"
+    ])
+    log_client.core_v1.read_namespaced_pod_log.return_value = response
+
+    log_stream = log_client.follow_logs("svc", "team-a", cursors={"svc-0": LogCursor("2024-05-01T08:00:00.1Z", 1)})
+    lines = list(log_stream)
+
+    assert lines == [("svc-0", "2024-05-01T08:00:00.2Z b")]
+    kwargs = log_client.core_v1.read_namespaced_pod_log.call_args.kwargs
+    assert "since_seconds" in kwargs and "tail_lines" not in kwargs
+    assert log_stream.cursors["svc-0"].token("svc-0") == "svc-0/2024-05-01T08:00:00.2Z/1"
+    response.close.assert_called()
@@ -0,0 +1,205 @@
+"""
+NamespaceRegistry：集群级同步与 watch 事件增量维护
+"""
+from unittest.mock import patch, MagicMock
+from kubernetes.client.rest import ApiException
+
+
+def _obj(name, namespace=None):
+    obj = MagicMock()
+    obj.metadata.name = name
+    obj.metadata.namespace = namespace
+    obj.metadata.resource_version = "1"
+    obj.metadata.labels = {"runwhere.ai/namespace": "true"}
+    return obj
+
+
+def _list_result(items):
+    result = MagicMock()
+    result.items = items
+    result.metadata.resource_version = "100"
+    return result
+
+
+@patch('gpuctl.client.namespace_registry.KubernetesClient.__init__', return_value=None)
+def _make_registry(mock_init, failing=None):
+    from gpuctl.client.namespace_registry import NamespaceRegistry
+
+    registry = NamespaceRegistry()
+    registry.core_v1 = MagicMock()
+    registry.batch_v1 = MagicMock()
+    registry.apps_v1 = MagicMock()
+    results = {
+        "namespaces": _list_result([_obj("team-a")]),
+        "jobs": _list_result([_obj("train", "team-b")]),
+        "deployments": _list_result([_obj("infer", "team-c")]),
+        "statefulsets": _list_result([]),
+    }
+
+    def list_metadata(resource, **kwargs):
+        if resource == failing:
+            raise ApiException(status=403)
+        return results[resource]
+
+    registry.list_metadata = MagicMock(side_effect=list_metadata)
+    return registry
+
+
+def test_sync_uses_constant_number_of_cluster_scoped_calls():
+    """同步只使用集群级、只取元数据的 list 调用，与命名空间数量无关"""
+    from unittest.mock import call
+
+    registry = _make_registry()
+
+    namespaces = registry.namespaces()
+
+    assert namespaces == frozenset(["default", "team-a", "team-b", "team-c"])
+    assert registry.list_metadata.call_args_list == [
+        call("namespaces", label_selector="runwhere.ai/namespace=true"),
+        call("jobs", label_selector="runwhere.ai/job-type"),
+        call("deployments", label_selector="runwhere.ai/job-type"),
+        call("statefulsets", label_selector="runwhere.ai/job-type"),
+    ]
+    registry.core_v1.list_namespace.assert_not_called()
+    registry.batch_v1.list_job_for_all_namespaces.assert_not_called()
+    registry.batch_v1.list_namespaced_job.assert_not_called()
+
+
+def test_snapshot_is_reused_until_stale():
+    """快照有效期内重复读取不会触发 API 调用"""
+    registry = _make_registry()
+
+    registry.namespaces()
+    registry.namespaces()
+    assert registry.is_managed("team-b")
+
+    assert registry.list_metadata.call_count == 4
+
+
+def test_workload_list_failure_does_not_break_discovery():
+    """工作负载集群级 list 失败时，仍返回已知的命名空间"""
+    registry = _make_registry(failing="deployments")
+
+    namespaces = registry.namespaces()
+
+    assert "team-a" in namespaces
+    assert "team-b" in namespaces
+    assert "team-c" not in namespaces
+
+
+def test_workload_events_add_and_remove_namespaces():
+    """工作负载事件增量更新命名空间集合，最后一个工作负载删除后移除命名空间"""
+    from gpuctl.constants import K8sResourceType
+
+    registry = _make_registry()
+    registry.sync()
+
+    registry._on_workload_event(K8sResourceType.STATEFULSET, "ADDED", _obj("nb", "team-d"))
+    assert "team-d" in registry.namespaces()
+
+    registry._on_workload_event(K8sResourceType.STATEFULSET, "DELETED", _obj("nb", "team-d"))
+    assert "team-d" not in registry.namespaces()
+
+    registry._on_workload_event(K8sResourceType.JOB, "DELETED", _obj("train", "team-b"))
+    assert "team-b" not in registry.namespaces()
+    assert "default" in registry.namespaces()
+
+
+def test_namespace_events_track_labelled_namespaces():
+    """命名空间标签事件增量更新集合"""
+    registry = _make_registry()
+    registry.sync()
+
+    registry._on_namespace_event("ADDED", _obj("team-e"))
+    assert "team-e" in registry.namespaces()
+
+    registry._on_namespace_event("DELETED", _obj("team-a"))
+    assert "team-a" not in registry.namespaces()
+
+
+def test_namespace_events_invalidate_quota_cache():
+    """命名空间删除或去掉标签时同步清除配额命名空间缓存"""
+    from gpuctl.client.quota_client import quota_namespaces
+
+    registry = _make_registry()
+    registry.sync()
+    quota_namespaces.clear()
+    try:
+        quota_namespaces.add("team-a")
+        quota_namespaces.add("team-e")
+        registry._on_namespace_event("ADDED", _obj("team-e"))
+        assert quota_namespaces.contains("team-e")
+
+        unlabeled = _obj("team-e")
+        unlabeled.metadata.labels = {}
+        registry._on_namespace_event("MODIFIED", unlabeled)
+        assert not registry.is_labeled("team-e")
+        assert not quota_namespaces.contains("team-e")
+
+        registry._on_namespace_event("DELETED", _obj("team-a"))
+        assert not quota_namespaces.contains("team-a")
+    finally:
+        quota_namespaces.clear()
+
+
+def test_namespace_relist_invalidates_removed_namespaces():
+    from gpuctl.client.quota_client import quota_namespaces
+
+    registry = _make_registry()
+    registry.sync()
+    quota_namespaces.clear()
+    try:
+        quota_namespaces.add("team-a")
+        registry._on_namespace_relist([])
+        assert not quota_namespaces.contains("team-a")
+    finally:
+        quota_namespaces.clear()
+
+
+def test_find_workloads_by_name():
+    from gpuctl.constants import K8sResourceType
+
+    registry = _make_registry()
+    registry.sync()
+
+    assert registry.find_workloads(["train", "infer", "missing"]) == [
+        (K8sResourceType.DEPLOYMENT, "team-c", "infer"),
+        (K8sResourceType.JOB, "team-b", "train"),
+    ]
+
+
+def test_is_watching_reflects_watch_health():
+    """watch 线程存活但连接出错时不再视为 watch 中，回退为按 TTL 重新同步"""
+    import threading
+    import time
+
+    registry = _make_registry()
+    registry.sync()
+    release = threading.Event()
+    failing = threading.Event()
+
+    def stream(*args, **kwargs):
+        if failing.is_set():
+            raise ApiException(status=500)
+        release.wait(2)
+        return iter(())
+
+    def wait_for(predicate):
+        deadline = time.time() + 2
+        while time.time() < deadline and not predicate():
+            time.sleep(0.01)
+        return predicate()
+
+    with patch('gpuctl.client.informer.watch.Watch') as mock_watch:
+        mock_watch.return_value.stream.side_effect = stream
+        registry.start()
+        try:
+            assert wait_for(registry.is_watching)
+
+            failing.set()
+            release.set()
+            assert wait_for(lambda: not registry.is_watching())
+            assert all(informer.is_running() for informer in registry._informers)
+        finally:
+            registry.stop()
+            release.set()
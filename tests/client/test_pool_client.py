@@ -0,0 +1,183 @@
+"""
+PoolClient：资源池节点标签的批量、并发调和
+"""
+import pytest
+from unittest.mock import MagicMock, patch
+from kubernetes.client.rest import ApiException
+
+from gpuctl.client.metadata import ObjectMetadata, PartialObjectMetadata, PartialObjectMetadataList, ListMetadata
+
+
+def _snapshot(nodes):
+    return PartialObjectMetadataList(
+        metadata=ListMetadata(resource_version="1"),
+        items=[PartialObjectMetadata(ObjectMetadata(name=name, labels=labels)) for name, labels in nodes.items()],
+    )
+
+
+@patch('gpuctl.client.pool_client.PoolClient.__init__', return_value=None)
+def _make_client(nodes, mock_init):
+    from gpuctl.client.pool_client import PoolClient
+
+    client = PoolClient.__new__(PoolClient)
+    client.core_v1 = MagicMock()
+    client.list_metadata = MagicMock(return_value=_snapshot(nodes))
+    return client
+
+
+def _patches(client):
+    return {c.args[0]: c.args[1]["metadata"]["labels"] for c in client.core_v1.patch_node.call_args_list}
+
+
+def test_create_pool_sends_one_merged_patch_per_node():
+    """每个节点只发送一次合并后的补丁，已满足的标签不再修改"""
+    client = _make_client({
+        "node-1": {},
+        "node-2": {"runwhere.ai/pool": "train", "runwhere.ai/gpu-type": "A100"},
+        "node-3": {"runwhere.ai/pool": "train"},
+    })
+
+    result = client.create_pool({"name": "train", "nodes": {
+        "node-1": {"gpuType": "A100"},
+        "node-2": {"gpuType": "A100"},
+        "node-3": {"gpu_type": "H100"},
+    }})
+
+    client.list_metadata.assert_called_once_with("nodes")
+    assert _patches(client) == {
+        "node-1": {"runwhere.ai/pool": "train", "runwhere.ai/gpu-type": "A100"},
+        "node-3": {"runwhere.ai/gpu-type": "H100"},
+    }
+    assert sorted(result["success"]) == ["node-1", "node-3"]
+    assert result["unchanged"] == ["node-2"]
+    assert result["failed"] == []
+    assert result["status"] == "created"
+
+
+def test_create_pool_validates_against_snapshot():
+    client = _make_client({"node-1": {}})
+
+    with pytest.raises(ValueError, match="Nodes not found: node-9"):
+        client.create_pool({"name": "train", "nodes": {"node-1": {}, "node-9": {}}})
+    client.core_v1.patch_node.assert_not_called()
+
+
+def test_create_pool_reports_per_node_failures_without_stopping():
+    client = _make_client({"node-1": {}, "node-2": {}})
+
+    def patch_node(name, body):
+        if name == "node-1":
+            raise ApiException(status=409, reason="Conflict")
+
+    client.core_v1.patch_node.side_effect = patch_node
+
+    result = client.create_pool({"name": "train", "nodes": ["node-1", "node-2"], "gpu_type": "A100"})
+
+    assert result["success"] == ["node-2"]
+    assert result["failed"][0]["node"] == "node-1"
+    assert "1 node(s) failed" in result["message"]
+    assert result["status"] == "partial"
+
+
+def test_update_pool_diffs_membership_from_snapshot():
+    """更新资源池：新增节点打标签，移出节点只删除资源池标签，不再读取资源池详情"""
+    client = _make_client({
+        "node-1": {"runwhere.ai/pool": "train"},
+        "node-2": {"runwhere.ai/pool": "train"},
+        "node-3": {},
+    })
+
+    result = client.update_pool({"name": "train", "nodes": {"node-2": {}, "node-3": {}}})
+
+    assert _patches(client) == {
+        "node-1": {"runwhere.ai/pool": None},
+        "node-3": {"runwhere.ai/pool": "train"},
+    }
+    assert result["unchanged"] == ["node-2"]
+    client.core_v1.list_node.assert_not_called()
+
+
+def test_update_missing_pool_raises():
+    client = _make_client({"node-1": {}})
+
+    with pytest.raises(ValueError, match="Pool train does not exist"):
+        client.update_pool({"name": "train", "nodes": {"node-1": {}}})
+
+
+def _metadata_snapshot(nodes):
+    return PartialObjectMetadataList(
+        metadata=ListMetadata(resource_version="1"),
+        items=[PartialObjectMetadata(ObjectMetadata(name=name, labels=labels, resource_version=rv))
+               for name, (labels, rv) in nodes.items()],
+    )
+
+
+def test_label_nodes_checks_conflicts_against_one_snapshot():
+    """批量标签：一次快照检查覆盖冲突，不逐个读取节点"""
+    client = _make_client({})
+    client.list_metadata.return_value = _metadata_snapshot({
+        "node-1": ({}, "11"),
+        "node-2": ({"team": "b"}, "12"),
+        "node-3": ({"team": "a"}, "13"),
+    })
+
+    result = client.label_nodes(["node-1", "node-2", "node-3", "node-9"], {"team": "a"})
+
+    client.core_v1.read_node.assert_not_called()
+    assert _patches(client) == {"node-1": {"team": "a"}}
+    assert result["success"] == ["node-1"]
+    assert result["unchanged"] == ["node-3"]
+    assert [item["node"] for item in result["failed"]] == ["node-2", "node-9"]
+
+
+def test_label_nodes_overwrite_with_resource_version_preconditions():
+    client = _make_client({})
+    client.list_metadata.return_value = _metadata_snapshot({"node-1": ({"team": "b"}, "11")})
+    client.core_v1.patch_node.side_effect = ApiException(status=409, reason="Conflict")
+
+    result = client.label_nodes(["node-1"], {"team": "a"}, overwrite=True, preconditions=True)
+
+    client.list_metadata.assert_called_once_with("nodes", field_selector="metadata.name=node-1")
+    client.core_v1.patch_node.assert_called_once_with(
+        "node-1", {"metadata": {"labels": {"team": "a"}, "resourceVersion": "11"}}
+    )
+    assert "modified since it was read" in result["failed"][0]["error"]
+
+
+def test_delete_pool_stops_at_first_associated_workload():
+    """删除资源池前的关联检查：集群级、只取元数据、limit=1 的标签选择器查询"""
+    client = _make_client({})
+
+    def list_metadata(resource, label_selector=None, limit=None, field_selector=None):
+        items = []
+        if resource == "pods":
+            items = [PartialObjectMetadata(ObjectMetadata(name="bare-pod", namespace="team-a"))]
+        return PartialObjectMetadataList(metadata=ListMetadata(), items=items)
+
+    client.list_metadata.side_effect = list_metadata
+
+    with pytest.raises(ValueError, match="associated jobs: team-a/bare-pod"):
+        client.delete_pool("train")
+
+    for call in client.list_metadata.call_args_list:
+        expected = {"label_selector": "runwhere.ai/pool=train", "limit": 1}
+        if call.args[0] == "pods":
+            # 已结束的 Pod 不算关联作业
+            expected["field_selector"] = "status.phase!=Succeeded,status.phase!=Failed"
+        assert call.kwargs == expected
+    client.core_v1.patch_node.assert_not_called()
+
+
+def test_delete_pool_without_workloads_unlabels_nodes():
+    client = _make_client({})
+
+    def list_metadata(resource, label_selector=None, limit=None, field_selector=None):
+        items = []
+        if resource == "nodes":
+            items = [PartialObjectMetadata(ObjectMetadata(name="node-1", labels={"runwhere.ai/pool": "train"}))]
+        return PartialObjectMetadataList(metadata=ListMetadata(), items=items)
+
+    client.list_metadata.side_effect = list_metadata
+
+    assert client.delete_pool("train") is True
+    assert _patches(client) == {"node-1": {"runwhere.ai/pool": None}}
@@ -0,0 +1,228 @@
+"""
+QuotaClient：集群级 ResourceQuota 列表
+"""
+import pytest
+from unittest.mock import MagicMock, patch
+from kubernetes import client
+
+from gpuctl.client.metadata import ObjectMetadata, PartialObjectMetadata, PartialObjectMetadataList, ListMetadata
+
+
+def _quota(namespace, quota_name="team-quota"):
+    return client.V1ResourceQuota(
+        metadata=client.V1ObjectMeta(name=f"{quota_name}-{namespace}", namespace=namespace,
+                                     labels={"runwhere.ai/quota": quota_name, "runwhere.ai/namespace": namespace}),
+        spec=client.V1ResourceQuotaSpec(hard={"cpu": "10", "nvidia.com/gpu": "4"}),
+    )
+
+
+@patch('gpuctl.client.quota_client.QuotaClient.__init__', return_value=None)
+def _make_client(mock_init):
+    from gpuctl.client.quota_client import QuotaClient
+
+    quota_client = QuotaClient.__new__(QuotaClient)
+    quota_client.core_v1 = MagicMock()
+    return quota_client
+
+
+def test_list_quotas_uses_one_cluster_wide_call():
+    """list_quotas 只发起一次带标签选择器的集群级 list"""
+    quota_client = _make_client()
+    quota_client.core_v1.list_resource_quota_for_all_namespaces.return_value.items = [
+        _quota("team-a"), _quota("team-b")
+    ]
+
+    quotas = quota_client.list_quotas()
+
+    quota_client.core_v1.list_resource_quota_for_all_namespaces.assert_called_once_with(
+        label_selector="runwhere.ai/quota"
+    )
+    quota_client.core_v1.list_namespace.assert_not_called()
+    quota_client.core_v1.list_namespaced_resource_quota.assert_not_called()
+    assert [q["namespace"] for q in quotas] == ["team-a", "team-b"]
+    assert quotas[0]["hard"]["nvidia.com/gpu"] == "4"
+
+
+def test_list_quotas_narrowed_to_quota_name():
+    quota_client = _make_client()
+    quota_client.core_v1.list_resource_quota_for_all_namespaces.return_value.items = []
+
+    quota_client.list_quotas("team-quota")
+
+    quota_client.core_v1.list_resource_quota_for_all_namespaces.assert_called_once_with(
+        label_selector="runwhere.ai/quota=team-quota"
+    )
+
+
+def test_delete_quota_config_only_deletes_managed_namespaces():
+    """删除配额配置：一次集群级配额 list，只删除 gpuctl 创建的命名空间"""
+    quota_client = _make_client()
+    quota_client.list_metadata = MagicMock(return_value=PartialObjectMetadataList(
+        metadata=ListMetadata(), items=[PartialObjectMetadata(ObjectMetadata(name="team-a"))]
+    ))
+    quota_client.core_v1.list_resource_quota_for_all_namespaces.return_value.items = [
+        _quota("team-a"), _quota("default"), _quota("unmanaged")
+    ]
+
+    result = quota_client.delete_quota_config("team-quota")
+
+    quota_client.core_v1.delete_namespace.assert_called_once_with("team-a")
+    assert result["deleted"] == [{"namespace": "team-a", "original_namespace": "team-a"}]
+    quota_client.core_v1.list_namespaced_resource_quota.assert_not_called()
+
+
+@pytest.mark.parametrize("quota_name", ["", None])
+def test_delete_quota_config_rejects_empty_name(quota_name):
+    """空配额名不会退化为匹配全部配额的选择器"""
+    quota_client = _make_client()
+
+    with pytest.raises(ValueError):
+        quota_client.delete_quota_config(quota_name)
+
+    quota_client.core_v1.list_resource_quota_for_all_namespaces.assert_not_called()
+    quota_client.core_v1.delete_namespace.assert_not_called()
+
+
+def _namespace(labels):
+    return client.V1Namespace(metadata=client.V1ObjectMeta(name="team-a", labels=labels))
+
+
+def test_submission_precheck_is_cached_for_later_quota_checks():
+    """提交前的一次检查结果被缓存，之后的配额校验与命名空间存在性检查不再调用 API"""
+    from gpuctl.client.quota_client import quota_namespaces
+
+    quota_namespaces.clear()
+    quota_client = _make_client()
+    quota_client.core_v1.read_namespace.return_value = _namespace({"runwhere.ai/namespace": "true"})
+    try:
+        assert quota_client.check_namespace("team-a") == (True, True)
+        assert quota_client.namespace_has_quota("team-a") is True
+        assert quota_client.namespace_has_quota("team-a") is True
+        quota_client.ensure_namespace_exists("team-a")
+
+        quota_client.core_v1.read_namespace.assert_called_once_with("team-a")
+        quota_client.core_v1.list_namespace.assert_not_called()
+    finally:
+        quota_namespaces.clear()
+
+
+def test_missing_quota_is_not_cached():
+    """未配置配额的结果不缓存，随后创建的配额能立即生效"""
+    from gpuctl.client.quota_client import quota_namespaces
+
+    quota_namespaces.clear()
+    quota_client = _make_client()
+    quota_client.core_v1.read_namespace.side_effect = [
+        _namespace({}), _namespace({"runwhere.ai/namespace": "true"})
+    ]
+    try:
+        assert quota_client.namespace_has_quota("team-a") is False
+        assert quota_client.namespace_has_quota("team-a") is True
+    finally:
+        quota_namespaces.clear()
+
+
+def test_quota_cache_entries_expire():
+    from gpuctl.client.quota_client import QuotaNamespaceCache
+
+    cache = QuotaNamespaceCache(ttl=-1)
+    cache.add("team-a")
+    assert cache.contains("team-a") is False
+
+
+def test_namespace_has_quota_uses_registry_watch():
+    """命名空间注册表 watch 运行时直接读取其标签集合，不发起请求"""
+    from gpuctl.client.namespace_registry import NamespaceRegistry
+    from gpuctl.client.quota_client import quota_namespaces
+
+    quota_namespaces.clear()
+    registry = MagicMock()
+    registry.is_watching.return_value = True
+    registry.is_labeled.side_effect = lambda ns: ns == "team-a"
+    quota_client = _make_client()
+    try:
+        with patch.object(NamespaceRegistry, "_instance", registry):
+            assert quota_client.namespace_has_quota("team-a") is True
+            assert quota_client.namespace_has_quota("team-b") is False
+        quota_client.core_v1.read_namespace.assert_not_called()
+    finally:
+        quota_namespaces.clear()
+
+
+def test_registry_watch_takes_precedence_over_quota_cache():
+    """watch 运行时以注册表为准：已删除的命名空间即使仍在缓存中也不视为有配额"""
+    from gpuctl.client.namespace_registry import NamespaceRegistry
+    from gpuctl.client.quota_client import quota_namespaces
+
+    quota_namespaces.clear()
+    quota_namespaces.add("team-a")
+    registry = MagicMock()
+    registry.is_watching.return_value = True
+    registry.is_labeled.return_value = False
+    quota_client = _make_client()
+    quota_client.core_v1.read_namespace.return_value = _namespace({})
+    try:
+        with patch.object(NamespaceRegistry, "_instance", registry):
+            assert quota_client.namespace_has_quota("team-a") is False
+            assert quota_client.check_namespace("team-a") == (True, False)
+            quota_client.ensure_namespace_exists("team-a")
+        assert quota_client.core_v1.read_namespace.call_count == 2
+    finally:
+        quota_namespaces.clear()
+
+
+def _quota_config(**namespaces):
+    return {
+        "name": "team-quota",
+        "namespace": {ns: {"cpu": cpu, "memory": None, "gpu": gpu} for ns, (cpu, gpu) in namespaces.items()}
+    }
+
+
+def test_apply_quota_config_reports_created_updated_unchanged_and_failed():
+    """应用配额配置：一次集群级配额快照，按 hard 比较跳过未变化的命名空间，单个失败不影响其他"""
+    from kubernetes.client.rest import ApiException
+
+    quota_client = _make_client()
+    quota_client.core_v1.list_resource_quota_for_all_namespaces.return_value.items = [
+        _quota("team-a"), _quota("team-b"), _quota("team-x", quota_name="other-quota")
+    ]
+    quota_client.core_v1.read_namespace.side_effect = ApiException(status=404)
+
+    def create_quota(namespace, body):
+        if namespace == "team-d":
+            raise ApiException(status=500)
+    quota_client.core_v1.create_namespaced_resource_quota.side_effect = create_quota
+
+    result = quota_client.apply_quota_config(_quota_config(**{
+        "team-a": ("10000m", "4"),   # 与现有配额等价
+        "team-b": ("20", "4"),       # 需要更新
+        "team-c": ("8", "2"),        # 新建
+        "team-d": ("8", "2"),        # 创建失败
+        "team-x": ("8", "2"),        # 已属于其他配额
+    }), skip_unchanged=True)
+
+    quota_client.core_v1.list_resource_quota_for_all_namespaces.assert_called_once_with(
+        label_selector="runwhere.ai/quota"
+    )
+    quota_client.core_v1.list_namespaced_resource_quota.assert_not_called()
+    assert [q["namespace"] for q in result["unchanged"]] == ["team-a"]
+    assert [q["namespace"] for q in result["updated"]] == ["team-b"]
+    assert [q["namespace"] for q in result["created"]] == ["team-c"]
+    assert [f["namespace"] for f in result["failed"]] == ["team-d", "team-x"]
+    assert "other-quota" in result["failed"][1]["error"]
+    quota_client.core_v1.patch_namespaced_resource_quota.assert_called_once_with(
+        name="team-quota-team-b", namespace="team-b",
+        body=[{"op": "replace", "path": "/spec/hard", "value": {"cpu": "20", "nvidia.com/gpu": "4"}}]
+    )
+
+
+def test_create_quota_config_does_not_update_existing_quota():
+    quota_client = _make_client()
+    quota_client.core_v1.list_resource_quota_for_all_namespaces.return_value.items = [_quota("team-a")]
+
+    result = quota_client.create_quota_config(_quota_config(**{"team-a": ("20", "4")}))
+
+    quota_client.core_v1.patch_namespaced_resource_quota.assert_not_called()
+    assert result["created"] == [] and result["updated"] == []
+    assert "already has a quota" in result["failed"][0]["error"]
+    assert result["failed"][0]["conflict"] is True
@@ -0,0 +1,90 @@
+"""
+PodRecord / WorkloadRecord：紧凑记录与字典兼容读取
+"""
+from unittest.mock import MagicMock
+
+
+def _container_status(ready=True, waiting=None, terminated=None):
+    cs = MagicMock()
+    cs.ready = ready
+    cs.state.waiting = waiting
+    cs.state.terminated = terminated
+    return cs
+
+
+def _pod_dict(phase="Running", container_statuses=None):
+    return {
+        "name": "train-abc",
+        "namespace": "team-a",
+        "labels": {"runwhere.ai/job-type": "training"},
+        "annotations": {},
+        "creation_timestamp": "2024-01-02T03:04:05+00:00",
+        "start_time": "2024-01-02T03:04:06+00:00",
+        "completion_time": None,
+        "spec": {"node_name": "node-1", "containers": [{"name": "main", "image": "pytorch"}]},
+        "status": {"active": 1, "succeeded": 0, "failed": 0, "phase": phase, "pod_ip": "10.0.0.5",
+                   "conditions": [], "container_statuses": container_statuses or []},
+    }
+
+
+def test_pod_record_derives_display_status_and_ready_count():
+    """构造时计算展示状态与 READY，不再持有容器状态对象"""
+    from gpuctl.client.records import PodRecord
+
+    waiting = MagicMock(reason="ImagePullBackOff", message="")
+    record = PodRecord.from_dict(_pod_dict("Pending", [
+        _container_status(ready=True),
+        _container_status(ready=False, waiting=waiting),
+    ]))
+
+    assert record.display_status == "ImagePullBackOff"
+    assert record.ready == "1/2"
+    assert not hasattr(record, "__dict__")
+    assert "container_statuses" not in record.status
+
+
+def test_pod_record_terminated_reason():
+    from gpuctl.client.records import PodRecord
+
+    terminated = MagicMock(reason="OOMKilled")
+    record = PodRecord.from_dict(_pod_dict("Failed", [_container_status(ready=False, terminated=terminated)]))
+
+    assert record.display_status == "OOMKilled"
+    assert record.ready == "0/1"
+
+
+def test_pod_record_supports_dict_style_access():
+    """兼容旧的字典读取方式"""
+    from gpuctl.client.records import PodRecord
+
+    record = PodRecord.from_dict(_pod_dict())
+
+    assert record["name"] == "train-abc"
+    assert record.get("labels", {})["runwhere.ai/job-type"] == "training"
+    assert record.get("spec", {}).get("node_name") == "node-1"
+    assert record.get("status", {}).get("phase") == "Running"
+    assert record.get("resources", {}) == {}
+    assert "phase" in record["status"]
+    assert record.to_dict()["spec"]["containers"][0]["image"] == "pytorch"
+
+
+def test_workload_record_keeps_controller_keys():
+    """WorkloadRecord 的键与对应的 *_to_dict 字典一致（只有 Deployment 有 spec）"""
+    from gpuctl.client.records import WorkloadRecord
+
+    job = WorkloadRecord.from_dict("Job", {
+        "name": "train", "namespace": "default", "labels": {}, "annotations": {},
+        "status": {"active": 0, "succeeded": 1, "failed": 0},
+    })
+    deployment = WorkloadRecord.from_dict("Deployment", {
+        "name": "infer", "namespace": "default", "labels": {}, "annotations": {},
+        "status": {"active": 2, "succeeded": 0, "failed": 0, "ready_replicas": 2},
+        "spec": {"replicas": 2},
+    })
+
+    assert "spec" not in job
+    assert job.display_status == "Succeeded"
+    assert deployment["spec"]["replicas"] == 2
+    assert deployment.display_status == "Running"
+    assert set(job.to_dict()) == {"name", "namespace", "labels", "annotations", "creation_timestamp",
+                                  "start_time", "completion_time", "status"}
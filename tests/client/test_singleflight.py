@@ -0,0 +1,86 @@
+"""
+测试并发相同请求的合并（singleflight）
+"""
+import threading
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+from gpuctl.client.singleflight import SingleFlight
+
+
+def test_concurrent_identical_calls_share_one_request():
+    """同一时刻的相同 key 只执行一次，其余调用共享结果并计为 hit"""
+    flight = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def list_nodes():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return ["node-1"]
+
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        leader = executor.submit(flight.do, ("list", "nodes"), list_nodes)
+        assert started.wait(5)
+        followers = [executor.submit(flight.do, ("list", "nodes"), list_nodes) for _ in range(4)]
+        while flight.stats()["hits"] < 4:
+            threading.Event().wait(0.01)
+        release.set()
+        results = [leader.result()] + [f.result() for f in followers]
+
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+    assert flight.stats() == {"hits": 4, "misses": 1, "in_flight": 0}
+
+
+def test_sequential_calls_and_different_keys_are_not_coalesced():
+    flight = SingleFlight()
+    func = MagicMock(return_value="ok")
+
+    flight.do(("list", "nodes"), func)
+    flight.do(("list", "nodes"), func)
+    flight.do(("list", "pods"), func)
+
+    assert func.call_count == 3
+    assert flight.stats()["misses"] == 3
+    assert flight.stats()["hits"] == 0
+
+
+def test_error_is_raised_to_all_waiters_and_not_cached():
+    flight = SingleFlight()
+    release = threading.Event()
+
+    def failing():
+        release.wait(5)
+        raise RuntimeError("apiserver unavailable")
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        futures = [executor.submit(flight.do, "key", failing) for _ in range(2)]
+        while flight.stats()["hits"] + flight.stats()["misses"] < 2:
+            threading.Event().wait(0.01)
+        release.set()
+        for future in futures:
+            with pytest.raises(RuntimeError, match="apiserver unavailable"):
+                future.result()
+
+    assert flight.do("key", lambda: "recovered") == "recovered"
+
+
+@patch('gpuctl.client.pool_client.PoolClient.__init__', return_value=None)
+def test_pool_client_lists_go_through_coalescing(mock_init):
+    """PoolClient 的节点列表经由 SingleFlight 发出，参数原样传给 Kubernetes API"""
+    from gpuctl.client.pool_client import PoolClient
+
+    client = PoolClient.__new__(PoolClient)
+    client.core_v1 = MagicMock()
+    client.core_v1.list_node.return_value = MagicMock(items=[])
+    flight = SingleFlight()
+
+    with patch('gpuctl.client.singleflight.SingleFlight.get_instance', return_value=flight):
+        assert client.get_pool("pool-a") is None
+
+    client.core_v1.list_node.assert_called_once_with(label_selector="runwhere.ai/pool=pool-a")
+    assert flight.stats()["misses"] == 1
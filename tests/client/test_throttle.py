@@ -0,0 +1,112 @@
+"""
+测试客户端限速（令牌桶）与 429/503 退避重试
+"""
+import pytest
+from unittest.mock import MagicMock
+from kubernetes.client.rest import ApiException
+
+from gpuctl.client.throttle import TokenBucket, ThrottledRequest, backoff_delay
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def _api_exception(status, retry_after=None):
+    e = ApiException(status=status, reason="Too Many Requests")
+    e.headers = {"Retry-After": retry_after} if retry_after is not None else {}
+    return e
+
+
+def test_token_bucket_allows_burst_then_paces_at_qps():
+    """突发容量内不等待，之后按 qps 匀速放行"""
+    clock = FakeClock()
+    bucket = TokenBucket(qps=10, burst=3, clock=clock, sleep=clock.sleep)
+
+    for _ in range(3):
+        bucket.acquire()
+    assert clock.sleeps == []
+
+    bucket.acquire()
+    bucket.acquire()
+    assert clock.sleeps == pytest.approx([0.1, 0.1])
+
+
+def test_token_bucket_disabled_when_qps_not_positive():
+    clock = FakeClock()
+    bucket = TokenBucket(qps=0, burst=1, clock=clock, sleep=clock.sleep)
+    for _ in range(100):
+        bucket.acquire()
+    assert clock.sleeps == []
+
+
+def test_throttled_request_retries_429_honoring_retry_after():
+    """429 时按 Retry-After 等待后重试，成功即返回"""
+    response = MagicMock()
+    request = MagicMock(side_effect=[_api_exception(429, "2"), _api_exception(503, "1"), response])
+    sleeps = []
+    throttled = ThrottledRequest(request, TokenBucket(qps=0, burst=1), max_retries=5, sleep=sleeps.append)
+
+    assert throttled("GET", "/api/v1/pods") is response
+    assert request.call_count == 3
+    assert sleeps == [2.0, 1.0]
+
+
+def test_throttled_request_does_not_retry_other_errors():
+    request = MagicMock(side_effect=_api_exception(500))
+    sleeps = []
+    throttled = ThrottledRequest(request, TokenBucket(qps=0, burst=1), max_retries=5, sleep=sleeps.append)
+
+    with pytest.raises(ApiException):
+        throttled("GET", "/api/v1/pods")
+    request.assert_called_once()
+    assert sleeps == []
+
+
+def test_throttled_request_retries_503_only_for_idempotent_methods():
+    """503 时 POST/PATCH 可能已经生效，不重试；429 对所有方法重试"""
+    sleeps = []
+    request = MagicMock(side_effect=_api_exception(503))
+    throttled = ThrottledRequest(request, TokenBucket(qps=0, burst=1), max_retries=5, sleep=sleeps.append)
+    for method in ("POST", "PATCH"):
+        with pytest.raises(ApiException):
+            throttled(method, "/api/v1/namespaces/default/pods")
+    assert request.call_count == 2
+    assert sleeps == []
+
+    response = MagicMock()
+    request = MagicMock(side_effect=[_api_exception(503, "1"), response,
+                                     _api_exception(429, "1"), response])
+    throttled = ThrottledRequest(request, TokenBucket(qps=0, burst=1), max_retries=5, sleep=sleeps.append)
+    assert throttled("PUT", "/api/v1/nodes/n1") is response
+    assert throttled("POST", "/api/v1/namespaces/default/pods") is response
+    assert sleeps == [1.0, 1.0]
+
+
+def test_throttled_request_gives_up_after_max_retries():
+    request = MagicMock(side_effect=_api_exception(429))
+    sleeps = []
+    throttled = ThrottledRequest(request, TokenBucket(qps=0, burst=1), max_retries=2, sleep=sleeps.append)
+
+    with pytest.raises(ApiException) as exc_info:
+        throttled("PATCH", "/api/v1/nodes/n1")
+    assert exc_info.value.status == 429
+    assert request.call_count == 3
+    assert len(sleeps) == 2
+
+
+def test_backoff_delay_is_exponential_and_capped():
+    e = _api_exception(429)
+    assert 0.25 <= backoff_delay(e, 0) <= 0.5
+    assert 2.0 <= backoff_delay(e, 3) <= 4.0
+    assert backoff_delay(e, 20, max_backoff=30) <= 30
+    assert backoff_delay(_api_exception(429, "120"), 0, max_backoff=30) == 30